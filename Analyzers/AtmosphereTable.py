@@ -0,0 +1,196 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Interpolated lookup table for the COESA 1976 standard atmosphere"""
+
+__title__ = "FreeCAD Atmosphere Table"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import tempfile
+from functools import lru_cache
+
+import numpy as np
+
+import FreeCAD
+
+from Analyzers.pyatmos import coesa76
+from Analyzers.pyatmos.utils.Const import R0, gamma, R_air
+from Analyzers.pyatmos.utils.utils import scalar_pow
+
+# Geometric altitude range of the table in km. This is the valid range of the COESA 1976
+# model, altitudes outside it are evaluated with the model directly
+ALTITUDE_MIN = -0.611
+ALTITUDE_MAX = 1000.0
+
+# Spacing of the table in km
+ALTITUDE_STEP = 0.05
+
+# Maximum relative error of any interpolated property compared with the model. The largest
+# errors are in the temperature just below 110 km, where the COESA temperature curve is steepest
+MAX_RELATIVE_ERROR = 1e-5
+
+# Changing the version forces cached tables to be rebuilt
+TABLE_VERSION = 1
+
+# Geometric altitudes in km where the model changes from one formula to another. The temperature
+# and the density and pressure approximations may have a slope change or a step at these
+COESA_BASES = [86.0, 91.0, 100.0, 110.0, 120.0, 150.0, 200.0, 300.0, 500.0, 750.0]
+USSA_LAYERS = [11.0, 20.0, 32.0, 47.0, 51.0, 71.0] # Geopotential altitudes
+
+# Columns of the table
+DENSITY = 0
+TEMPERATURE = 1
+PRESSURE = 2
+SPEED_OF_SOUND = 3
+VISCOSITY = 4
+
+# Density and pressure fall exponentially and are interpolated linearly in their logarithm
+_LOGARITHMIC = [DENSITY, PRESSURE]
+
+def defaultTablePath():
+    return os.path.join(FreeCAD.getUserAppDataDir(), "Mod", "Rocket", "Analyzers", "pyatmos", "data", "atmosphere_table.npz")
+
+def _tableAltitudes():
+    altitudes = np.arange(ALTITUDE_MIN, ALTITUDE_MAX, ALTITUDE_STEP)
+
+    # Sample either side of every break so no interval spans a change of formula
+    breaks = np.array(COESA_BASES + [h * R0 / (R0 - h) for h in USSA_LAYERS])
+    breaks = np.concatenate([breaks, np.nextafter(breaks, -np.inf), np.nextafter(breaks, np.inf)])
+
+    return np.unique(np.concatenate([altitudes, breaks, [ALTITUDE_MAX]]))
+
+def evaluateModel(altitude):
+    """
+        Evaluate the COESA 1976 model at geometric altitudes in km, returning an array with one
+        row for each of density, temperature, pressure, speed of sound and viscosity
+    """
+    atmo = coesa76(altitude)
+    temperature = atmo.T
+
+    speedOfSound = np.sqrt(gamma * R_air * temperature)
+
+    # dynamic viscosity by Sutherland's law
+    viscosity = 1.458e-6 * scalar_pow(temperature, 1.5) / (temperature + 110.4)
+
+    return np.array([atmo.rho, temperature, atmo.P, speedOfSound, viscosity])
+
+class AtmosphereTable:
+    """
+        Standard atmosphere properties interpolated from a precomputed table. This is much faster
+        than evaluating the model, to within MAX_RELATIVE_ERROR. The table is cached to disk and
+        rebuilt if it's missing or out of date.
+
+        Altitudes are geometric altitudes in km. Arrays return arrays, scalars return floats.
+    """
+
+    def __init__(self, path=None):
+        if path is None:
+            path = defaultTablePath()
+        self._path = path
+
+        self._altitudes, self._values = self._loadTable()
+        if self._altitudes is None:
+            self._altitudes = _tableAltitudes()
+            self._values = evaluateModel(self._altitudes)
+            self._saveTable()
+
+        # Interpolate the logarithm of exponential properties
+        self._values = self._values.copy()
+        self._values[_LOGARITHMIC] = np.log(self._values[_LOGARITHMIC])
+        self._slopes = np.diff(self._values, axis=1)
+
+    def _tableKey(self):
+        return np.array([TABLE_VERSION, ALTITUDE_MIN, ALTITUDE_MAX, ALTITUDE_STEP])
+
+    def _loadTable(self):
+        try:
+            with np.load(self._path) as data:
+                if np.array_equal(data["key"], self._tableKey()):
+                    return data["altitudes"], data["values"]
+        except (OSError, KeyError, ValueError):
+            pass
+        return None, None
+
+    def _saveTable(self):
+        # Write to a temporary file first so other processes never read a partial table
+        try:
+            directory = os.path.dirname(self._path)
+            handle, tempPath = tempfile.mkstemp(suffix=".npz", dir=directory)
+            try:
+                with os.fdopen(handle, "wb") as tableFile:
+                    np.savez(tableFile, key=self._tableKey(), altitudes=self._altitudes, values=self._values)
+                os.replace(tempPath, self._path)
+            except Exception:
+                os.remove(tempPath)
+                raise
+        except OSError as ex:
+            # The table still works without the cache
+            FreeCAD.Console.PrintWarning("Unable to save the atmosphere table '{}': {}\n".format(self._path, ex))
+
+    def _lookup(self, altitude, columns):
+        altitude = np.asarray(altitude, dtype=float)
+        z = np.atleast_1d(altitude)
+
+        # Interval (altitudes[i - 1], altitudes[i]] containing each altitude
+        i = np.clip(np.searchsorted(self._altitudes, z, side='left'), 1, len(self._altitudes) - 1) - 1
+        t = (z - self._altitudes[i]) / (self._altitudes[i + 1] - self._altitudes[i])
+
+        values = self._values[columns][:, i] + t * self._slopes[columns][:, i]
+        for row, column in enumerate(columns):
+            if column in _LOGARITHMIC:
+                values[row] = np.exp(values[row])
+
+        # Use the model directly outside the table
+        outside = ~((z >= ALTITUDE_MIN) & (z <= ALTITUDE_MAX))
+        if outside.any():
+            values[:, outside] = evaluateModel(z[outside])[columns]
+
+        return [value.reshape(altitude.shape)[()] for value in values]
+
+    def conditions(self, altitude):
+        """ Returns the density, temperature, pressure, speed of sound and viscosity """
+        return tuple(self._lookup(altitude, [DENSITY, TEMPERATURE, PRESSURE, SPEED_OF_SOUND, VISCOSITY]))
+
+    def density(self, altitude):
+        """ Density in kg/m^3 """
+        return self._lookup(altitude, [DENSITY])[0]
+
+    def temperature(self, altitude):
+        """ Temperature in K """
+        return self._lookup(altitude, [TEMPERATURE])[0]
+
+    def pressure(self, altitude):
+        """ Pressure in Pa """
+        return self._lookup(altitude, [PRESSURE])[0]
+
+    def speedOfSound(self, altitude):
+        """ Speed of sound in m/s """
+        return self._lookup(altitude, [SPEED_OF_SOUND])[0]
+
+    def viscosity(self, altitude):
+        """ Dynamic viscosity in kg/m/s """
+        return self._lookup(altitude, [VISCOSITY])[0]
+
+@lru_cache(maxsize=None)
+def getAtmosphereTable():
+    """ The shared atmosphere table, loaded on first use """
+    return AtmosphereTable()
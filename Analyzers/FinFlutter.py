@@ -25,12 +25,13 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
 import math
+import numpy as np
 
 import FreeCAD
 translate = FreeCAD.Qt.translate
 
-from Analyzers.pyatmos import coesa76
-from Analyzers.pyatmos.utils.Const import p0, gamma, R_air
+from Analyzers.AtmosphereTable import getAtmosphereTable
+from Analyzers.pyatmos.utils.Const import p0
 
 from Rocket.Constants import FIN_TYPE_TRAPEZOID, FIN_TYPE_ELLIPSE, FIN_TYPE_SKETCH, FIN_TYPE_TRIANGLE, FIN_TYPE_TUBE
 
@@ -39,14 +40,15 @@ from Rocket.ShapeHandlers.FinTriangleShapeHandler import FinTriangleShapeHandler
 from Rocket.ShapeHandlers.FinEllipseShapeHandler import FinEllipseShapeHandler
 from Rocket.ShapeHandlers.FinTubeShapeHandler import FinTubeShapeHandler
 from Rocket.ShapeHandlers.FinSketchShapeHandler import FinSketchShapeHandler
+from Rocket.util.Quadrature import integrate
 
 class FinFlutter:
 
     def __init__(self, fin):
         self._fin = fin
 
-        # Create the fin shape without any extras such as TTW tabs, fin cans, etc
-        # From this we can get properties such as CG, Volume, etc...
+        # Use the analytic geometry of the fin without any extras such as TTW tabs, fin cans, etc
+        # From this we can get properties such as CG, Volume, etc... without drawing the shape
         handler = None
         if fin.FinType == FIN_TYPE_TRAPEZOID:
             handler = FinTrapezoidShapeHandler(fin)
@@ -58,39 +60,47 @@ class FinFlutter:
             handler = FinTubeShapeHandler(fin)
         elif fin.FinType == FIN_TYPE_SKETCH:
             handler = FinSketchShapeHandler(fin)
-        self._Shape = handler.finOnlyShape()
+        self._handler = handler
 
-        if fin.FinType == FIN_TYPE_ELLIPSE:
-            raise TypeError(translate('Rocket', "Elliptical fins are not supported at this time"))
-        elif fin.FinType == FIN_TYPE_TRIANGLE:
-            raise TypeError(translate('Rocket', "Triangular fins are not supported at this time"))
-        elif fin.FinType == FIN_TYPE_TUBE:
+        if fin.FinType == FIN_TYPE_TUBE:
+            # The flutter and divergence formulas are for flat plate fins
             raise TypeError(translate('Rocket', "Tube fins are not supported at this time"))
-        if fin.FinType == FIN_TYPE_ELLIPSE:
-            raise TypeError(translate('Rocket', "Elliptical fins are not supported at this time"))
-        elif fin.FinType == FIN_TYPE_TRAPEZOID:
-
-            # Convert from mm to m
-            self._tipChord = self._fromMM(fin.TipChord)
-            self._rootChord = self._fromMM(fin.RootChord)
-            if float(fin.RootThickness) != float(fin.TipThickness):
-                raise TypeError(translate('Rocket', "Tapered thickness fins are not supported at this time"))
-
-            self._span = self._fromMM(fin.Height)
-            self._area = (self._rootChord + self._tipChord) * self._span / 2.0
-            self._volume = float(self._Shape.Volume) * 1e-9 # mm^3 to m^3
-            self._thickness = self._volume / self._area
-
-            # This is experimental. It's veracity still needs to be confirmed
-            # cg = self._Shape.CenterOfGravity
-            # print("CG(%f, %fm %f)" % (cg.x, cg.y, cg.z))
-            # self._epsilon = math.fabs((0.75 * self._rootChord) - self._fromMM(cg.x)) / self._rootChord # Does this work for forward sweeps?
-            # print("epsilon %f" % (self._epsilon))
-
-            # self._epsilon = self._epsilon / 0.25 # NACA Eqn 18 already has an epsilon value of 0.25, so need to compensate
-        else:
+        if handler is None:
             raise TypeError(translate('Rocket', "Custom fins are not supported at this time"))
 
+        self._setPlanform(handler)
+
+        # This is experimental. It's veracity still needs to be confirmed
+        # cg = self._handler.finOnlyCentroid()
+        # print("CG(%f, %fm %f)" % (cg.x, cg.y, cg.z))
+        # self._epsilon = math.fabs((0.75 * self._rootChord) - self._fromMM(cg.x)) / self._rootChord # Does this work for forward sweeps?
+        # print("epsilon %f" % (self._epsilon))
+
+        # self._epsilon = self._epsilon / 0.25 # NACA Eqn 18 already has an epsilon value of 0.25, so need to compensate
+
+    def _setPlanform(self, handler):
+        #
+        # Planform properties are integrated numerically from the chord at each height, so any
+        # planform is handled without building a solid. Lengths are converted from mm to m
+        #
+        def chord(height):
+            fore, aft = handler._chordLimits(height)
+            return abs(aft - fore)
+
+        span = handler._planformHeight()
+        if span <= 0 or chord(0.0) <= 0:
+            raise TypeError(translate('Rocket', "The fin has no planform"))
+
+        self._span = self._fromMM(span)
+        self._rootChord = self._fromMM(chord(0.0))
+        self._tipChord = self._fromMM(chord(span))
+        self._area = float(handler.planformArea()) * 1e-6 # mm^2 to m^2
+        self._meanChord = integrate(lambda height: chord(height)**2, 0.0, span) * 1e-9 / self._area # Mean aerodynamic chord
+
+        # The average thickness accounts for tapered thickness and the cross section
+        self._volume = float(handler.finOnlyVolume()) * 1e-9 # mm^3 to m^3
+        self._thickness = self._volume / self._area
+
         self._aspectRatio = self._span**2 / self._area
         self._lambda = self._tipChord / self._rootChord
 
@@ -101,69 +111,105 @@ class FinFlutter:
         return young / (2.0 * (1.0 + poisson))
 
     def atmosphericConditions(self, altitude):
+        # Altitude may be a single value or an array of values in mm
 
         # Get the atmospheric conditions at the specified altitude (convert mm to km)
-        # Uses the coesa76 model which is an extension of US Standard Atmosphere 1976 model to work above 84K
-        atmo = coesa76([altitude / (1000.0 * 1000.0)])
-
-        temp = float(atmo.T[0])
-        pressure = float(atmo.P[0])
-
-        # speed of sound
-        mach = math.sqrt(gamma * R_air * temp)
+        # Uses the coesa76 model which is an extension of US Standard Atmosphere 1976 model to work above 84K,
+        # interpolated from a precomputed table
+        # The speed of sound is returned as mach
+        _, _, pressure, mach, _ = getAtmosphereTable().conditions(np.asarray(altitude, dtype=float) / (1000.0 * 1000.0))
 
         return mach,pressure
 
     def flutter(self, altitude, shear):
-        # Calculate fin flutter using the method outlined in NACA Technical Note 4197
+        a,pressure = self.atmosphericConditions(altitude)
+        return self._flutter(a, pressure, shear)
 
+    def flutterPOF(self, altitude, shear):
         a,pressure = self.atmosphericConditions(altitude)
+        return self._flutterPOF(a, pressure, shear)
 
-        shear *= 1000.0 # Convert from kPa to Pa
+    def divergence(self, altitude, shear):
+        a,pressure = self.atmosphericConditions(altitude)
+        return self._divergence(a, pressure, shear)
 
-        # The coefficient is adjusted for SI units
-        Vf = math.sqrt(shear / ((270964.068 * (self._aspectRatio**3)) / (pow(self._thickness / self._rootChord, 3) * (self._aspectRatio + 2)) * ((self._lambda + 1) / 2) * (pressure / p0)))
+    def velocities(self, altitude, shear):
+        # Flutter, Peak of Flight flutter, and divergence velocities with a single atmosphere lookup.
+        # Each is a (Mach, m/s) pair of arrays when altitude is an array
+        a,pressure = self.atmosphericConditions(altitude)
+        return self._flutter(a, pressure, shear), self._flutterPOF(a, pressure, shear), self._divergence(a, pressure, shear)
 
-        # This is experimental. Its validity is not yet confirmed
-        # Vfe = math.sqrt(shear / ((270964.068 * self._epsilon * (self._aspectRatio**3)) / (pow(self._thickness / self._rootChord, 3) * (self._aspectRatio + 2)) * ((self._lambda + 1) / 2) * (pressure / p0)))
-        # print("Vf %f" % (Vf))
-        # print("Vfe %f" % (Vfe))
+    def _flutter(self, a, pressure, shear):
+        return flutterNACA(a, pressure, shear, self._aspectRatio, self._thickness / self._rootChord, self._lambda)
 
-        # Flutter velocity in m/s
-        Vfa = a * Vf
+    def _flutterPOF(self, a, pressure, shear):
+        return flutterPOF(a, pressure, shear, self._aspectRatio, self._thickness / self._rootChord, self._lambda)
 
-        return Vf, Vfa
+    def _divergence(self, a, pressure, shear):
+        return divergenceNACA(a, pressure, shear, self._aspectRatio, self._rootChord, self._tipChord, self._thickness, self._span)
 
-    def flutterPOF(self, altitude, shear):
-        #
-        # Calculate flutter using the formula outlined in Peak of Flight issue 291
-        # There is some discussion that this may over estimate the flutter by a factor of sqrt(2) vs the NACA method
-        #
+    def nominalGeometry(self):
+        # Planform properties used by the flutter formulas, in m and m^2
+        return {
+            "rootChord" : self._rootChord,
+            "tipChord" : self._tipChord,
+            "span" : self._span,
+            "area" : self._area,
+            "meanChord" : self._meanChord,
+            "aspectRatio" : self._aspectRatio,
+            "taper" : self._lambda,
+            "thickness" : self._thickness,
+            "thicknessRatio" : self._thickness / self._rootChord
+        }
 
-        a,pressure = self.atmosphericConditions(altitude)
+#
+# The formulas take either single values or numpy arrays, which are broadcast together. Speed of sound
+# is in m/s, pressure in Pa, shear modulus in kPa and lengths in m. Each returns the velocity as (Mach, m/s)
+#
 
-        shear *= 1000.0 # Convert from kPa to Pa
+def flutterNACA(a, pressure, shear, aspectRatio, thicknessRatio, taper):
+    # Calculate fin flutter using the method outlined in NACA Technical Note 4197
 
-        # Flutter velocity in Mach
-        Vf = math.sqrt((shear * 2 * (self._aspectRatio + 2) * pow(self._thickness / self._rootChord, 3)) / (1.337 * pow(self._aspectRatio, 3) * pressure * (self._lambda + 1)))
+    shear = shear * 1000.0 # Convert from kPa to Pa
 
-        # Flutter velocity in m/s
-        Vfa = a * Vf
+    # The coefficient is adjusted for SI units
+    Vf = np.sqrt(shear / ((270964.068 * (aspectRatio**3)) / (thicknessRatio**3 * (aspectRatio + 2)) * ((taper + 1) / 2) * (pressure / p0)))
 
-        return Vf, Vfa
+    # This is experimental. Its validity is not yet confirmed
+    # Vfe = math.sqrt(shear / ((270964.068 * self._epsilon * (self._aspectRatio**3)) / (pow(self._thickness / self._rootChord, 3) * (self._aspectRatio + 2)) * ((self._lambda + 1) / 2) * (pressure / p0)))
+    # print("Vf %f" % (Vf))
+    # print("Vfe %f" % (Vfe))
 
-    def divergence(self, altitude, shear):
-        # Calculate fin divergence using the method outlined in NACA Technical Note 4197
+    # Flutter velocity in m/s
+    Vfa = a * Vf
 
-        a,pressure = self.atmosphericConditions(altitude)
+    return Vf, Vfa
+
+def flutterPOF(a, pressure, shear, aspectRatio, thicknessRatio, taper):
+    #
+    # Calculate flutter using the formula outlined in Peak of Flight issue 291
+    # There is some discussion that this may over estimate the flutter by a factor of sqrt(2) vs the NACA method
+    #
+
+    shear = shear * 1000.0 # Convert from kPa to Pa
+
+    # Flutter velocity in Mach
+    Vf = np.sqrt((shear * 2 * (aspectRatio + 2) * thicknessRatio**3) / (1.337 * aspectRatio**3 * pressure * (taper + 1)))
+
+    # Flutter velocity in m/s
+    Vfa = a * Vf
+
+    return Vf, Vfa
 
-        shear *= 1000.0 # Convert from kPa to Pa
+def divergenceNACA(a, pressure, shear, aspectRatio, rootChord, tipChord, thickness, span):
+    # Calculate fin divergence using the method outlined in NACA Technical Note 4197
 
-        # Divergent velocity in Mach
-        Vd = math.sqrt(shear / (((3.3 * pressure) / (1 + (2 / self._aspectRatio))) * ((self._rootChord + self._tipChord) / self._thickness**3) * (self._span**2)))
+    shear = shear * 1000.0 # Convert from kPa to Pa
 
-        # Divergent velocity in m/s
-        Vda = a * Vd
+    # Divergent velocity in Mach
+    Vd = np.sqrt(shear / (((3.3 * pressure) / (1 + (2 / aspectRatio))) * ((rootChord + tipChord) / thickness**3) * (span**2)))
 
-        return Vd, Vda
+    # Divergent velocity in m/s
+    Vda = a * Vd
 
+    return Vd, Vda
@@ -0,0 +1,145 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for Monte Carlo analysis of fin flutter margins"""
+
+__title__ = "FreeCAD Fin Flutter Monte Carlo Analyzer"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import numpy as np
+
+from Analyzers.FinFlutter import flutterNACA, divergenceNACA
+
+# Parameters varied between builds
+SHEAR = "shear"
+THICKNESS = "thickness"
+SPAN = "span"
+ROOT_CHORD = "rootChord"
+TIP_CHORD = "tipChord"
+PARAMETERS = [SHEAR, THICKNESS, SPAN, ROOT_CHORD, TIP_CHORD]
+
+# Default relative standard deviation of each parameter. Material cards only give nominal
+# values, so the spread of the material properties is an estimate
+DEFAULT_TOLERANCES = {
+    SHEAR : 0.10,
+    THICKNESS : 0.05,
+    SPAN : 0.01,
+    ROOT_CHORD : 0.01,
+    TIP_CHORD : 0.01
+}
+
+DEFAULT_SAMPLES = 2000
+
+# A fixed seed keeps the results steady while inputs are edited interactively
+DEFAULT_SEED = 1
+
+# Samples are limited to this many standard deviations so no dimension becomes negative
+SAMPLE_LIMIT = 3.0
+
+class FlutterMonteCarlo:
+    """
+        Flutter and divergence velocities for a population of fins whose shear modulus, thickness
+        and planform vary normally about the nominal fin. Every sample is evaluated at every
+        altitude at once with numpy arrays of shape (samples, altitudes).
+
+        Altitudes are in mm and the shear modulus in kPa, as for FinFlutter. Velocities are in m/s.
+    """
+
+    def __init__(self, flutter, shear, tolerances=None, samples=DEFAULT_SAMPLES, seed=DEFAULT_SEED):
+        self._flutter = flutter
+        self._shear = shear
+
+        self._tolerances = dict(DEFAULT_TOLERANCES)
+        if tolerances is not None:
+            self._tolerances.update(tolerances)
+
+        # Relative variation of each parameter, one row per sample
+        rng = np.random.default_rng(seed)
+        self._factors = {}
+        for name in PARAMETERS:
+            deviation = np.clip(rng.standard_normal(samples), -SAMPLE_LIMIT, SAMPLE_LIMIT)
+            self._factors[name] = (1.0 + self._tolerances[name] * deviation)[:, np.newaxis]
+
+    def _geometry(self, factors):
+        nominal = self._flutter.nominalGeometry()
+
+        rootChord = nominal["rootChord"] * factors[ROOT_CHORD]
+        tipChord = nominal["tipChord"] * factors[TIP_CHORD]
+        span = nominal["span"] * factors[SPAN]
+        thickness = nominal["thickness"] * factors[THICKNESS]
+
+        # Scale the area by the change in mean chord and span so any planform is handled
+        chordScale = (rootChord + tipChord) / (nominal["rootChord"] + nominal["tipChord"])
+        area = nominal["area"] * chordScale * factors[SPAN]
+
+        return rootChord, tipChord, span, thickness, span**2 / area
+
+    def _velocities(self, altitude, factors):
+        a,pressure = self._flutter.atmosphericConditions(np.atleast_1d(altitude))
+        shear = self._shear * factors[SHEAR]
+        rootChord, tipChord, span, thickness, aspectRatio = self._geometry(factors)
+
+        _, flutter = flutterNACA(a, pressure, shear, aspectRatio, thickness / rootChord, tipChord / rootChord)
+        _, divergence = divergenceNACA(a, pressure, shear, aspectRatio, rootChord, tipChord, thickness, span)
+        return flutter, divergence
+
+    def flutterVelocities(self, altitude):
+        """ Flutter velocity of each sample at each altitude, with shape (samples, altitudes) """
+        return self._velocities(altitude, self._factors)[0]
+
+    def divergenceVelocities(self, altitude):
+        """ Divergence velocity of each sample at each altitude, with shape (samples, altitudes) """
+        return self._velocities(altitude, self._factors)[1]
+
+    def percentiles(self, altitude, percents=(5, 50, 95)):
+        """ Flutter velocity percentiles at each altitude, with one row for each percent """
+        return np.percentile(self.flutterVelocities(altitude), percents, axis=0)
+
+    def divergencePercentiles(self, altitude, percents=(5, 50, 95)):
+        """ Divergence velocity percentiles at each altitude, with one row for each percent """
+        return np.percentile(self.divergenceVelocities(altitude), percents, axis=0)
+
+    def marginProbability(self, altitude, velocity, margin=0.0):
+        """
+            Probability that the flutter velocity exceeds the flight velocity by at least the
+            safety margin, for each altitude. Velocity may be an array following a flight profile.
+        """
+        flutter = self.flutterVelocities(altitude)
+        required = np.atleast_1d(velocity) * (1.0 + margin)
+        return np.mean(flutter >= required, axis=0)
+
+    def sensitivities(self, altitude, deviations=1.0):
+        """
+            Tornado chart data for the flutter velocity at a single altitude. Each parameter in turn
+            is moved the given number of standard deviations below and above nominal, with the
+            others held at nominal. Returns (name, low, high) tuples, largest swing first.
+        """
+        nominal = {name : np.ones((1, 1)) for name in PARAMETERS}
+
+        results = []
+        for name in PARAMETERS:
+            factors = dict(nominal)
+            factors[name] = np.array([[1.0 - deviations * self._tolerances[name]], [1.0 + deviations * self._tolerances[name]]])
+            flutter = self._velocities(altitude, factors)[0]
+            results.append((name, float(flutter[0, 0]), float(flutter[1, 0])))
+
+        results.sort(key=lambda result: abs(result[2] - result[1]), reverse=True)
+        return results
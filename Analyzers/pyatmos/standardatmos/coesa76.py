@@ -7,14 +7,34 @@ Atmosphere(COESA 1976) agreed to extend it to 1000 km.
 
 import FreeCAD
 import numpy as np
+from functools import lru_cache
 # from pkg_resources import resource_filename
 
 from  .ussa76 import ussa76
 from ..utils import Const
-from ..utils.utils import alt_conver,check_altitude
+from ..utils.utils import alt_conver,check_altitude,scalar_pow
 
 from ..class_atmos import ATMOS
 
+@lru_cache(maxsize=None)
+def load_coeffs():
+    '''
+    Load the coefficients used to approximate density and pressure above 86km.
+    The file is read once per process and the arrays are shared by all later calls.
+
+    Usage:
+    [rho_coeffs, p_coeffs] = load_coeffs()
+    '''
+    # data_path = resource_filename('pyatmos', 'data/') - Modify to use FreeCAD path functions
+    data_path = FreeCAD.getUserAppDataDir() + "Mod/Rocket/Analyzers/pyatmos/data/"
+    with np.load(data_path+'coesa76_coeffs.npz') as data:
+        rho_coeffs,p_coeffs = data['rho'],data['p']
+
+    # The cached arrays are shared, so protect them from modification
+    rho_coeffs.flags.writeable = False
+    p_coeffs.flags.writeable = False
+    return rho_coeffs,p_coeffs
+
 def coesa76(alts, alt_type='geometric'):
     '''
     Implements the U.S. Committee on Extension to the Standard Atmosphere(COESA 1976).
@@ -41,52 +61,58 @@ def coesa76(alts, alt_type='geometric'):
     # Base altitude for the COESA 1976, [km].
     zb = np.array([86, 91, 100, 110, 120, 150, 200, 300, 500, 750, np.inf])
 
-    # load the coefficients used to approximate density and pressure above 86km 
-    # data_path = resource_filename('pyatmos', 'data/') - Modify to use FreeCAD path functions
-    data_path = FreeCAD.getUserAppDataDir() + "Mod/Rocket/Analyzers/pyatmos/data/"
-    data = np.load(data_path+'coesa76_coeffs.npz')
-    rho_coeffs,p_coeffs = data['rho'],data['p']
+    rho_coeffs,p_coeffs = load_coeffs()
 
     R0 = Const.R0 # volumetric radius for the Earth, [km] 
 
     # Get geometric and geopotential altitudes
     zs,hs = alt_conver(alts, alt_type)
+    zs,hs = np.atleast_1d(zs),np.atleast_1d(hs)
 
     # Test if altitudes are inside valid range
     check_altitude(zs,(-0.611,1e3),'warning')  
 
-    # inds = np.zeros_like(zs,dtype=int)
-    np.zeros_like(zs,dtype=int)
     rhos,Ts,Ps = np.zeros((3,len(zs)))
 
-    j = 0
-    for z,h in zip(zs,hs):
-
-        if z <= zb[0]: 
-            rho,T,P,Cs,eta,Kc = ussa76(h)
-        else:
-            if z > zb[0] and z <= zb[1]:
-                T = 186.8673
-            elif z > zb[1] and z <= zb[3]:
-                T = 263.1905 - 76.3232 * np.sqrt(1 - ((z - 91) / 19.9429) ** 2)
-            elif z > zb[3] and z <= zb[4]:
-                T = 240 + 12 * (z - 110)
-            else:
-                epsilon = (z - 120) * (R0 + 120) / (R0 + z)
-                T = 1e3 - 640 * np.exp(-0.01875 * epsilon)  
-
-            ind = np.where((z - zb) >= 0)[0][-1]
-
-            # A 4th order polynomial is used to approximate density and pressure.  
-            # This is directly taken from: http://www.braeunig.us/space/atmmodel.htm
-            poly_rho = np.poly1d(rho_coeffs[ind])
-            poly_p = np.poly1d(p_coeffs[ind])
-            rho = np.exp(poly_rho(z))
-            P = np.exp(poly_p(z))
-
-        rhos[j],Ts[j],Ps[j] = rho,T,P
-        j += 1    
-
-        info = {'rho':rhos,'T':Ts,'P':Ps}
+    # Below 86km the USSA 1976 applies
+    lower = zs <= zb[0]
+    if lower.any():
+        rhos[lower],Ts[lower],Ps[lower] = ussa76(hs[lower])[:3]
+
+    upper = ~lower
+    if upper.any():
+        z = zs[upper]
+        T = np.empty_like(z, dtype=float)
+
+        flags = (z > zb[0]) & (z <= zb[1])
+        T[flags] = 186.8673
+
+        flags = (z > zb[1]) & (z <= zb[3])
+        T[flags] = 263.1905 - 76.3232 * np.sqrt(1 - scalar_pow((z[flags] - 91) / 19.9429, 2))
+
+        flags = (z > zb[3]) & (z <= zb[4])
+        T[flags] = 240 + 12 * (z[flags] - 110)
+
+        flags = ~(z <= zb[4])
+        epsilon = (z[flags] - 120) * (R0 + 120) / (R0 + z[flags])
+        T[flags] = 1e3 - 640 * np.exp(-0.01875 * epsilon)  
+
+        # index of the last base altitude at or below each altitude
+        ind = np.searchsorted(zb, z, side='right') - 1
+
+        # A 4th order polynomial is used to approximate density and pressure.  
+        # This is directly taken from: http://www.braeunig.us/space/atmmodel.htm
+        # The polynomials are evaluated with Horner's method as np.poly1d does
+        rho_c,p_c = rho_coeffs[ind],p_coeffs[ind]
+        poly_rho = poly_p = np.zeros_like(z)
+        for k in range(rho_coeffs.shape[1]):
+            poly_rho = poly_rho * z + rho_c[:,k]
+            poly_p = poly_p * z + p_c[:,k]
+
+        rhos[upper] = np.exp(poly_rho)
+        Ts[upper] = T
+        Ps[upper] = np.exp(poly_p)
+
+    info = {'rho':rhos,'T':Ts,'P':Ps}
  
-    return ATMOS(info)             
\ No newline at end of file
+    return ATMOS(info)
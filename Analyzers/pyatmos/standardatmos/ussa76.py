@@ -7,6 +7,7 @@ activity.
 
 import numpy as np
 from ..utils import Const
+from ..utils.utils import scalar_pow
  
 def lapse_tp(t_lower, p_lower, lr, h_lower, h_upper):
     '''
@@ -23,7 +24,7 @@ def lapse_tp(t_lower, p_lower, lr, h_lower, h_upper):
     p_lower -> [float] pressure[Pa] at the lower boundary of the subset in the specific layer
     lr -> [float] lapse rate[K/m] for the specific layer
     h_lower -> [float] geopotential altitude[m] at the lower boundary of the subset in the specific layer
-    h_upper -> [float] geopotential altitude[m] at the upper boundary of the subset in the specific layer
+    h_upper -> [float/array] geopotential altitude[m] at the upper boundary of the subset in the specific layer
     
     Outputs:
     t1 -> [float] temperature[K] at the upper boundary of the subset in the specific layer
@@ -39,10 +40,42 @@ def lapse_tp(t_lower, p_lower, lr, h_lower, h_upper):
         p_upper = p_lower * np.exp(-g0 / R_air / t_lower * (h_upper - h_lower)*1e3)
     else:
         t_upper = t_lower + lr * (h_upper - h_lower)
-        p_upper = p_lower * (t_upper / t_lower) ** (-g0 / (lr/1e3) / R_air)
+        p_upper = p_lower * scalar_pow(t_upper / t_lower, -g0 / (lr/1e3) / R_air)
 
     return t_upper,p_upper
 
+def layer_bases():
+    '''
+    Integrate the lapse rates from sea level to find the geopotential altitude, temperature and pressure 
+    at the base of each layer of the USSA76.
+
+    Usage:
+    [h_bases, t_bases, p_bases] = layer_bases()
+
+    Outputs:
+    h_bases -> [float array] geopotential altitudes at the base of each layer, [km]
+    t_bases -> [float array] temperatures ..., [K]
+    p_bases -> [float array] pressures ..., [Pa]
+    '''
+    t_base,p_base,h_base = Const.T0,Const.p0,Const.h0
+    h_bases,t_bases,p_bases = [],[],[]
+    for i in range(len(lapse_rates)):
+        h_bases.append(h_base)
+        t_bases.append(t_base)
+        p_bases.append(p_base)
+        t_base,p_base = lapse_tp(t_base, p_base, lapse_rates[i], h_base, geopotential_alt[i+1])
+        h_base = geopotential_alt[i+1]
+
+    return np.array(h_bases,dtype=float),np.array(t_bases,dtype=float),np.array(p_bases,dtype=float)
+
+# the lower atmosphere below 86km is separated into seven layers 
+geopotential_alt = np.array([-np.inf, 11, 20, 32, 47, 51, 71, np.inf]) # Geopotential altitudes above MSL, [km]
+
+lapse_rates = np.array([-6.5, 0, 1, 2.8, 0, -2.8, -2]) # Lapse rate, [K/km]   
+
+# The layer bases only depend on the constants above, so they are computed once at import
+h_bases,t_bases,p_bases = layer_bases()
+
 def ussa76(h):
     '''
     Implements the U.S. Standard Atmosphere 1976(USSA76) up to 86km. 
@@ -54,15 +87,15 @@ def ussa76(h):
     [rho, T, P, C, eta, Kc] = ussa76(h)
 
     Inputs:
-    h -> [float] geopotentail altitude, [km]
+    h -> [float/array] geopotentail altitude, [km]
 
     Outputs:
-    rho -> [float] density at a given altitude, [kg/m^3]
-    T -> [float] temperature ..., [K]
-    P -> [float] pressure ..., [Pa]
-    C -> [float] speed of sound ..., [m/s]
-    eta -> [float] dynamic viscosity ..., [kg/m/s]
-    Kc -> [float] thermal conductivity ..., [J/(m*s*K)]
+    rho -> [float/array] density at a given altitude, [kg/m^3]
+    T -> [float/array] temperature ..., [K]
+    P -> [float/array] pressure ..., [Pa]
+    C -> [float/array] speed of sound ..., [m/s]
+    eta -> [float/array] dynamic viscosity ..., [kg/m/s]
+    Kc -> [float/array] thermal conductivity ..., [J/(m*s*K)]
     
     Note: the geometric altitude should be in [-0.611,86] km, otherwise the output will be extrapolated for those input altitudes.
 
@@ -73,22 +106,26 @@ def ussa76(h):
         https://ww2.mathworks.cn/help/aerotbx/ug/atmosisa.
         http://www.braeunig.us/space/atmmodel.htm#USSA1976
     '''
-    T0,p0,h0 = Const.T0,Const.p0,Const.h0
-    R_air,M0,gamma = Const.R_air,Const.M0,Const.gamma
+    R_air,g0,gamma = Const.R_air,Const.g0,Const.gamma
+
+    h = np.asarray(h)
+    shape = h.shape
+    h = np.atleast_1d(h)
 
-    # the lower atmosphere below 86km is separated into seven layers 
-    geopotential_alt = [-np.inf, 11, 20, 32, 47, 51, 71, np.inf] # Geopotential altitudes above MSL, [km]
+    # find the layer of each altitude; altitudes on a layer boundary belong to the lower layer
+    i = np.searchsorted(geopotential_alt[1:-1], h, side='left')
+    h_lower,t_lower,p_lower,lr = h_bases[i],t_bases[i],p_bases[i],lapse_rates[i]
 
-    lr = np.array([-6.5, 0, 1, 2.8, 0, -2.8, -2]) # Lapse rate, [K/km]   
+    # temperature and pressure above the base of each layer, as in lapse_tp
+    T = t_lower + lr * (h - h_lower)
+    P = np.empty_like(T)
 
-    for i in range(len(lr)):
-        if h <= geopotential_alt[i+1]:
-            T, P = lapse_tp(T0, p0, lr[i], h0, h)
-            break
-        else:
-            # if altitudes are greater than the first several layers, then it has to integeate these layers first.
-            T0, p0 = lapse_tp(T0, p0, lr[i], h0, geopotential_alt[i+1])
-            h0 = geopotential_alt[i+1]
+    flags = lr == 0
+    if flags.any():
+        P[flags] = p_lower[flags] * np.exp(-g0 / R_air / t_lower[flags] * (h[flags] - h_lower[flags])*1e3)
+    flags = ~flags
+    if flags.any():
+        P[flags] = p_lower[flags] * scalar_pow(T[flags] / t_lower[flags], -g0 / (lr[flags]/1e3) / R_air)
 
     # density
     rho = P / (R_air * T)
@@ -97,9 +134,11 @@ def ussa76(h):
     C = np.sqrt(gamma * R_air * T)
 
     # dynamic viscosity by Sutherland's law
-    eta = 1.458e-6*T**1.5/(T+110.4) 
+    T15 = scalar_pow(T, 1.5)
+    eta = 1.458e-6*T15/(T+110.4) 
 
     # thermal conductivity
-    Kc = 2.64638e-3 * T ** 1.5 / (T + 245.4 * (10 ** (-12.0 / T))) 
+    Kc = 2.64638e-3 * T15 / (T + 245.4 * scalar_pow(10, -12.0 / T)) 
 
-    return rho,T,P,C,eta,Kc
\ No newline at end of file
+    # Return scalars for a single altitude
+    return tuple(x.reshape(shape)[()] for x in (rho,T,P,C,eta,Kc))
\ No newline at end of file
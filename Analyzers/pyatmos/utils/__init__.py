@@ -14,4 +14,5 @@ utils.py
     hms_conver - Convert the form of hour/minute/second to hours and seconds.
     alt_conver - Fulfill conversions between geometric altitudes and geopotential altitudes. 
     check_altitude - Checks if altitudes are inside a valid range.
+    scalar_pow - Element wise power matching numpy scalar arithmetic bit for bit.
 '''
\ No newline at end of file
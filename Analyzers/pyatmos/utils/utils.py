@@ -1,3 +1,4 @@
+import math
 import numpy as np
 import warnings
 from . import Const
@@ -130,4 +131,32 @@ def check_altitude(zs,z_range,mode):
         if mode == 'warning':
             warnings.warn(msg_warning)
         elif mode == 'error':
-            raise Exception(msg_error)
\ No newline at end of file
+            raise Exception(msg_error)
+
+_libm_pow = np.frompyfunc(math.pow, 2, 1)
+
+def scalar_pow(base, exponent):
+    '''
+    Raise base to exponent element by element using the C library pow, the same routine used for numpy scalars.
+    The SIMD power loops numpy uses for arrays may differ from it in the last bit, so this keeps vectorized 
+    results identical to evaluating each altitude on its own.
+
+    Usage:
+    y = scalar_pow(base, exponent)
+
+    Inputs:
+    base -> [float/array] base
+    exponent -> [float/array] exponent
+
+    Outputs:
+    y -> [float array] base ** exponent
+    '''
+    base,exponent = np.broadcast_arrays(np.asarray(base,dtype=float),np.asarray(exponent,dtype=float))
+
+    # numpy handles the domain errors and overflows, returning nan or inf as scalars would
+    with np.errstate(invalid='ignore',over='ignore',divide='ignore'):
+        y = np.asarray(np.power(base,exponent))
+    flags = (base > 0) & np.isfinite(y)
+    if flags.any():
+        y[flags] = _libm_pow(base[flags],exponent[flags])
+    return y
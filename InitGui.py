@@ -100,7 +100,7 @@ class RocketWorkbench ( Workbench ):
                         #'Rocket_Parachute'
                         ])
         self.appendMenu(translate('Rocket', 'Rocket'),
-                        ['Separator'])
+                        ['Separator', 'Rocket_PreviewDetail', 'Rocket_ParallelRecompute', 'Separator'])
         self.appendMenu([translate("Rocket", "Rocket"),
                          translate("Rocket", "Calculators")],
                         ['Rocket_CalcBlackPowder', 'Rocket_CalcParachute', 'Rocket_CalcThrustToWeight', 'Rocket_CalcVentHoles'])
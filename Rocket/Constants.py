@@ -131,6 +131,10 @@ FIN_DEBUG_MASK_ONLY = "Mask"
 FIN_EDGE_SQUARE = "Square"
 FIN_EDGE_ROUNDED = "Rounded"
 
+# Level of detail used when rebuilding shapes during interactive edits
+LOD_FULL = "Full"
+LOD_PREVIEW = "Preview"
+
 # Part material types
 MATERIAL_TYPE_BULK = "BULK"
 MATERIAL_TYPE_SURFACE = "SURFACE"
@@ -25,6 +25,7 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
 from typing import Any
+import math
 
 import FreeCAD
 import Part
@@ -33,10 +34,12 @@ from Rocket.interfaces.BoxBounded import BoxBounded
 from Rocket.interfaces.Coaxial import Coaxial
 
 from Rocket.SymmetricComponent import SymmetricComponent
+from Rocket.util.Coordinate import Coordinate
 from Rocket.Constants import FEATURE_BODY_TUBE, FEATURE_INNER_TUBE, FEATURE_TUBE_COUPLER, FEATURE_ENGINE_BLOCK, FEATURE_BULKHEAD, FEATURE_CENTERING_RING, FEATURE_FIN, \
     FEATURE_FINCAN, FEATURE_LAUNCH_LUG, FEATURE_PARALLEL_STAGE, FEATURE_POD, FEATURE_RAIL_BUTTON, FEATURE_RAIL_GUIDE
 
 from Rocket.ShapeHandlers.BodyTubeShapeHandler import BodyTubeShapeHandler
+from Rocket.ParallelRecompute import drawShape
 from Rocket.Utilities import _wrn
 
 translate = FreeCAD.Qt.translate
@@ -155,6 +158,17 @@ class FeatureBodyTube(SymmetricComponent, BoxBounded, Coaxial):
     def setInnerDiameter(self, diameter : float) -> None:
         self.setThickness((self._obj.Diameter - diameter) / 2.0)
 
+    """
+        A body tube has a constant cross section so the geometry has a closed form.
+    """
+    def getComponentVolume(self) -> float:
+        return self.getCrossSectionArea(0) * self.getLength()
+
+    def getComponentSurfaceArea(self) -> float:
+        return 2.0 * math.pi * self.getOuterRadius(0) * self.getLength()
+
+    def getComponentCentroid(self) -> Coordinate:
+        return Coordinate(self.getLength() / 2.0, 0, 0)
 
     """
         Returns whether the radius is selected automatically or not.
@@ -276,15 +290,12 @@ class FeatureBodyTube(SymmetricComponent, BoxBounded, Coaxial):
     def execute(self, obj : Any) -> None:
         shape = BodyTubeShapeHandler(obj)
         if shape:
-            shape.draw()
+            self.getSolidShapeCache().update(shape)
+            drawShape(shape)
 
     def getSolidShape(self, obj : Any) -> Part.Solid:
         """ Return a filled version of the shape. Useful for CFD """
-        shape = BodyTubeShapeHandler(obj)
-        if shape:
-            x = shape.drawSolidShape()
-            return shape.drawSolidShape()
-        return None
+        return self.getSolidShapeCache().getSolid(obj, BodyTubeShapeHandler)
 
     def eligibleChild(self, childType : str) -> bool:
         return childType in [
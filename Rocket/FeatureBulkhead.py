@@ -25,6 +25,7 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
 from typing import Any
+import math
 
 import FreeCAD
 
@@ -34,6 +35,7 @@ from Rocket.RadiusRingComponent import RadiusRingComponent
 from Rocket.Constants import FEATURE_BULKHEAD
 
 from Rocket.ShapeHandlers.BulkheadShapeHandler import BulkheadShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 class FeatureBulkhead(RadiusRingComponent):
 
@@ -85,7 +87,31 @@ class FeatureBulkhead(RadiusRingComponent):
     def setLength(self, length : float) -> None:
         self._obj.Thickness = length
 
+    def _bodyInnerRadius(self) -> float:
+        # Bulkheads are solid
+        return 0.0
+
+    def getComponentVolume(self) -> float:
+        # Closed form for the body and step, less any holes
+        diameterScale = self.getDiameterScale()
+        outer = self.getOuterRadius(0)
+        inner = min(self._bodyInnerRadius(), outer)
+        thickness = self.getLength()
+        volume = math.pi * (outer * outer - inner * inner) * thickness
+
+        if self._obj.Step:
+            stepRadius = max(float(self._obj.StepDiameter) / (2.0 * diameterScale), inner)
+            stepThickness = float(self._obj.StepThickness) / self.getScale()
+            volume += math.pi * (stepRadius * stepRadius - inner * inner) * stepThickness
+            thickness += stepThickness
+
+        if self._obj.Holes:
+            holeRadius = float(self._obj.HoleDiameter) / (2.0 * diameterScale)
+            volume -= int(self._obj.HoleCount) * math.pi * holeRadius * holeRadius * thickness
+
+        return max(volume, 0.0) * len(self.getInstanceOffsets())
+
     def execute(self, obj : Any) -> None:
         shape = BulkheadShapeHandler(obj)
         if shape:
-            shape.draw()
+            drawShape(shape)
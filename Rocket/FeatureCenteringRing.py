@@ -36,6 +36,7 @@ from Rocket.util.Coordinate import Coordinate, NUL
 from Rocket.Constants import FEATURE_CENTERING_RING
 
 from Rocket.ShapeHandlers.CenteringRingShapeHandler import CenteringRingShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 #
 # Centering rings are an extension of bulkheads
@@ -76,6 +77,9 @@ class FeatureCenteringRing(FeatureBulkhead):
         # Ensure any automatic variables are set
         self.getInnerDiameter(0)
 
+    def _bodyInnerRadius(self) -> float:
+        return self.getInnerRadius(0)
+
     def getInnerRadius(self, pos : float) -> float:
         return self.getInnerDiameter(pos) / 2.0
 
@@ -105,4 +109,4 @@ class FeatureCenteringRing(FeatureBulkhead):
     def execute(self, obj : Any) -> None:
         shape = CenteringRingShapeHandler(obj)
         if shape:
-            shape.draw()
+            drawShape(shape)
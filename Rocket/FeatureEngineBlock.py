@@ -31,6 +31,7 @@ from Rocket.position.AxialMethod import TOP
 
 from Rocket.ThicknessRingComponent import ThicknessRingComponent
 from Rocket.ShapeHandlers.BodyTubeShapeHandler import BodyTubeShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 from Rocket.Constants import FEATURE_ENGINE_BLOCK
 from Rocket.Constants import LOCATION_PARENT_TOP
@@ -62,7 +63,7 @@ class FeatureEngineBlock(ThicknessRingComponent, AxialPositionable):
     def execute(self, obj : Any) -> None:
         shape = BodyTubeShapeHandler(obj)
         if shape:
-            shape.draw()
+            drawShape(shape)
 
     def isAfter(self) -> bool:
         return False
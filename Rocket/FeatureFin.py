@@ -42,7 +42,7 @@ from Rocket.Constants import FIN_TYPE_TRAPEZOID, FIN_TYPE_TRIANGLE, FIN_TYPE_ELL
 from Rocket.Constants import FIN_CROSS_SAME, FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, \
     FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE, FIN_CROSS_ELLIPSE, FIN_CROSS_BICONVEX
 from Rocket.Constants import FIN_DEBUG_FULL, FIN_DEBUG_PROFILE_ONLY, FIN_DEBUG_MASK_ONLY
-from Rocket.Constants import PROP_TRANSIENT, PROP_HIDDEN
+from Rocket.Constants import PROP_TRANSIENT, PROP_HIDDEN, PROP_READONLY, PROP_OUTPUT
 
 from Rocket.ShapeHandlers.FinTrapezoidShapeHandler import FinTrapezoidShapeHandler
 from Rocket.ShapeHandlers.FinTriangleShapeHandler import FinTriangleShapeHandler
@@ -170,6 +170,13 @@ class FeatureFin(ExternalComponent):
         if not hasattr(obj,"MinimumEdgeSize"):
             obj.addProperty('App::PropertyLength', 'MinimumEdgeSize', 'RocketComponent', translate('App::Property', 'Minimum edge size')).MinimumEdgeSize = 0.2
 
+        if not hasattr(obj, 'AdaptiveResolution'):
+            obj.addProperty('App::PropertyBool', 'AdaptiveResolution', 'RocketComponent', translate('App::Property', 'Fit curved profiles to the resolution tolerance instead of using a fixed resolution')).AdaptiveResolution = False
+        if not hasattr(obj, 'ResolutionTolerance'):
+            obj.addProperty('App::PropertyLength', 'ResolutionTolerance', 'RocketComponent', translate('App::Property', 'Maximum deviation from the true profile when using adaptive resolution')).ResolutionTolerance = 0.01
+        if not hasattr(obj, 'PoleCount'):
+            obj.addProperty('App::PropertyInteger', 'PoleCount', 'RocketComponent', translate('App::Property', 'Number of spline poles used by the last recompute'), PROP_READONLY | PROP_OUTPUT).PoleCount = 0
+
         # Hidden properties used for calculation
         if not hasattr(obj,"ParentRadius"):
             obj.addProperty('App::PropertyLength', 'ParentRadius', 'RocketComponent', 'Parent radius', PROP_TRANSIENT | PROP_HIDDEN).ParentRadius = 20.0 # No translation required for a hidden parameter
@@ -357,6 +364,55 @@ class FeatureFin(ExternalComponent):
         self._obj.FinCount = count
         self.notifyComponentChanged()
 
+    def _getAnalyticHandler(self) -> Any:
+        # A new handler reads the current properties. No shape is drawn
+        self._setShapeHandler()
+        if hasattr(self._shapeHandler, "finOnlyVolume"):
+            return self._shapeHandler
+        return None
+
+    def _getAnalyticFinCount(self) -> int:
+        if self.isFinSet():
+            return self.getFinCount()
+        return 1
+
+    """
+        Analytic geometry for the fins, calculated from the planform and chord profiles.
+        The surface area is the wetted area of both sides of every fin.
+    """
+    def getFinFrontalArea(self, bodyRadius : float = 0.0) -> float:
+        """
+            Frontal area of the fins at zero angle of attack. Only the part of the fins
+            outside the body radius is counted
+        """
+        handler = self._getAnalyticHandler()
+        if handler is None:
+            return 0.0
+        base = max(bodyRadius - float(self._obj.ParentRadius), 0.0)
+        return handler.finFrontalArea(base) * self._getAnalyticFinCount()
+
+    def getComponentVolume(self) -> float:
+        handler = self._getAnalyticHandler()
+        if handler is None:
+            return 0.0
+        return handler.finOnlyVolume() * self._getAnalyticFinCount()
+
+    def getComponentSurfaceArea(self) -> float:
+        handler = self._getAnalyticHandler()
+        if handler is None:
+            return 0.0
+        return 2.0 * handler.planformArea() * self._getAnalyticFinCount()
+
+    def getComponentCentroid(self) -> Coordinate:
+        handler = self._getAnalyticHandler()
+        if handler is None:
+            return super().getComponentCentroid()
+        centroid = handler.finOnlyCentroid()
+        if self._getAnalyticFinCount() > 1:
+            # Symmetric fin sets have their centroid on the axis
+            return Coordinate(centroid.x, 0, 0)
+        return Coordinate(centroid.x, centroid.y, centroid.z)
+
     def getRootChord(self) -> float:
         if self._obj.FinType == FIN_TYPE_SKETCH:
             if self._obj.RootChord <= 0 or self._obj.Length <= 0:
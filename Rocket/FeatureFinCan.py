@@ -30,6 +30,7 @@ import FreeCAD
 
 translate = FreeCAD.Qt.translate
 
+from Rocket.RocketComponent import RocketComponent
 from Rocket.SymmetricComponent import SymmetricComponent
 from Rocket.FeatureFin import FeatureFin
 from Rocket.Constants import FEATURE_FINCAN, FEATURE_LAUNCH_LUG, FEATURE_RAIL_BUTTON, FEATURE_RAIL_GUIDE, \
@@ -43,6 +44,8 @@ from Rocket.Constants import PROP_NONE
 from Rocket.Constants import EDITOR_NONE, EDITOR_HIDDEN
 
 from Rocket.position.AxialMethod import BOTTOM, AFTER
+from Rocket.util.Coordinate import Coordinate
+from Rocket.util.Quadrature import integrate
 
 from Rocket.ShapeHandlers.FinCanShapeHandler import FinCanTrapezoidShapeHandler
 from Rocket.ShapeHandlers.FinCanShapeHandler import FinCanTriangleShapeHandler
@@ -347,6 +350,27 @@ class FeatureFinCan(SymmetricComponent, FeatureFin):
     def getRadius(self, pos : float) -> float:
         return self.getForeRadius()
 
+    """
+        The fin can geometry is the can body plus the fins.
+    """
+    def getComponentVolume(self) -> float:
+        return SymmetricComponent.getComponentVolume(self) + FeatureFin.getComponentVolume(self)
+
+    def getComponentSurfaceArea(self) -> float:
+        return SymmetricComponent.getComponentSurfaceArea(self) + FeatureFin.getComponentSurfaceArea(self)
+
+    def getComponentCentroid(self) -> Coordinate:
+        bodyVolume = SymmetricComponent.getComponentVolume(self)
+        finVolume = FeatureFin.getComponentVolume(self)
+        volume = bodyVolume + finVolume
+        if volume <= 0.0:
+            return RocketComponent.getComponentCentroid(self)
+
+        # The fins are drawn from the fin leading edge, and the fin set is centered on the axis
+        bodyMoment = integrate(lambda pos: pos * self.getCrossSectionArea(pos), 0.0, self.getLength())
+        finX = FeatureFin.getComponentCentroid(self)._x + self.getLeadingEdgeOffset()
+        return Coordinate((bodyMoment + finX * finVolume) / volume, 0, 0)
+
     def getRearAutoDiameter(self) -> float:
         if self.isOuterDiameterAutomatic():
             # Search for next SymmetricComponent
@@ -41,6 +41,7 @@ from Rocket.util.BoundingBox import BoundingBox
 from Rocket.util.Coordinate import Coordinate, ZERO
 from Rocket.Utilities import reducePi
 from Rocket.ShapeHandlers.InnerTubeShapeHandler import InnerTubeShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 from Rocket.Constants import FEATURE_INNER_TUBE, FEATURE_TUBE_COUPLER, FEATURE_ENGINE_BLOCK, FEATURE_BULKHEAD, FEATURE_CENTERING_RING
 
@@ -82,14 +83,12 @@ class FeatureInnerTube(ThicknessRingComponent, Clusterable, AxialPositionable, B
     def execute(self, obj : Any) -> None:
         shape = InnerTubeShapeHandler(obj)
         if shape:
-            shape.draw()
+            self.getSolidShapeCache().update(shape)
+            drawShape(shape)
 
     def getSolidShape(self, obj : Any) -> Part.Solid:
         """ Return a filled version of the shape. Useful for CFD """
-        shape = InnerTubeShapeHandler(obj)
-        if shape:
-            return shape.drawSolidShape()
-        return None
+        return self.getSolidShapeCache().getSolid(obj, InnerTubeShapeHandler)
 
     def isAfter(self) -> bool:
         return False
@@ -44,6 +44,7 @@ from Rocket.util.Coordinate import Coordinate, NUL
 from Rocket import Utilities
 from Rocket.SymmetricComponent import SymmetricComponent
 from Rocket.ShapeHandlers.LaunchLugShapeHandler import LaunchLugShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 class FeatureLaunchLug(Tube, AnglePositionable, BoxBounded, LineInstanceable):
 
@@ -107,7 +108,7 @@ class FeatureLaunchLug(Tube, AnglePositionable, BoxBounded, LineInstanceable):
     def execute(self, obj : Any) -> None:
         shape = LaunchLugShapeHandler(obj)
         if shape:
-            shape.draw()
+            drawShape(shape)
 
     def eligibleChild(self, childType : str) -> bool:
         return False
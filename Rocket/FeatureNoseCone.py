@@ -44,12 +44,14 @@ from Rocket.ShapeHandlers.NoseParabolicShapeHandler import NoseParabolicShapeHan
 from Rocket.ShapeHandlers.NosePowerShapeHandler import NosePowerShapeHandler
 from Rocket.ShapeHandlers.NoseNikeSmokeShapeHandler import NoseNikeSmokeShapeHandler
 from Rocket.ShapeHandlers.NoseProxyShapeHandler import NoseProxyShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 from Rocket.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_SPHERICAL, TYPE_ELLIPTICAL, \
     TYPE_HAACK, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, TYPE_SECANT_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, \
     TYPE_PARABOLIC, TYPE_POWER, TYPE_NIKE_SMOKE, TYPE_PROXY
 from Rocket.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID
 from Rocket.Constants import STYLE_CAP_SOLID, STYLE_CAP_BAR, STYLE_CAP_CROSS
+from Rocket.Constants import PROP_READONLY, PROP_OUTPUT
 from Rocket.Constants import FEATURE_NOSE_CONE, FEATURE_TRANSITION, FEATURE_INNER_TUBE, \
     FEATURE_CENTERING_RING, FEATURE_FIN
 
@@ -86,6 +88,12 @@ class FeatureNoseCone(SymmetricComponent):
             obj.addProperty('App::PropertyLength', 'OgiveDiameter', 'RocketComponent', translate('App::Property', 'The radius of the circle used to define a secant ogive')).OgiveDiameter = 120.0
         if not hasattr(obj, 'Resolution'):
             obj.addProperty('App::PropertyInteger', 'Resolution', 'RocketComponent', translate('App::Property', 'Resolution')).Resolution = 100
+        if not hasattr(obj, 'AdaptiveResolution'):
+            obj.addProperty('App::PropertyBool', 'AdaptiveResolution', 'RocketComponent', translate('App::Property', 'Fit curved profiles to the resolution tolerance instead of using a fixed resolution')).AdaptiveResolution = False
+        if not hasattr(obj, 'ResolutionTolerance'):
+            obj.addProperty('App::PropertyLength', 'ResolutionTolerance', 'RocketComponent', translate('App::Property', 'Maximum deviation from the true profile when using adaptive resolution')).ResolutionTolerance = 0.01
+        if not hasattr(obj, 'PoleCount'):
+            obj.addProperty('App::PropertyInteger', 'PoleCount', 'RocketComponent', translate('App::Property', 'Number of spline poles used by the last recompute'), PROP_READONLY | PROP_OUTPUT).PoleCount = 0
 
         if not hasattr(obj, 'ProxyPlacement'):
             obj.addProperty('App::PropertyPlacement', 'ProxyPlacement', 'RocketComponent', translate('App::Property', 'This is the local coordinate system within the rocket object that will be used for the proxy feature')).ProxyPlacement
@@ -434,14 +442,16 @@ class FeatureNoseCone(SymmetricComponent):
     def execute(self, obj : Any) -> None:
         self._setShapeHandler()
         if self._shapeHandler:
-            self._shapeHandler.draw()
+            self.getSolidShapeCache().update(self._shapeHandler)
+            drawShape(self._shapeHandler)
+
+    def _makeShapeHandler(self, obj : Any) -> Any:
+        self._setShapeHandler()
+        return self._shapeHandler
 
     def getSolidShape(self, obj : Any) -> Part.Solid:
         """ Return a filled version of the shape. Useful for CFD """
-        self._setShapeHandler()
-        if self._shapeHandler:
-            return self._shapeHandler.drawSolidShape()
-        return None
+        return self.getSolidShapeCache().getSolid(obj, self._makeShapeHandler)
 
     def eligibleChild(self, childType : str) -> bool:
         return childType in [
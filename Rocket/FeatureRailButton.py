@@ -49,6 +49,7 @@ from Rocket.Constants import COUNTERSINK_ANGLE_60, COUNTERSINK_ANGLE_82, COUNTER
 
 
 from Rocket.ShapeHandlers.RailButtonShapeHandler import RailButtonShapeHandler
+from Rocket.ParallelRecompute import drawShape
 from Rocket.Utilities import _wrn
 
 #
@@ -173,7 +174,7 @@ class FeatureRailButton(ExternalComponent, AnglePositionable, BoxBounded, LineIn
     def execute(self, obj : Any) -> None:
         shape = RailButtonShapeHandler(obj)
         if shape:
-            shape.draw()
+            drawShape(shape)
 
     def getLength(self) -> float:
         # Return the length of this component along the central axis
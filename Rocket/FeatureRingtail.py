@@ -292,14 +292,12 @@ class FeatureRingtail(SymmetricComponent, BoxBounded, Coaxial):
     def execute(self, obj : Any) -> None:
         shape = RingtailShapeHandler(obj)
         if shape:
+            self.getSolidShapeCache().update(shape)
             shape.draw()
 
     def getSolidShape(self, obj : Any) -> Part.Solid:
         """ Return a filled version of the shape. Useful for CFD """
-        shape = RingtailShapeHandler(obj)
-        if shape:
-            return shape.drawSolidShape()
-        return None
+        return self.getSolidShapeCache().getSolid(obj, RingtailShapeHandler)
 
     """
         Returns whether the component is set as filled.  If it is set filled, then the
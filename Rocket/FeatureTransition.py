@@ -37,11 +37,13 @@ from Rocket.ShapeHandlers.TransitionOgiveShapeHandler import TransitionOgiveShap
 from Rocket.ShapeHandlers.TransitionParabolicShapeHandler import TransitionParabolicShapeHandler
 from Rocket.ShapeHandlers.TransitionPowerShapeHandler import TransitionPowerShapeHandler
 from Rocket.ShapeHandlers.TransitionProxyShapeHandler import TransitionProxyShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 from Rocket.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLA, \
     TYPE_PARABOLIC, TYPE_POWER, TYPE_PROXY
 from Rocket.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID, STYLE_SOLID_CORE
 from Rocket.Constants import STYLE_CAP_SOLID, STYLE_CAP_BAR, STYLE_CAP_CROSS
+from Rocket.Constants import PROP_READONLY, PROP_OUTPUT
 from Rocket.Constants import FEATURE_TRANSITION, FEATURE_CENTERING_RING, FEATURE_INNER_TUBE, FEATURE_FIN
 
 from Rocket.Utilities import _wrn
@@ -94,6 +96,12 @@ class FeatureTransition(SymmetricComponent):
             obj.addProperty('App::PropertyFloat', 'Coefficient', 'RocketComponent', translate('App::Property', 'Coefficient')).Coefficient = 0.0
         if not hasattr(obj, 'Resolution'):
             obj.addProperty('App::PropertyInteger', 'Resolution', 'RocketComponent', translate('App::Property', 'Resolution')).Resolution = 100
+        if not hasattr(obj, 'AdaptiveResolution'):
+            obj.addProperty('App::PropertyBool', 'AdaptiveResolution', 'RocketComponent', translate('App::Property', 'Fit curved profiles to the resolution tolerance instead of using a fixed resolution')).AdaptiveResolution = False
+        if not hasattr(obj, 'ResolutionTolerance'):
+            obj.addProperty('App::PropertyLength', 'ResolutionTolerance', 'RocketComponent', translate('App::Property', 'Maximum deviation from the true profile when using adaptive resolution')).ResolutionTolerance = 0.01
+        if not hasattr(obj, 'PoleCount'):
+            obj.addProperty('App::PropertyInteger', 'PoleCount', 'RocketComponent', translate('App::Property', 'Number of spline poles used by the last recompute'), PROP_READONLY | PROP_OUTPUT).PoleCount = 0
         if not hasattr(obj, 'ForeCapBarWidth'):
             obj.addProperty('App::PropertyLength', 'ForeCapBarWidth', 'RocketComponent', translate('App::Property', 'Width of the forward cap bar')).ForeCapBarWidth = 3.0
         if not hasattr(obj, 'AftCapBarWidth'):
@@ -419,7 +427,7 @@ class FeatureTransition(SymmetricComponent):
             return 0.0
         if self._obj.TransitionStyle == STYLE_SOLID_CORE:
             return self._obj.CoreDiameter
-        return max(self.getRadius(0) - float(self._obj.Thickness), 0)
+        return max(self.getRadius(pos) - float(self._obj.Thickness), 0)
 
     def getLength(self) -> float:
         # Return the length of this component along the central axis
@@ -456,7 +464,7 @@ class FeatureTransition(SymmetricComponent):
     def execute(self, obj : Any) -> None:
         self._setShapeHandler()
         if self._shapeHandler:
-            self._shapeHandler.draw()
+            drawShape(self._shapeHandler)
 
     def eligibleChild(self, childType : str) -> bool:
         return childType in [
@@ -30,6 +30,7 @@ from Rocket.interfaces.RadialParent import RadialParent
 
 from Rocket.ThicknessRingComponent import ThicknessRingComponent
 from Rocket.ShapeHandlers.BodyTubeShapeHandler import BodyTubeShapeHandler
+from Rocket.ParallelRecompute import drawShape
 
 from Rocket.Constants import FEATURE_INNER_TUBE, FEATURE_TUBE_COUPLER, FEATURE_ENGINE_BLOCK, FEATURE_BULKHEAD, FEATURE_CENTERING_RING
 
@@ -57,7 +58,7 @@ class FeatureTubeCoupler(ThicknessRingComponent, RadialParent):
     def execute(self, obj : Any) -> None:
         shape = BodyTubeShapeHandler(obj)
         if shape:
-            shape.draw()
+            drawShape(shape)
 
     def isAfter(self) -> bool:
         return False
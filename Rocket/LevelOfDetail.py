@@ -0,0 +1,79 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Per document level of detail used while editing"""
+
+__title__ = "FreeCAD Rocket Level of Detail"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from typing import Any
+
+from Rocket.Constants import LOD_FULL, LOD_PREVIEW
+
+# The level of detail is stored in the document meta data so it is saved with the document
+LOD_META_KEY = "RocketLevelOfDetail"
+
+# Resolution used for curved profiles when drawing previews
+PREVIEW_RESOLUTION = 20
+
+# Documents currently drawing preview shapes
+_previewDocuments = set()
+
+def getLevelOfDetail(doc : Any) -> str:
+    if doc is None:
+        return LOD_FULL
+    return doc.Meta.get(LOD_META_KEY, LOD_FULL)
+
+def setLevelOfDetail(doc : Any, level : str) -> None:
+    meta = doc.Meta
+    meta[LOD_META_KEY] = level
+    doc.Meta = meta
+
+def isPreviewEnabled(doc : Any) -> bool:
+    return getLevelOfDetail(doc) == LOD_PREVIEW
+
+def isPreview(obj : Any) -> bool:
+    """ True if the object should be drawn as a low detail preview """
+    doc = obj.Document
+    if doc is None:
+        return False
+    return doc.Name in _previewDocuments
+
+class PreviewBuild:
+    """
+        Context manager used while drawing shapes during interactive edits. Shapes drawn
+        within the context are preview shapes if the document has previews enabled.
+    """
+    def __init__(self, obj : Any) -> None:
+        self._doc = obj.Document
+        self._active = isPreviewEnabled(self._doc)
+
+    def isActive(self) -> bool:
+        return self._active
+
+    def __enter__(self) -> "PreviewBuild":
+        if self._active:
+            _previewDocuments.add(self._doc.Name)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._active:
+            _previewDocuments.discard(self._doc.Name)
@@ -0,0 +1,216 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Recompute rocket component shapes in worker processes"""
+
+__title__ = "FreeCAD Rocket Parallel Recompute"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from typing import Any
+import concurrent.futures
+import multiprocessing
+import os
+import pickle
+import sys
+
+import FreeCAD
+import Part
+
+import Rocket.Utilities
+from Rocket.Utilities import _err, pythonExecutable
+
+# Below this number of shapes the cost of sending work to the pool outweighs the benefit
+MIN_PARALLEL_SHAPES = 2
+
+# Documents currently collecting shape handlers instead of drawing them
+_deferredHandlers = {}
+
+_pool = None
+
+class _ShapeTarget:
+    """ Stands in for the document object when a handler draws in a worker process """
+    def __init__(self) -> None:
+        self.Shape = None
+        self.Placement = None
+        self.PoleCount = 0
+
+def _initWorker(path : list) -> None:
+    sys.path[:] = path
+
+    # Load the modules once per worker rather than once per shape
+    import FreeCAD
+    import Part
+
+def _drawRemote(payload : bytes) -> tuple[str | None, int, list]:
+    """ Draw the shape in a worker process, returning it as a BREP string """
+    handlerClass, state = pickle.loads(payload)
+    handler = handlerClass.__new__(handlerClass)
+    handler.__dict__.update(state)
+
+    target = _ShapeTarget()
+    handler._obj = target
+    handler._placement = None
+
+    Rocket.Utilities._errorLog = []
+    try:
+        handler.draw()
+    finally:
+        messages = Rocket.Utilities._errorLog
+        Rocket.Utilities._errorLog = None
+
+    brep = None
+    if target.Shape is not None:
+        brep = target.Shape.exportBrepToString()
+    return brep, int(target.PoleCount), messages
+
+def _getPool() -> concurrent.futures.ProcessPoolExecutor:
+    global _pool
+
+    if _pool is None:
+        context = multiprocessing.get_context("spawn")
+        context.set_executable(pythonExecutable())
+        workers = max(1, (os.cpu_count() or 2) - 1)
+        _pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                                       initializer=_initWorker, initargs=(list(sys.path),))
+    return _pool
+
+def _shutdownPool() -> None:
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+def _payload(handler : Any) -> bytes | None:
+    # The document object and placement stay on the main thread
+    state = dict(handler.__dict__)
+    state.pop("_obj", None)
+    state.pop("_placement", None)
+    try:
+        return pickle.dumps((type(handler), state))
+    except Exception:
+        return None
+
+def _assignShape(handler : Any, brep : str | None, poleCount : int) -> None:
+    obj = handler._obj
+    if brep is not None:
+        shape = Part.Shape()
+        shape.importBrepFromString(brep)
+        obj.Shape = shape
+        obj.Placement = handler._placement
+        if hasattr(obj, "PoleCount"):
+            obj.PoleCount = poleCount
+
+    # The shape is the result of the recompute that has just completed
+    obj.purgeTouched()
+
+def drawShape(handler : Any) -> None:
+    """
+        Draw the shape for a component. During a parallel recompute, handlers that can be
+        drawn in a worker process are collected and drawn once all inputs are resolved.
+    """
+    doc = handler._obj.Document
+    if doc is not None and doc.Name in _deferredHandlers and getattr(handler, "REMOTE_DRAW", False):
+        _deferredHandlers[doc.Name].append(handler)
+    else:
+        handler.draw()
+
+def drawHandlers(handlers : list) -> None:
+    """ Draw the shapes in worker processes and assign the results on the main thread """
+    remote = []
+    local = []
+    if len(handlers) >= MIN_PARALLEL_SHAPES:
+        for handler in handlers:
+            if not handler.isValidShape():
+                continue
+            payload = _payload(handler)
+            if payload is None:
+                local.append(handler)
+            else:
+                remote.append((handler, payload))
+    else:
+        local = handlers
+
+    if len(remote) > 0:
+        try:
+            pool = _getPool()
+            futures = [(handler, pool.submit(_drawRemote, payload)) for handler, payload in remote]
+        except (OSError, RuntimeError):
+            _shutdownPool()
+            futures = []
+            local.extend([handler for handler, payload in remote])
+
+        for handler, future in futures:
+            try:
+                brep, poleCount, messages = future.result()
+            except concurrent.futures.process.BrokenProcessPool:
+                _shutdownPool()
+                local.append(handler)
+                continue
+            except Exception:
+                # Redraw locally so the error is reported as it normally would be
+                local.append(handler)
+                continue
+
+            for message in messages:
+                _err(message)
+            _assignShape(handler, brep, poleCount)
+
+    for handler in local:
+        handler.draw()
+
+def _isComponent(obj : Any) -> bool:
+    # Import here to prevent circular imports
+    from Rocket.RocketComponentShapeless import RocketComponentShapeless
+
+    return isinstance(getattr(obj, "Proxy", None), RocketComponentShapeless)
+
+def _externalDependents(objects : list) -> list:
+    """ Objects outside the rocket, such as Part booleans or drawings, that use the shapes of the objects """
+    dependents = {}
+    for obj in objects:
+        for dependent in obj.InListRecursive:
+            if not _isComponent(dependent):
+                dependents[dependent.Name] = dependent
+    return list(dependents.values())
+
+def recompute(doc : Any) -> None:
+    """
+        Recompute the document, drawing independent component shapes in parallel.
+
+        The document is recomputed as normal to resolve the inputs for each component,
+        with the shape drawing deferred. The collected shapes are then drawn in worker
+        processes. Objects outside the rocket that use those shapes were recomputed
+        from the old shapes, so they are recomputed again.
+    """
+    _deferredHandlers[doc.Name] = []
+    try:
+        doc.recompute()
+    finally:
+        handlers = _deferredHandlers.pop(doc.Name)
+
+    drawHandlers(handlers)
+
+    dependents = _externalDependents([handler._obj for handler in handlers])
+    if len(dependents) > 0:
+        for dependent in dependents:
+            dependent.touch()
+        doc.recompute()
@@ -36,7 +36,7 @@ from Rocket.InternalComponent import InternalComponent
 from Rocket.interfaces.BoxBounded import BoxBounded
 from Rocket.interfaces.Coaxial import Coaxial
 
-from Rocket.Utilities import reducePi
+from Rocket.Utilities import reducePi, clamp
 from Rocket.util.BoundingBox import BoundingBox
 from Rocket.util.Coordinate import Coordinate
 
@@ -183,6 +183,29 @@ class RingComponent(InternalComponent, BoxBounded, Coaxial):
 
         return instanceBounds
 
+    """
+        Return the area of the ring in a cross section. Rings have a constant cross
+        section, so the geometry has a closed form.
+    """
+    def getCrossSectionArea(self, pos : float = 0) -> float:
+        outer = self.getOuterRadius(pos)
+        inner = clamp(self.getInnerRadius(pos), 0.0, outer)
+        return math.pi * (outer * outer - inner * inner)
+
+    def getComponentVolume(self) -> float:
+        return self.getCrossSectionArea(0) * self.getLength() * len(self.getInstanceOffsets())
+
+    def getComponentSurfaceArea(self) -> float:
+        return 2.0 * math.pi * self.getOuterRadius(0) * self.getLength() * len(self.getInstanceOffsets())
+
+    def getComponentCentroid(self) -> Coordinate:
+        offsets = self.getInstanceOffsets()
+        count = len(offsets)
+        x = sum(offset._x for offset in offsets) / count
+        y = sum(offset._y for offset in offsets) / count
+        z = sum(offset._z for offset in offsets) / count
+        return Coordinate(x + self.getLength() / 2.0, y, z)
+
     """
         Return the radial position of the component.  The position is the distance
         of the center of the component from the center of the parent component.
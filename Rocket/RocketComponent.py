@@ -38,6 +38,7 @@ from Rocket.Parts.Exceptions import MaterialNotFoundError
 
 from Rocket.util.Coordinate import Coordinate
 from Rocket.RocketComponentShapeless import RocketComponentShapeless
+from Rocket.ShapeHandlers.SolidShapeCache import SolidShapeCache
 
 from Rocket.Constants import LOCATION_PARENT_TOP, LOCATION_PARENT_MIDDLE, LOCATION_PARENT_BOTTOM, LOCATION_BASE
 from Rocket.Constants import MATERIAL_TYPE_BULK
@@ -139,6 +140,20 @@ class RocketComponent(RocketComponentShapeless):
         # Return the length of this component along the central axis
         return float(self._obj.Length) / self.getScale()
 
+    """
+        Analytic geometry calculated from the component parameters, without drawing the
+        shape. Volumes and areas include all instances of the component. The centroid is
+        relative to the component reference point.
+    """
+    def getComponentVolume(self) -> float:
+        return 0.0
+
+    def getComponentSurfaceArea(self) -> float:
+        return 0.0
+
+    def getComponentCentroid(self) -> Coordinate:
+        return Coordinate(self.getLength() / 2.0, 0, 0)
+
     def isMotorMount(self) -> bool:
         return False
 
@@ -271,6 +286,12 @@ class RocketComponent(RocketComponentShapeless):
             return obj.Shape
         return None
 
+    def getSolidShapeCache(self) -> SolidShapeCache:
+        # Not persistent, so it is created on first use after a document is restored
+        if not hasattr(self, "_solidShapeCache"):
+            self._solidShapeCache = SolidShapeCache()
+        return self._solidShapeCache
+
     def resetScale(self) -> None:
         super().resetScale()
 
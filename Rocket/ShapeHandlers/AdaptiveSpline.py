@@ -0,0 +1,150 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Tolerance driven spline fitting for curved profiles"""
+
+__title__ = "FreeCAD Adaptive Spline"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import Part
+
+# Number of points used to sample a profile before it is reduced to the tolerance
+ADAPTIVE_SAMPLES = 2000
+
+# Points closer than this are considered coincident
+POINT_PRECISION = 1e-7
+
+def _distanceToSegment(point : FreeCAD.Vector, start : FreeCAD.Vector, end : FreeCAD.Vector) -> float:
+    segment = end - start
+    length2 = segment.dot(segment)
+    if length2 <= 0.0:
+        return (point - start).Length
+
+    t = (point - start).dot(segment) / length2
+    if t <= 0.0:
+        return (point - start).Length
+    if t >= 1.0:
+        return (point - end).Length
+    return (point - (start + segment * t)).Length
+
+def _uniquePoints(points : list[FreeCAD.Vector]) -> list[FreeCAD.Vector]:
+    # Remove coincident points, which would cause the interpolation to fail
+    unique = []
+    for point in points:
+        if len(unique) == 0 or (point - unique[-1]).Length > POINT_PRECISION:
+            unique.append(point)
+    return unique
+
+def _simplify(points : list[FreeCAD.Vector], tolerance : float) -> list[bool]:
+    # Flags the points kept by the Ramer-Douglas-Peucker reduction
+    keep = [False] * len(points)
+    keep[0] = True
+    keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        maxDistance = 0.0
+        index = first
+        for i in range(first + 1, last):
+            distance = _distanceToSegment(points[i], points[first], points[last])
+            if distance > maxDistance:
+                maxDistance = distance
+                index = i
+        if maxDistance > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return keep
+
+def simplifyPoints(points : list[FreeCAD.Vector], tolerance : float) -> list[FreeCAD.Vector]:
+    """
+        Reduce a densely sampled profile to the points required to keep the maximum
+        chordal deviation below tolerance (Ramer-Douglas-Peucker). Points are retained
+        where the curve bends, so flat regions use few points and highly curved regions
+        such as nose tips keep many.
+    """
+    unique = _uniquePoints(points)
+    if len(unique) < 3:
+        return unique
+
+    return [point for point, kept in zip(unique, _simplify(unique, tolerance)) if kept]
+
+def _refine(spline : Part.BSplineCurve, points : list[FreeCAD.Vector], keep : list[bool], tolerance : float) -> bool:
+    """
+        Keep the sample furthest from the spline between each pair of kept points, where it is
+        further than the tolerance. Returns False when the spline is already within tolerance.
+    """
+    refined = False
+    first = 0
+    while first < len(points) - 1:
+        last = first + 1
+        while not keep[last]:
+            last += 1
+
+        maxDistance = tolerance
+        index = None
+        for i in range(first + 1, last):
+            distance = (spline.value(spline.parameter(points[i])) - points[i]).Length
+            if distance > maxDistance:
+                maxDistance = distance
+                index = i
+        if index is not None:
+            keep[index] = True
+            refined = True
+        first = last
+    return refined
+
+def sampleResolution(adaptive : bool, resolution : int) -> int:
+    """
+        The number of points to sample a profile with. Adaptive curves are sampled densely
+        then reduced to the tolerance by makeAdaptiveSpline.
+    """
+    if adaptive:
+        return ADAPTIVE_SAMPLES
+    return resolution
+
+def makeAdaptiveSpline(points : list[FreeCAD.Vector], tolerance : float) -> Part.BSplineCurve:
+    """
+        Create a spline passing through the reduced point set. Interpolation passes
+        through the sampled points, unlike building from poles which only approximates them.
+
+        The interpolated spline can swing away from the chords between the reduced points, so
+        it is checked against every sample and points are added back until it is within tolerance.
+    """
+    unique = _uniquePoints(points)
+    spline = Part.BSplineCurve()
+    if len(unique) < 3:
+        spline.buildFromPoles(unique)
+        return spline
+
+    keep = _simplify(unique, tolerance)
+    while True:
+        reduced = [point for point, kept in zip(unique, keep) if kept]
+        spline = Part.BSplineCurve()
+        if len(reduced) < 3:
+            # A straight line is within tolerance of every sample
+            spline.buildFromPoles(reduced)
+            return spline
+
+        spline.interpolate(reduced)
+        if not _refine(spline, unique, keep, tolerance):
+            return spline
@@ -30,10 +30,12 @@ import FreeCAD
 import Part
 
 from Rocket.Utilities import validationError, _err
+from Rocket.ShapeHandlers.ShapeHandlerBase import ShapeHandlerBase
 
 translate = FreeCAD.Qt.translate
 
-class BodyTubeShapeHandler():
+class BodyTubeShapeHandler(ShapeHandlerBase):
+    REMOTE_DRAW = True
 
     def __init__(self, obj : Any, scale : bool = True) -> None:
         self._obj = obj
@@ -30,11 +30,17 @@ import FreeCAD
 import Part
 import math
 
+from Rocket.ShapeHandlers.ShapeBooleans import multiCut
+from Rocket.ShapeHandlers.ShapeTemplates import getTemplate, placeInstances, linearPlacements
 from Rocket.Utilities import validationError, _err
+from Rocket.ShapeHandlers.ShapeHandlerBase import ShapeHandlerBase
 
 translate = FreeCAD.Qt.translate
 
-class BulkheadShapeHandler():
+class BulkheadShapeHandler(ShapeHandlerBase):
+    REMOTE_DRAW = True
+    SHAPE_TEMPLATE = True
+
     def __init__(self, obj : Any) -> None:
 
         # This gets changed when redrawn so it's very important to save a copy
@@ -90,7 +96,7 @@ class BulkheadShapeHandler():
 
         return True
 
-    def _drawBulkhead(self) -> Any:
+    def _drawBody(self) -> Any:
         bulkhead = Part.makeCylinder(self._diameter / 2.0, self._thickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0))
         if self._step:
             if self._stepReverse:
@@ -99,11 +105,19 @@ class BulkheadShapeHandler():
                 step = Part.makeCylinder(self._stepDiameter / 2.0, self._stepThickness, FreeCAD.Vector(-self._thickness,0,0), FreeCAD.Vector(1,0,0))
             bulkhead = bulkhead.fuse(step)
 
-        # Add any holes
+        return bulkhead
+
+    def _holeThickness(self) -> float:
+        thickness = self._thickness
+        if self._step:
+            thickness += self._stepDiameter
+        return thickness
+
+    def _makeHoles(self) -> list:
+        # Return the shapes to be cut from the body
+        holes = []
         if self._holes:
-            thickness = self._thickness
-            if self._step:
-                thickness += self._stepDiameter
+            thickness = self._holeThickness()
             for i in range(0, self._holeCount):
                 hole = Part.makeCylinder(self._holeDiameter / 2.0, thickness, FreeCAD.Vector(0,self._holeCenter,0), FreeCAD.Vector(1,0,0))
 
@@ -111,19 +125,17 @@ class BulkheadShapeHandler():
                 aTrsf=FreeCAD.Matrix()
                 aTrsf.rotateX(((i * 2.0 *math.pi) / self._holeCount) + math.radians(self._holeOffset) + math.pi/2.0)
                 hole.transformShape(aTrsf)
-                bulkhead = bulkhead.cut(hole)
+                holes.append(hole)
 
-        return bulkhead
+        return holes
+
+    def _drawBulkhead(self) -> Any:
+        # Cut all the holes in a single operation
+        return multiCut(self._drawBody(), self._makeHoles())
 
     def drawInstances(self) -> Any:
-        bulkheads = []
-        base = self._drawBulkhead()
-        for i in range(self._instanceCount):
-            bulkhead = Part.Shape(base) # Create a copy
-            bulkhead.translate(FreeCAD.Vector(i * (self._thickness + self._separation),0,0))
-            bulkheads.append(bulkhead)
-
-        return Part.makeCompound(bulkheads)
+        base = getTemplate(self, self._drawBulkhead)
+        return placeInstances(base, linearPlacements(self._instanceCount, self._thickness + self._separation))
 
     def draw(self) -> None:
         if not self.isValidShape():
@@ -32,6 +32,7 @@ import Part
 translate = FreeCAD.Qt.translate
 
 from Rocket.ShapeHandlers.BulkheadShapeHandler import BulkheadShapeHandler
+from Rocket.ShapeHandlers.ShapeTemplates import getTemplate, placeInstances, linearPlacements
 from Rocket.Utilities import validationError, _err
 
 class CenteringRingShapeHandler(BulkheadShapeHandler):
@@ -82,36 +83,27 @@ class CenteringRingShapeHandler(BulkheadShapeHandler):
 
         return True
 
-    def _drawCenteringRing(self) -> Any:
-        bulkhead = self._drawBulkhead()
+    def _makeHoles(self) -> list:
+        holes = super()._makeHoles()
 
         # Add CR hole
-        thickness = self._thickness
-        if self._step:
-            thickness += self._stepDiameter
+        thickness = self._holeThickness()
         centerRadius = self._centerDiameter / 2.0
 
         if centerRadius > 0:
-            hole = Part.makeCylinder(centerRadius, thickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0))
-            cr = bulkhead.cut(hole)
+            holes.append(Part.makeCylinder(centerRadius, thickness, FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0)))
 
             if self._notched:
-                hole = Part.makeBox(self._notchHeight + centerRadius, self._notchWidth, thickness, FreeCAD.Vector(0,self._notchWidth / 2,0), FreeCAD.Vector(1,0,0))
-                cr = cr.cut(hole)
-        else:
-            cr = bulkhead
+                holes.append(Part.makeBox(self._notchHeight + centerRadius, self._notchWidth, thickness, FreeCAD.Vector(0,self._notchWidth / 2,0), FreeCAD.Vector(1,0,0)))
 
-        return cr
+        return holes
+
+    def _drawCenteringRing(self) -> Any:
+        return self._drawBulkhead()
 
     def drawInstances(self) -> Any:
-        crs = []
-        base = self._drawCenteringRing()
-        for i in range(self._instanceCount):
-            cr = Part.Shape(base) # Create a copy
-            cr.translate(FreeCAD.Vector(i * (self._thickness + self._separation),0,0))
-            crs.append(cr)
-
-        return Part.makeCompound(crs)
+        base = getTemplate(self, self._drawCenteringRing)
+        return placeInstances(base, linearPlacements(self._instanceCount, self._thickness + self._separation))
 
     def draw(self) -> None:
         if not self.isValidShape():
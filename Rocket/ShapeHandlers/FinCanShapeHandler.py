@@ -43,6 +43,7 @@ from Rocket.ShapeHandlers.FinTrapezoidShapeHandler import FinTrapezoidShapeHandl
 from Rocket.ShapeHandlers.FinTriangleShapeHandler import FinTriangleShapeHandler
 from Rocket.ShapeHandlers.FinEllipseShapeHandler import FinEllipseShapeHandler
 from Rocket.ShapeHandlers.FinSketchShapeHandler import FinSketchShapeHandler
+from Rocket.ShapeHandlers.ShapeBooleans import multiFuse, multiCut
 
 TOLERANCE_OFFSET = 0.5     # Distance to offset a vertex
 
@@ -77,6 +78,12 @@ class FinCanShapeHandler(FinShapeHandler):
         self._couplerRadius = float(self._obj.CouplerDiameter) / 2.0
         self._couplerThickness = float(self._obj.CouplerThickness)
 
+        # Previews are drawn without edge shaping or launch lugs
+        if self._preview:
+            self._leadingEdge = FINCAN_EDGE_SQUARE
+            self._trailingEdge = FINCAN_EDGE_SQUARE
+            self._lug = False
+
         # apply scaling
         if obj.Proxy.isScaled():
             # self._scale is set in the base class
@@ -372,7 +379,7 @@ class FinCanShapeHandler(FinShapeHandler):
             length = self._length
             inner = Part.makeCylinder(innerRadius, length, point, direction)
         outer = Part.makeCylinder(outerRadius, length, point, direction)
-        can = outer.cut(inner)
+        cuts = [inner]
 
         if self._coupler:
             # Cut the outside of the coupler
@@ -380,8 +387,7 @@ class FinCanShapeHandler(FinShapeHandler):
             direction = FreeCAD.Vector(-1,0,0)
             cutOuter = Part.makeCylinder(outerRadius + 1.0, self._couplerLength + 1.0, cutPoint, direction)
             cutInner = Part.makeCylinder(self._couplerRadius, self._couplerLength + 1.0, cutPoint, direction)
-            cutDisk = cutOuter.cut(cutInner)
-            can = can.cut(cutDisk)
+            cuts.append(cutOuter.cut(cutInner))
 
             # Add a chamfer
             length = float(point.x)
@@ -397,8 +403,7 @@ class FinCanShapeHandler(FinShapeHandler):
             face = Part.Face(wire)
             # Part.show(face)
 
-            mask = face.revolve(FreeCAD.Vector(0, 0, 0),FreeCAD.Vector(1, 0, 0), 360)
-            can = can.cut(mask)
+            cuts.append(face.revolve(FreeCAD.Vector(0, 0, 0),FreeCAD.Vector(1, 0, 0), 360))
 
             if self._couplerStyle == FINCAN_COUPLER_STEPPED:
                 # Cut inside up to the step
@@ -407,10 +412,9 @@ class FinCanShapeHandler(FinShapeHandler):
                 radius = innerRadius
                 if self._couplerRadius < innerRadius:
                     radius = self._couplerRadius
-                step = Part.makeCylinder(radius, self._length, point, direction)
-                can = can.cut(step)
+                cuts.append(Part.makeCylinder(radius, self._length, point, direction))
 
-        return can
+        return multiCut(outer, cuts)
 
     def _extendRoot(self) -> bool:
         # Override this if the fin root needs an extension to connect it to the body tube
@@ -421,21 +425,16 @@ class FinCanShapeHandler(FinShapeHandler):
         can = self._drawCan()
 
         # Shape the leading and trailing edges
-        shape = self._getLeadingEdge()
-        if shape:
-            can = can.cut(shape)
-        shape = self._getTrailingEdge()
-        if shape:
-            can = can.cut(shape)
-
-        # Add the launch lug
-        shape = self._launchLug()
-        if shape:
-            can = can.fuse(shape)
+        can = multiCut(can, [self._getLeadingEdge(), self._getTrailingEdge()])
 
         # Add the fins
         fins = self._drawFinSet()
-        finCan = can.fuse([fins]) # Must be fuse not makeCompund
+        if self._preview:
+            # A compound is good enough for a preview and much faster than a fuse
+            return Part.makeCompound([can, fins])
+
+        # Add the launch lug and fins together. Must be fuse not makeCompund
+        finCan = multiFuse(can, [self._launchLug(), fins])
 
         return finCan
 
@@ -448,6 +447,7 @@ class FinCanShapeHandler(FinShapeHandler):
             self._obj.Shape = self._drawFinCan()
 
             self._obj.Placement = self._placement
+            self._obj.PoleCount = self._poleCount
 
         except (ZeroDivisionError, Part.OCCError):
             _err(translate('Rocket', "Fin can parameters produce an invalid shape"))
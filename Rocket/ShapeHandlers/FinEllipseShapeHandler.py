@@ -35,6 +35,7 @@ from Rocket.Constants import FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOI
     FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LETE, FIN_CROSS_BICONVEX, FIN_CROSS_ELLIPSE
 
 from Rocket.ShapeHandlers.FinShapeHandler import FinShapeHandler
+from Rocket.Utilities import clamp
 
 CROSS_SECTIONS = 100  # Number of cross sections for the ellipse
 
@@ -49,6 +50,11 @@ class FinEllipseShapeHandler(FinShapeHandler):
         y = (minor / major) * math.sqrt(major * major - x * x)
         return y
 
+    def _chordLimits(self, height : float) -> tuple[float, float]:
+        halfChord = self._radiusAt(self._rootChord, self._height, clamp(height, 0.0, self._height))
+        midChord = self._rootChord / 2.0
+        return (midChord - halfChord, midChord + halfChord)
+
     def _halfEllipseCurve(self, major : float, minor : float, thickness : float, midChord : float) -> Wire:
         if major > minor:
             ellipse = Part.Ellipse(FreeCAD.Vector(midChord, thickness, major),
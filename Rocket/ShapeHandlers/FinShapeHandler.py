@@ -39,9 +39,21 @@ from Rocket.Constants import FIN_CROSS_SAME, FIN_CROSS_SQUARE, FIN_CROSS_ROUND,
     FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE, FIN_CROSS_BICONVEX, FIN_CROSS_ELLIPSE
 from Rocket.Constants import FIN_DEBUG_FULL, FIN_DEBUG_PROFILE_ONLY, FIN_DEBUG_MASK_ONLY
 
-from Rocket.Utilities import validationError, _err
+from Rocket.ShapeHandlers.AdaptiveSpline import sampleResolution, makeAdaptiveSpline
+from Rocket.ShapeHandlers.ShapeBooleans import multiFuse
+from Rocket.ShapeHandlers.ShapeTemplates import getTemplate
+from Rocket.ShapeHandlers.ShapeHandlerBase import ShapeHandlerBase
+from Rocket.LevelOfDetail import isPreview
+from Rocket.Utilities import validationError, _err, clamp
+from Rocket.util.Quadrature import integrate
 
-class FinShapeHandler(ABC):
+AIRFOIL_RESOLUTION = 100
+
+# Area of the NACA symmetrical airfoil as a fraction of chord * thickness
+AIRFOIL_AREA_RATIO = 10.0 * (0.2969 * 2.0 / 3.0 - 0.1260 / 2.0 - 0.3516 / 3.0 + 0.2843 / 4.0 - 0.1015 / 5.0)
+
+class FinShapeHandler(ShapeHandlerBase, ABC):
+    SHAPE_TEMPLATE = True
 
     def __init__(self, obj : Any) -> None:
         self._obj = obj
@@ -111,6 +123,23 @@ class FinShapeHandler(ABC):
         self._minimumEdge = bool(self._obj.MinimumEdge)
         self._minimumEdgeSize = float(self._obj.MinimumEdgeSize)
 
+        self._adaptive = bool(self._obj.AdaptiveResolution)
+        self._tolerance = float(self._obj.ResolutionTolerance)
+        self._poleCount = 0
+
+        self._resolution = sampleResolution(self._adaptive, AIRFOIL_RESOLUTION)
+
+        # Previews are drawn as flat plates without fillets or tabs
+        self._preview = isPreview(obj)
+        if self._preview:
+            self._rootCrossSection = FIN_CROSS_SQUARE
+            self._tipCrossSection = FIN_CROSS_SQUARE
+            self._filletCrossSection = FIN_CROSS_SQUARE
+            self._fillets = False
+            self._ttw = False
+            self._minimumEdge = False
+            self._adaptive = False
+
         # Apply scaling
         self._scale = 1.0
         if obj.Proxy.isScaled():
@@ -322,8 +351,12 @@ class FinShapeHandler(ABC):
         return splines
 
     def _makeSpline(self, points : list) -> BSplineCurve:
-        spline = Part.BSplineCurve()
-        spline.buildFromPoles(points)
+        if self._adaptive:
+            spline = makeAdaptiveSpline(points, self._tolerance)
+        else:
+            spline = Part.BSplineCurve()
+            spline.buildFromPoles(points)
+        self._poleCount += spline.NbPoles
         return spline
 
     def _midChordLimit(self, chord : float, value : float, midChordLimit : bool) -> float:
@@ -334,7 +367,7 @@ class FinShapeHandler(ABC):
     def _makeChordProfileAirfoil(self, foreX : float, chord : float, thickness : float, height : float) -> Wire:
         # Standard NACA 4 digit symmetrical airfoil
 
-        splines = self._airfoilCurve(foreX, chord, thickness, height, 100)
+        splines = self._airfoilCurve(foreX, chord, thickness, height, self._resolution)
 
         wire = Part.Wire(splines)
         return wire
@@ -546,6 +579,9 @@ class FinShapeHandler(ABC):
 
     def isValidShape(self) -> bool:
         # Add error checking here
+        if self._adaptive and self._tolerance <= 0:
+            validationError(translate('Rocket', "Resolution tolerance must be > 0"))
+            return False
         if self._ttw:
             if self._ttwOffset >= self._rootChord:
                 validationError(translate('Rocket', "Ttw offset must be less than the root chord"))
@@ -626,6 +662,101 @@ class FinShapeHandler(ABC):
         # Override this if the fin root needs an extension to connect it to the body tube
         return False
 
+    def _crossSectionRatio(self, crossSection : str, chord : float, thickness : float,
+                           length1 : float, length2 : float) -> float:
+        # Area of a chord profile as a fraction of the enclosing chord * thickness rectangle
+        if chord <= 0 or thickness <= 0:
+            return 0.0
+
+        if crossSection == FIN_CROSS_SQUARE:
+            return 1.0
+        elif crossSection == FIN_CROSS_ROUND:
+            if chord <= thickness:
+                return math.pi / 4.0
+            return 1.0 - (thickness / chord) * (1.0 - math.pi / 4.0)
+        elif crossSection == FIN_CROSS_ELLIPSE:
+            return math.pi / 4.0
+
+        if crossSection == FIN_CROSS_BICONVEX:
+            ratio = 2.0 / 3.0
+        elif crossSection == FIN_CROSS_AIRFOIL:
+            ratio = AIRFOIL_AREA_RATIO
+        elif crossSection in [FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND]:
+            ratio = 0.5
+        elif crossSection in [FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE]:
+            ratio = 1.0 - clamp(length1, 0.0, chord) / (2.0 * chord)
+        elif crossSection == FIN_CROSS_TAPER_LETE:
+            ratio = 1.0 - clamp(length1 + length2, 0.0, chord) / (2.0 * chord)
+        else:
+            return 1.0
+
+        # The minimum edge thickens the tapered portion of the profile
+        edge = clamp(self.minimumEdge() / thickness, 0.0, 1.0)
+        return ratio + (1.0 - ratio) * edge
+
+    def _chordLimits(self, height : float) -> tuple[float, float]:
+        # Leading and trailing edges of the planform at the given height
+        if self._height <= 0:
+            return (0.0, self._rootChord)
+        fraction = height / self._height
+        fore = self._sweepLength * fraction
+        return (fore, fore + self._rootChord + (self._tipChord - self._rootChord) * fraction)
+
+    def _thicknessAtHeight(self, height : float) -> float:
+        return self._rootThickness
+
+    def _sectionRatio(self, chord : float, thickness : float, height : float) -> float:
+        l1, l2 = self._lengthsFromPercent(chord, self._rootPerCent,
+                                          self._rootLength1, self._rootLength2)
+        return self._crossSectionRatio(self._rootCrossSection, chord, thickness, l1, l2)
+
+    def _sectionArea(self, height : float) -> float:
+        fore, aft = self._chordLimits(height)
+        chord = abs(aft - fore)
+        thickness = self._thicknessAtHeight(height)
+        return chord * thickness * self._sectionRatio(chord, thickness, height)
+
+    def _planformHeight(self) -> float:
+        return self._height
+
+    def planformArea(self) -> float:
+        # Area of one side of a single fin
+        def chord(height : float) -> float:
+            fore, aft = self._chordLimits(height)
+            return abs(aft - fore)
+
+        return integrate(chord, 0.0, self._planformHeight())
+
+    def finOnlyVolume(self) -> float:
+        #
+        # Volume of a single fin with no additions, calculated from the planform and the
+        # chord profiles without drawing the shape
+        #
+        return integrate(self._sectionArea, 0.0, self._planformHeight())
+
+    def finOnlyCentroid(self) -> FreeCAD.Vector:
+        # Centroid of a single fin with no additions, in the coordinates used to draw the fin
+        height = self._planformHeight()
+        volume = self.finOnlyVolume()
+        if volume <= 0:
+            return FreeCAD.Vector(self._rootChord / 2.0, 0, 0)
+
+        def xMoment(h : float) -> float:
+            fore, aft = self._chordLimits(h)
+            return self._sectionArea(h) * (fore + aft) / 2.0
+
+        x = integrate(xMoment, 0.0, height) / volume
+        z = integrate(lambda h: self._sectionArea(h) * h, 0.0, height) / volume
+        return FreeCAD.Vector(x, 0, z)
+
+    def finFrontalArea(self, base : float = 0.0) -> float:
+        # Projection of a single fin along the rocket axis, ignoring cant. The part of the fin
+        # below the base height is hidden by the body
+        height = self._planformHeight()
+        if base >= height:
+            return 0.0
+        return integrate(self._thicknessAtHeight, max(base, 0.0), height)
+
     def finOnlyShape(self) -> Shape:
         fin = self._finOnlyShape(FIN_DEBUG_FULL)
         return Part.makeCompound([fin])
@@ -640,20 +771,16 @@ class FinShapeHandler(ABC):
         if profiles and len(profiles) > 0:
             if isinstance(profiles[0], list):
                 # Using a compound instead of a fuse makes drawing much faster, but also leads to
-                # a number of 'BOPAlgo SelfIntersect' errors. So we stick with the fuse
-
-                for profile in profiles:
-                    if loft is None:
-                        loft = Part.makeLoft(profile, True)
-                    else:
-                        loft = loft.fuse(Part.makeLoft(profile, True))
+                # a number of 'BOPAlgo SelfIntersect' errors. So we stick with the fuse, performed
+                # as a single operation
+                lofts = [Part.makeLoft(profile, True) for profile in profiles]
             else:
-                loft = Part.makeLoft(profiles, True)
+                lofts = [Part.makeLoft(profiles, True)]
 
             if hasattr(self, "_makeTip"):
-                tip = self._makeTip()
-                if tip and loft:
-                    loft = loft.fuse(tip)
+                lofts.append(self._makeTip())
+
+            loft = multiFuse(None, lofts)
 
             if loft:
                 mask = self._makeCommon()
@@ -714,19 +841,15 @@ class FinShapeHandler(ABC):
     def _drawFinDebug(self, debug : str) -> Shape:
         fin = self._finOnlyShape(debug)
         if fin:
+            tools = []
             if self._fillets:
-                fillet = self._makeFillet()
-                if fillet:
-                    fin = fin.fuse(fillet)
+                tools.append(self._makeFillet())
             elif self._extendRoot():
                 # Only needed when there are no fillets
-                extension = self._makeRootExtension()
-                if extension:
-                    fin = fin.fuse(extension)
+                tools.append(self._makeRootExtension())
             if self._ttw:
-                ttw = self._makeTtw()
-                if ttw:
-                    fin = fin.fuse(ttw)
+                tools.append(self._makeTtw())
+            fin = multiFuse(fin, tools)
 
         return fin
 
@@ -734,7 +857,7 @@ class FinShapeHandler(ABC):
         return self._drawFinDebug(self._debugSketch)
 
     def _drawFin(self) -> Shape:
-        fin = self._drawSingleFin()
+        fin = getTemplate(self, self._drawSingleFin)
         if self._cant != 0:
             fin.rotate(FreeCAD.Vector(self._rootChord / 2, 0, 0), FreeCAD.Vector(0,0,1), self._cant)
         fin.translate(FreeCAD.Vector(0,0,self._parentRadius))
@@ -743,12 +866,12 @@ class FinShapeHandler(ABC):
 
     def _drawFinSet(self) -> Shape:
         fins = []
-        base = self._drawSingleFin()
+        base = getTemplate(self, self._drawSingleFin)
         baseX = 0
         if hasattr(self._obj, "LeadingEdgeOffset"):
             baseX = self._leadingEdgeOffset
         for i in range(self._fincount):
-            fin = Part.Shape(base) # Create a copy
+            fin = base.moved(FreeCAD.Placement()) # Located copy sharing the base geometry
             if self._cant != 0:
                 fin.rotate(FreeCAD.Vector(self._rootChord / 2, 0, 0), FreeCAD.Vector(0,0,1), self._cant)
             radius = self._getTubeRadius()
@@ -769,6 +892,7 @@ class FinShapeHandler(ABC):
             else:
                 self._obj.Shape = self._drawFin()
             self._obj.Placement = self._placement
+            self._obj.PoleCount = self._poleCount
 
         except (ZeroDivisionError, Part.OCCError) as ex:
             _err(translate('Rocket', "Fin parameters produce an invalid shape"))
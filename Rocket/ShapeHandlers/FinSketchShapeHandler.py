@@ -25,6 +25,7 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
 from typing import Any
+import heapq
 
 import FreeCAD
 import Part
@@ -38,11 +39,20 @@ from Rocket.Constants import FIN_CROSS_SQUARE, FIN_CROSS_WEDGE, \
 from Rocket.ShapeHandlers.FinShapeHandler import FinShapeHandler
 from Rocket.Utilities import _err, validationError
 
+# Maximum deviation in mm when sampling curved edges to find chords
+CURVE_DEFLECTION = 0.01
+
 class FinSketchShapeHandler(FinShapeHandler):
+    # The fin profile comes from a linked sketch, which can't be compared
+    SHAPE_TEMPLATE = False
 
     def __init__(self, obj : Any) -> None:
         super().__init__(obj)
 
+        self._face = None
+        self._segments = None
+        self._segmentShape = None
+
     def verifyShape(self, shape : Shape) -> bool:
         if shape is None:
             validationError(translate('Rocket', "shape is empty"))
@@ -65,74 +75,100 @@ class FinSketchShapeHandler(FinShapeHandler):
                 return True
         return False
 
-    def _pointOnLine(self, z : float, zmin : float, zmax : float) -> bool:
-        return (zmin <= z) and (zmax >= z)
-
-    def _xOnLine(self, z : float, vertex1 : Vertex, vertex2 : Vertex) -> float:
-        try:
-            zRange = (z - vertex1.Point.z) / (vertex2.Point.z - vertex1.Point.z)
-
-            x = (vertex2.Point.x - vertex1.Point.x) * zRange + vertex1.Point.x
-        except ZeroDivisionError as ex:
-            x = vertex1.Point.x
-        return float(x)
-
-    def _zInVertex(self, z : float, vertexes : list[Vertex] , tolerance : float) -> bool:
-        if len(vertexes) != 2:
-            _err(translate('Rocket', "Unable to handle shapes other than lines"))
-            return False
+    def _edgeSegments(self, shape : Shape) -> list[tuple[float, float, float, float]]:
+        # Break the edges into straight segments (zmin, zmax, x at zmin, x at zmax). Curved
+        # edges are sampled rather than assuming a straight line between the vertexes
+        segments = []
+        for edge in shape.Edges:
+            if issubclass(type(edge.Curve), Part.Line):
+                points = [vertex.Point for vertex in edge.Vertexes]
+            else:
+                points = edge.discretize(Deflection=CURVE_DEFLECTION)
+            for point1, point2 in zip(points[:-1], points[1:]):
+                if point1.z <= point2.z:
+                    segments.append((float(point1.z), float(point2.z), float(point1.x), float(point2.x)))
+                else:
+                    segments.append((float(point2.z), float(point1.z), float(point2.x), float(point1.x)))
+
+        segments.sort()
+        return segments
+
+    def _getSegments(self, shape : Shape) -> list[tuple[float, float, float, float]]:
+        # Segments are sorted by zmin, and cached as the same shape is queried repeatedly
+        if self._segmentShape is not shape:
+            self._segments = self._edgeSegments(shape)
+            self._segmentShape = shape
+        return self._segments
+
+    def _xOnSegment(self, z : float, segment : tuple[float, float, float, float]) -> float:
+        zmin, zmax, x1, x2 = segment
+        if zmax - zmin <= 0:
+            return x1
+        return (x2 - x1) * ((z - zmin) / (zmax - zmin)) + x1
+
+    def _sweepChords(self, levels : list[float], segments : list, tolerance : float) -> list:
+        """
+            Find the chord at each of the z levels, given in ascending order. Segments are
+            added to the active set as the sweep reaches their lower end, and removed once
+            it passes their upper end, so each segment is only visited for the levels it spans.
+
+            Returns a list of (xmin, xmax) tuples, or None where no segment spans the level
+        """
+        chords = []
+        active = [] # heap ordered by zmax
+        nextSegment = 0
+        for z in levels:
+            while nextSegment < len(segments) and segments[nextSegment][0] - tolerance <= z:
+                heapq.heappush(active, (segments[nextSegment][1], nextSegment))
+                nextSegment += 1
+            while len(active) > 0 and active[0][0] + tolerance < z:
+                heapq.heappop(active)
+
+            xmin = None
+            xmax = None
+            for zmax, index in active:
+                segment = segments[index]
+                if segment[1] - segment[0] <= 0:
+                    # Horizontal segments contribute both ends
+                    ends = [segment[2], segment[3]]
+                else:
+                    ends = [self._xOnSegment(z, segment)]
+                for x in ends:
+                    if xmin is None or xmin > x:
+                        xmin = x
+                    if xmax is None or xmax < x:
+                        xmax = x
+
+            if xmin is None:
+                chords.append(None)
+            else:
+                chords.append((xmin, xmax))
 
-        return self._pointOnLine(z, vertexes[0].Point.z - tolerance, vertexes[1].Point.z + tolerance) or \
-                self._pointOnLine(z, vertexes[1].Point.z - tolerance, vertexes[0].Point.z + tolerance)
+        return chords
 
     def findChords(self, shape : Shape) -> list:
-        zArray = []
-
         tolerance = shape.getTolerance(1, Part.Shape) # Maximum tolerance
-        for v in shape.Vertexes:
-            if len(zArray) < 1:
-                zArray.append(v.Point.z)
-            else:
-                found = False
-                for existing in zArray:
-                    if abs(existing - v.Point.z) <= tolerance:
-                        found = True
-                        break
-
-                if not found:
-                    zArray.append(v.Point.z)
-
-        zArray.sort()
-
-        # Find all x's associated with all z's
-        index = 0
-        endArray = []
-        self._height = -1 # Determine the height from the sketch
-        for z in zArray:
-            # Find the endpoints for z
-            ends = []
-            for edge in shape.Edges:
-                if self._zInVertex(z, edge.Vertexes, tolerance):
-                    # Get the x,y for z
-                    x = self._xOnLine(z, edge.Vertexes[0], edge.Vertexes[1])
-                    ends.append(FreeCAD.Vector(x, 0, z))
-                    self._height = max(self._height, z)
-
-            endArray.append(ends)
-
-            index += 1
+        segments = self._getSegments(shape)
+
+        # Sort the z values of all segment ends and remove duplicates
+        zValues = []
+        for segment in segments:
+            zValues.append(segment[0])
+            zValues.append(segment[1])
+        zValues.sort()
+        zArray = []
+        for z in zValues:
+            if len(zArray) < 1 or abs(z - zArray[-1]) > tolerance:
+                zArray.append(z)
 
-        # Use the x's to find the chords
+        # Find the chord at each z
         chords = []
-        for ends in endArray:
-            xmin = ends[0].x
-            xmax = ends[0].x
-            z = ends[0].z
-            for point in ends:
-                if xmin > point.x:
-                    xmin = point.x
-                elif xmax < point.x:
-                    xmax = point.x
+        self._height = -1 # Determine the height from the sketch
+        for z, ends in zip(zArray, self._sweepChords(zArray, segments, tolerance)):
+            if ends is None:
+                continue
+            self._height = max(self._height, z)
+            xmin, xmax = ends
             if xmin == xmax:
                 chords.append([FreeCAD.Vector(xmin, 0, z)])
             else:
@@ -142,55 +178,26 @@ class FinSketchShapeHandler(FinShapeHandler):
 
     def findChord(self, height: float, shape : Shape) -> tuple[float, float]:
         tolerance = shape.getTolerance(1, Part.Shape) # Maximum tolerance
-
-        # Find all x's associated with all z's
-        ends = []
-        for edge in shape.Edges:
-            if self._zInVertex(height, edge.Vertexes, tolerance):
-                # Get the x,y for z
-                x = self._xOnLine(height, edge.Vertexes[0], edge.Vertexes[1])
-                ends.append(x)
-
-        # Use the x's to find the chord
-        xmin = ends[0]
-        xmax = ends[0]
-        for x in ends:
-            if xmin > x:
-                xmin = x
-            elif xmax < x:
-                xmax = x
-        return (xmin, xmax)
+        chord = self._sweepChords([height], self._getSegments(shape), tolerance)[0]
+        if chord is None:
+            _err(translate('Rocket', "The fin sketch has no chord at height {}").format(height))
+            return (0.0, 0.0)
+        return chord
 
     def findRootChord(self, shape : Shape) -> tuple[float, float]:
-        tolerance = shape.getTolerance(1, Part.Shape) # Maximum tolerance
-
-        # Find all x's associated with all z's
-        ends = []
-        z = 0.0
-        for edge in shape.Edges:
-            if self._zInVertex(z, edge.Vertexes, tolerance):
-                # Get the x,y for z
-                x = self._xOnLine(z, edge.Vertexes[0], edge.Vertexes[1])
-                ends.append(x)
-
-        # Use the x's to find the chord
-        xmin = ends[0]
-        xmax = ends[0]
-        for x in ends:
-            if xmin > x:
-                xmin = x
-            elif xmax < x:
-                xmax = x
-        return (xmin, xmax)
+        return self.findChord(0.0, shape)
 
     def getFace(self) -> Any:
-        profile = self._obj.Profile
-        shape = profile.Shape
+        # The face is used for a number of chord queries, so only create it once
+        if self._face is None:
+            profile = self._obj.Profile
+            shape = profile.Shape
 
-        if not self.verifyShape(shape):
-            return None
+            if not self.verifyShape(shape):
+                return None
 
-        return Part.Wire(shape)
+            self._face = Part.Wire(shape)
+        return self._face
 
     def getOffsetFace(self) -> Wire:
         profile = self._obj.Profile
@@ -227,6 +234,26 @@ class FinSketchShapeHandler(FinShapeHandler):
             return thickness
         return self._rootThickness
 
+    def _chordLimits(self, height : float) -> tuple[float, float]:
+        shape = self.getFace()
+        if shape is None:
+            return (0.0, 0.0)
+        return self.findChord(height, shape)
+
+    def _planformHeight(self) -> float:
+        shape = self.getFace()
+        if shape is None:
+            return 0.0
+        return max(segment[1] for segment in self._getSegments(shape))
+
+    def _sectionArea(self, height : float) -> float:
+        shape = self.getFace()
+        if shape is not None and self.isCurved(shape):
+            # Curved sketches are extruded to the root thickness
+            fore, aft = self._chordLimits(height)
+            return abs(aft - fore) * self._rootThickness
+        return super()._sectionArea(height)
+
     def _makeChord(self, chord : list) -> Shape:
         height = float(chord[0].z)
         thickness = self._thicknessAtHeight(height)
@@ -73,6 +73,22 @@ class FinTrapezoidShapeHandler(FinShapeHandler):
         return self._makeChordProfile(crossSection, -offset + self._sweepAtHeight(height), chord,
             thickness, height, l1, l2)
 
+    def _thicknessAtHeight(self, height : float) -> float:
+        if self._height <= 0:
+            return self._rootThickness
+        return self._rootThickness + (self._tipThickness - self._rootThickness) * (height / self._height)
+
+    def _sectionRatio(self, chord : float, thickness : float, height : float) -> float:
+        # The loft blends the root profile into the tip profile
+        root = super()._sectionRatio(chord, thickness, height)
+        if self._height <= 0:
+            return root
+        l1, l2 = self._lengthsFromPercent(chord, self._tipPerCent,
+                                          self._tipLength1, self._tipLength2)
+        tip = self._crossSectionRatio(self._tipCrossSection, chord, thickness, l1, l2)
+        fraction = height / self._height
+        return root + (tip - root) * fraction
+
     def isValidShape(self) -> bool:
         # Add error checking here
         if self._ttw:
@@ -46,44 +46,44 @@ class FinTriangleShapeHandler(FinShapeHandler):
         super().__init__(obj)
 
     def _makeRootProfile(self, height : float = 0.0) -> Wire:
-        # Create the root profile, casting everything to float to avoid typing issues
-        l1, l2 = self._lengthsFromPercent(float(self._obj.RootChord), self._obj.RootPerCent,
-                                          float(self._obj.RootLength1), float(self._obj.RootLength2))
-        return self._makeChordProfile(self._obj.RootCrossSection, 0.0, float(self._obj.RootChord),
-            float(self._obj.RootThickness), height, l1, l2)
+        # Create the root profile
+        l1, l2 = self._lengthsFromPercent(self._rootChord, self._rootPerCent,
+                                          self._rootLength1, self._rootLength2)
+        return self._makeChordProfile(self._rootCrossSection, 0.0, self._rootChord,
+            self._rootThickness, height, l1, l2)
 
     def _makeTipProfile(self) -> Any:
-        # Create the tip profile, casting everything to float to avoid typing issues
-        if self._obj.RootCrossSection in [FIN_CROSS_DIAMOND]:
+        # Create the tip profile
+        if self._rootCrossSection in [FIN_CROSS_DIAMOND]:
             min = self.minimumEdge()
             if min > 0:
                 l1, l2 = self._lengthsFromRootRatio(min)
-                return self._makeChordProfile(FIN_CROSS_DIAMOND, float(self._obj.SweepLength), min,
-                    min + 0.001, float(self._obj.Height), l1, l2)
+                return self._makeChordProfile(FIN_CROSS_DIAMOND, self._sweepLength, min,
+                    min + 0.001, self._height, l1, l2)
             else:
-                return Part.Point(FreeCAD.Vector(self._obj.SweepLength, 0.0, self._obj.Height)).toShape()
+                return Part.Point(FreeCAD.Vector(self._sweepLength, 0.0, self._height)).toShape()
 
-        l1, l2 = self._lengthsFromPercent(float(self._obj.RootChord), self._obj.RootPerCent,
-                                          float(self._obj.RootLength1), float(self._obj.RootLength2))
+        l1, l2 = self._lengthsFromPercent(self._rootChord, self._rootPerCent,
+                                          self._rootLength1, self._rootLength2)
         chord, height, sweep = self._topChord(l1, l2)
-        return self._makeChordProfile(self._obj.RootCrossSection, sweep, chord,
-            float(self._obj.RootThickness), height, l1, l2)
+        return self._makeChordProfile(self._rootCrossSection, sweep, chord,
+            self._rootThickness, height, l1, l2)
 
     def _heightAtChord(self, chord : float) -> float:
         theta1 = math.radians(self._sweepAngleFromLength())
-        length = float(self._obj.SweepLength) - float(self._obj.RootChord)
-        theta2 = (math.pi / 2.0) - math.atan2(float(self._obj.Height), length) # In radians
+        length = self._sweepLength - self._rootChord
+        theta2 = (math.pi / 2.0) - math.atan2(self._height, length) # In radians
         min = self.minimumEdge()
 
-        height = float(self._obj.Height) - ((chord - min)/(math.tan(theta1) - math.tan(theta2)))
+        height = self._height - ((chord - min)/(math.tan(theta1) - math.tan(theta2)))
         return height
 
     def _sweepAngleFromLength(self) -> float:
-        length = float(self._obj.SweepLength)
+        length = self._sweepLength
         min = self.minimumEdge() / 2.0
         if min > 0:
             length -= min
-        theta = 90.0 - math.degrees(math.atan2(float(self._obj.Height), length))
+        theta = 90.0 - math.degrees(math.atan2(self._height, length))
         return theta
 
     def _sweepAtHeight(self, height : float) -> float:
@@ -96,6 +96,10 @@ class FinTriangleShapeHandler(FinShapeHandler):
         x2 = self._rootChord + (height / self._height) * (self._sweepLength - self._rootChord)
         return abs(x1 - x2)
 
+    def _chordLimits(self, height : float) -> tuple[float, float]:
+        fore = self._sweepAtHeight(height)
+        return (fore, fore + self._chordAtHeight(height))
+
     def _makeAtHeightProfile(self, crossSection : str, height : float = 0.0, offset : float = 0.0) -> Wire:
         chord = self._chordAtHeight(height) + 2.0 * offset
         thickness = self._rootThickness + 2.0 * offset
@@ -115,15 +119,15 @@ class FinTriangleShapeHandler(FinShapeHandler):
 
     def _topChord(self, tip1 : float, tip2 : float) -> tuple[float, float, float]:
 
-        crossSection = self._obj.RootCrossSection
+        crossSection = self._rootCrossSection
         if crossSection in [FIN_CROSS_WEDGE, FIN_CROSS_SQUARE]:
             chord = 0.00001 # Effectively but not exactly zero
-            height = float(self._obj.Height)
+            height = self._height
         elif crossSection in [FIN_CROSS_ROUND, FIN_CROSS_ELLIPSE]:
-            chord = float(self._obj.RootThickness)
-            height = max(float(self._obj.Height) - (float(self._obj.RootThickness) / 2.0), 0)
+            chord = self._rootThickness
+            height = max(self._height - (self._rootThickness / 2.0), 0)
         elif crossSection in [FIN_CROSS_AIRFOIL, FIN_CROSS_BICONVEX]:
-            chord = float(self._obj.RootThickness)
+            chord = self._rootThickness
             height = self._heightAtChord(chord)
         elif crossSection in [FIN_CROSS_DIAMOND, FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE]:
             chord = tip1
@@ -133,7 +137,7 @@ class FinTriangleShapeHandler(FinShapeHandler):
             height = self._heightAtChord(chord)
         else:
             chord = 0
-            height = float(self._obj.Height)
+            height = self._height
 
         sweep = self._sweepAtHeight(height)
 
@@ -141,17 +145,17 @@ class FinTriangleShapeHandler(FinShapeHandler):
 
     def isValidShape(self) -> bool:
         # Add error checking here
-        if self._obj.Ttw:
-            if self._obj.TtwOffset >= self._obj.RootChord:
+        if self._ttw:
+            if self._ttwOffset >= self._rootChord:
                 validationError(translate('Rocket', "Ttw offset must be less than the root chord"))
                 return False
-            if self._obj.TtwLength <= 0:
+            if self._ttwLength <= 0:
                 validationError(translate('Rocket', "Ttw length must be greater than 0"))
                 return False
-            if self._obj.TtwHeight <= 0:
+            if self._ttwHeight <= 0:
                 validationError(translate('Rocket', "Ttw height must be greater than 0"))
                 return False
-            if self._obj.TtwThickness <= 0:
+            if self._ttwThickness <= 0:
                 validationError(translate('Rocket', "Ttw thickness must be greater than 0"))
                 return False
         return super().isValidShape()
@@ -166,20 +170,20 @@ class FinTriangleShapeHandler(FinShapeHandler):
         return profiles
 
     def _makeTopProfile(self) -> Shape:
-        if self._obj.RootCrossSection in [FIN_CROSS_BICONVEX, FIN_CROSS_ROUND, FIN_CROSS_ELLIPSE, FIN_CROSS_WEDGE,
+        if self._rootCrossSection in [FIN_CROSS_BICONVEX, FIN_CROSS_ROUND, FIN_CROSS_ELLIPSE, FIN_CROSS_WEDGE,
                                             FIN_CROSS_SQUARE, FIN_CROSS_DIAMOND, FIN_CROSS_AIRFOIL,
                                             FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE]:
             # Already handled
             return None
         else:
             # Just a point at the tip of the fin, used for lofts
-            tip=Part.Point(FreeCAD.Vector(self._obj.SweepLength, 0.0, self._obj.Height)).toShape()
+            tip=Part.Point(FreeCAD.Vector(self._sweepLength, 0.0, self._height)).toShape()
         return tip
 
     def _makeRoundTip(self) -> Shape:
         # Half sphere of radius thickness
-        radius = float(self._obj.RootThickness) / 2.0 # + 0.1
-        height = float(self._obj.Height) - radius # self._heightAtChord(2.0 * radius)
+        radius = self._rootThickness / 2.0 # + 0.1
+        height = self._height - radius # self._heightAtChord(2.0 * radius)
         sweep = self._sweepAtHeight(height) + radius
 
         _, theta, _ = self._angles()
@@ -211,87 +215,87 @@ class FinTriangleShapeHandler(FinShapeHandler):
         return tip
 
     def _makeBiconvexTip(self) -> Shape:
-        l1, l2 = self._lengthsFromPercent(float(self._obj.RootChord), self._obj.RootPerCent,
-                                          float(self._obj.RootLength1), float(self._obj.RootLength2))
+        l1, l2 = self._lengthsFromPercent(self._rootChord, self._rootPerCent,
+                                          self._rootLength1, self._rootLength2)
         chord, height, sweep = self._topChord(l1, l2)
         base = self._makeChordProfile(FIN_CROSS_BICONVEX, sweep, chord,
-            float(self._obj.RootThickness), height, l1, l2)
+            self._rootThickness, height, l1, l2)
 
         min = self.minimumEdge()
         if min > 0:
-            top=self._makeChordProfile(FIN_CROSS_BICONVEX, float(self._obj.SweepLength) - (min/2.0), min,
-                min, float(self._obj.Height), l1, l2)
+            top=self._makeChordProfile(FIN_CROSS_BICONVEX, self._sweepLength - (min/2.0), min,
+                min, self._height, l1, l2)
         else:
-            top=Part.Point(FreeCAD.Vector(self._obj.SweepLength, 0.0, self._obj.Height)).toShape()
+            top=Part.Point(FreeCAD.Vector(self._sweepLength, 0.0, self._height)).toShape()
         tip = Part.makeLoft([base, top], True)
         return tip
 
     def _makeLETaperTip(self) -> Shape:
-        l1, l2 = self._lengthsFromPercent(float(self._obj.RootChord), self._obj.RootPerCent,
-                                          float(self._obj.RootLength1), float(self._obj.RootLength2))
+        l1, l2 = self._lengthsFromPercent(self._rootChord, self._rootPerCent,
+                                          self._rootLength1, self._rootLength2)
         chord, height, sweep = self._topChord(l1, l2)
         base = self._makeChordProfile(FIN_CROSS_WEDGE, sweep, chord,
-            float(self._obj.RootThickness), height, l1, l2)
+            self._rootThickness, height, l1, l2)
 
         min = self.minimumEdge()
         if min > 0:
-            top=self._makeChordProfile(FIN_CROSS_WEDGE, float(self._obj.SweepLength), min,
-                min, float(self._obj.Height), l1, l2)
+            top=self._makeChordProfile(FIN_CROSS_WEDGE, self._sweepLength, min,
+                min, self._height, l1, l2)
         else:
-            top=Part.Point(FreeCAD.Vector(self._obj.SweepLength, 0.0, self._obj.Height)).toShape()
+            top=Part.Point(FreeCAD.Vector(self._sweepLength, 0.0, self._height)).toShape()
         tip = Part.makeLoft([base, top], True)
         return tip
 
     def _makeTETaperTip(self) -> Shape:
         # Wedge at the base, point at the tip
-        l1, l2 = self._lengthsFromPercent(float(self._obj.RootChord), self._obj.RootPerCent,
-                                          float(self._obj.RootLength1), float(self._obj.RootLength2))
+        l1, l2 = self._lengthsFromPercent(self._rootChord, self._rootPerCent,
+                                          self._rootLength1, self._rootLength2)
         chord, height, sweep = self._topChord(l1, l2)
         base = self._makeChordProfile(FIN_CROSS_WEDGE, sweep + chord, -chord,
-            float(self._obj.RootThickness), height, l1, l2)
+            self._rootThickness, height, l1, l2)
 
         min = self.minimumEdge()
         if min > 0:
-            top=self._makeChordProfile(FIN_CROSS_WEDGE, float(self._obj.SweepLength), -min,
-                min, float(self._obj.Height), l1, l2)
+            top=self._makeChordProfile(FIN_CROSS_WEDGE, self._sweepLength, -min,
+                min, self._height, l1, l2)
         else:
-            top=Part.Point(FreeCAD.Vector(self._obj.SweepLength, 0.0, self._obj.Height)).toShape()
+            top=Part.Point(FreeCAD.Vector(self._sweepLength, 0.0, self._height)).toShape()
         tip = Part.makeLoft([base, top], True)
         return tip
 
     def _makeLETETaperTip(self) -> Shape:
         # Wedge at the base, point at the tip
-        l1, l2 = self._lengthsFromPercent(float(self._obj.RootChord), self._obj.RootPerCent,
-                                          float(self._obj.RootLength1), float(self._obj.RootLength2))
+        l1, l2 = self._lengthsFromPercent(self._rootChord, self._rootPerCent,
+                                          self._rootLength1, self._rootLength2)
         chord, height, sweep = self._topChord(l1, l2)
         base = self._makeChordProfile(FIN_CROSS_DIAMOND, sweep, chord,
-            float(self._obj.RootThickness), height, l1, l2)
+            self._rootThickness, height, l1, l2)
 
         min = self.minimumEdge()
         if min > 0:
-            top=self._makeChordProfile(FIN_CROSS_DIAMOND, float(self._obj.SweepLength), min,
-                min + 0.001, float(self._obj.Height), l1, l2)
+            top=self._makeChordProfile(FIN_CROSS_DIAMOND, self._sweepLength, min,
+                min + 0.001, self._height, l1, l2)
         else:
-            top=Part.Point(FreeCAD.Vector(self._obj.SweepLength, 0.0, self._obj.Height)).toShape()
+            top=Part.Point(FreeCAD.Vector(self._sweepLength, 0.0, self._height)).toShape()
         tip = Part.makeLoft([base, top], True)
         return tip
 
     def _makeAirfoilTip(self) -> Shape:
-        l1, l2 = self._lengthsFromPercent(float(self._obj.RootChord), self._obj.RootPerCent,
-                                    float(self._obj.RootLength1), float(self._obj.RootLength2))
+        l1, l2 = self._lengthsFromPercent(self._rootChord, self._rootPerCent,
+                                    self._rootLength1, self._rootLength2)
         chord, height, sweep = self._topChord(l1, l2)
-        base = self._makeChordProfile(self._obj.RootCrossSection, sweep, chord,
-            float(self._obj.RootThickness), height, l1, l2)
+        base = self._makeChordProfile(self._rootCrossSection, sweep, chord,
+            self._rootThickness, height, l1, l2)
 
         min = self.minimumEdge()
         if min > 0:
-            top=self._makeChordProfile(self._obj.RootCrossSection, float(self._obj.SweepLength) - (min/2.0), min,
-                min, float(self._obj.Height), l1, l2)
+            top=self._makeChordProfile(self._rootCrossSection, self._sweepLength - (min/2.0), min,
+                min, self._height, l1, l2)
         else:
             thickness = 0.001
-            chord = float(self._obj.RootChord) / float(self._obj.RootThickness) * thickness
-            top = self._makeChordProfile(self._obj.RootCrossSection, float(self._obj.SweepLength), chord,
-                thickness, float(self._obj.Height), l1, l2)
+            chord = self._rootChord / self._rootThickness * thickness
+            top = self._makeChordProfile(self._rootCrossSection, self._sweepLength, chord,
+                thickness, self._height, l1, l2)
 
         tip = Part.makeLoft([base, top], True)
         return tip
@@ -300,7 +304,7 @@ class FinTriangleShapeHandler(FinShapeHandler):
         """
             This function adds shapes, rather than profiles to be lofted
         """
-        crossSection = self._obj.RootCrossSection
+        crossSection = self._rootCrossSection
         if crossSection in [FIN_CROSS_ROUND, FIN_CROSS_ELLIPSE]:
             tip = self._makeRoundTip()
         elif crossSection in [FIN_CROSS_BICONVEX]:
@@ -25,6 +25,7 @@ __author__ = "David Carter"
 __url__ = "https://www.davesrocketshop.com"
 
 from typing import Any
+import math
 
 import FreeCAD
 import Part
@@ -37,6 +38,8 @@ from Rocket.Utilities import validationError
 from Rocket.ShapeHandlers.FinShapeHandler import FinShapeHandler
 
 class FinTubeShapeHandler(FinShapeHandler):
+    # The tube dimensions are read from the object rather than the handler
+    SHAPE_TEMPLATE = False
 
     def __init__(self, obj : Any) -> None:
         super().__init__(obj)
@@ -58,6 +61,33 @@ class FinTubeShapeHandler(FinShapeHandler):
         inner = Part.makeCylinder(radius - self._obj.TubeThickness, self._obj.RootChord, FreeCAD.Vector(0,0,0), FreeCAD.Vector(1,0,0))
         return outer.cut(inner)
 
+    def planformArea(self) -> float:
+        return float(self._obj.TubeOuterDiameter) * float(self._obj.RootChord)
+
+    def finOnlyVolume(self) -> float:
+        outer = float(self._obj.TubeOuterDiameter) / 2.0
+        inner = max(outer - float(self._obj.TubeThickness), 0.0)
+        return math.pi * (outer * outer - inner * inner) * float(self._obj.RootChord)
+
+    def _segmentArea(self, radius : float, distance : float) -> float:
+        # Area of a circle beyond a chord at the given distance from the center
+        if distance >= radius:
+            return 0.0
+        if distance <= -radius:
+            return math.pi * radius * radius
+        return radius * radius * math.acos(distance / radius) - distance * math.sqrt(radius * radius - distance * distance)
+
+    def finFrontalArea(self, base : float = 0.0) -> float:
+        # Air passes through the tube, so only the wall is seen from the front. The part of the
+        # wall below the base height is hidden by the body
+        outer = float(self._obj.TubeOuterDiameter) / 2.0
+        inner = max(outer - float(self._obj.TubeThickness), 0.0)
+        distance = base - outer
+        return self._segmentArea(outer, distance) - self._segmentArea(inner, distance)
+
+    def finOnlyCentroid(self) -> FreeCAD.Vector:
+        return FreeCAD.Vector(float(self._obj.RootChord) / 2.0, 0, 0)
+
     def _drawFinSet(self, offset : float = 0) -> Any:
         fins = []
         base = self._drawSingleFin()
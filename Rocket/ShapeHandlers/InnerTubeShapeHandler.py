@@ -31,11 +31,13 @@ import Part
 
 from Rocket.ShapeHandlers.BodyTubeShapeHandler import BodyTubeShapeHandler
 
+from Rocket.ShapeHandlers.ShapeTemplates import getTemplate, placeInstances
 from Rocket.Utilities import _err
 
 translate = FreeCAD.Qt.translate
 
 class InnerTubeShapeHandler(BodyTubeShapeHandler):
+    SHAPE_TEMPLATE = True
     def __init__(self, obj : Any) -> None:
         super().__init__(obj)
 
@@ -62,24 +64,21 @@ class InnerTubeShapeHandler(BodyTubeShapeHandler):
         return x1, y1
 
     def drawInstances(self) -> Any:
-        tubes = []
-        base = self.drawSingle()
+        placements = []
+        base = getTemplate(self, self.drawSingle)
         if self._rotation == 0:
             points = self._configuration.getPoints()
         else:
             points = self._configuration.getPointsRotated(self._rotation)
 
         for i in range(self._configuration.getClusterCount()):
-            tube = Part.Shape(base) # Create a copy
-
             y = points[2 * i]
             z = points[2 * i + 1]
             y1, z1 = self._translateCenter(y, z)
 
-            tube.translate(FreeCAD.Vector(0,y1,z1))
-            tubes.append(tube)
+            placements.append(FreeCAD.Placement(FreeCAD.Vector(0,y1,z1), FreeCAD.Rotation()))
 
-        return Part.makeCompound(tubes)
+        return placeInstances(base, placements)
 
     def draw(self) -> None:
         if not self.isValidShape():
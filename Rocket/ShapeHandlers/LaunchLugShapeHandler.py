@@ -32,6 +32,7 @@ import math
 
 from Rocket.ShapeHandlers.BodyTubeShapeHandler import BodyTubeShapeHandler
 
+from Rocket.ShapeHandlers.ShapeTemplates import getTemplate, placeInstances, linearPlacements
 from Rocket.Utilities import _err, validationError
 
 translate = FreeCAD.Qt.translate
@@ -39,6 +40,7 @@ translate = FreeCAD.Qt.translate
 TOLERANCE_OFFSET = 0.5     # Distance to offset a vertex
 
 class LaunchLugShapeHandler(BodyTubeShapeHandler):
+    SHAPE_TEMPLATE = True
 
     def __init__(self, obj : Any) -> None:
         super().__init__(obj, scale=False)
@@ -152,14 +154,8 @@ class LaunchLugShapeHandler(BodyTubeShapeHandler):
         return None
 
     def drawInstances(self) -> Any:
-        lugs = []
-        base = self.drawSingle()
-        for i in range(self._instanceCount):
-            lug = Part.Shape(base) # Create a copy
-            lug.translate(FreeCAD.Vector(i * (self._length + self._separation),0,0))
-            lugs.append(lug)
-
-        return Part.makeCompound(lugs)
+        base = getTemplate(self, self.drawSingle)
+        return placeInstances(base, linearPlacements(self._instanceCount, self._length + self._separation))
 
     def draw(self) -> None:
         if not self.isValidShape():
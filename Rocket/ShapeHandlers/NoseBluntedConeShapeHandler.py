@@ -91,6 +91,16 @@ class NoseBluntedConeShapeHandler(NoseShapeHandler):
         inner_minor = offset * slope + intercept
         return inner_minor
 
+    def profileRadius(self, x : float) -> float:
+        (vLength, Xt, Yt, Xo, Xa) = self.getBluntedLength(self._length, self._radius, self._noseRadius)
+
+        # Spherical tip up to the tangent point, then conical to the base
+        tangent = self._length - vLength + Xt
+        if x < tangent:
+            center = self._length - vLength + Xo
+            return math.sqrt(max(self._noseRadius * self._noseRadius - math.pow(x - center, 2), 0.0))
+        return Yt + (self._radius - Yt) * (x - tangent) / (self._length - tangent)
+
     def getCurve(self, length : float, radius : float, noseRadius : float, offset : float = 0.0) -> Any:
         (vLength, Xt, Yt, Xo, Xa) = self.getBluntedLength(length, radius, noseRadius)
 
@@ -105,6 +105,16 @@ class NoseBluntedOgiveShapeHandler(NoseShapeHandler):
         x = radius - math.sqrt(radius * radius - y * y)
         return (x, y)
 
+    def profileRadius(self, x : float) -> float:
+        (rho, vLength, Xt, Yt, Xo, Xa) = self.getBluntedLength(self._length, self._radius, self._noseRadius)
+
+        # Spherical tip up to the tangent point, then the ogive to the base
+        tangent = Xt - Xa
+        if x < tangent:
+            return math.sqrt(max(self._noseRadius * self._noseRadius - math.pow(x - self._noseRadius, 2), 0.0))
+        ogiveLength = self._length - tangent
+        return self.ogive_y(x - tangent + (vLength - ogiveLength), vLength, self._radius, rho)
+
     def getCurve(self, length : float, radius : float, noseRadius : float, offset : float = 0.0) -> Any:
         (rho, vLength, Xt, Yt, Xo, Xa) = self.getBluntedLength(length, radius, noseRadius)
 
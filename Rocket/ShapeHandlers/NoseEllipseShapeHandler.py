@@ -35,6 +35,10 @@ from Rocket.ShapeHandlers.NoseShapeHandler import NoseShapeHandler
 
 class NoseEllipseShapeHandler(NoseShapeHandler):
 
+    def profileRadius(self, x : float) -> float:
+        ratio = (self._length - x) / self._length
+        return self._radius * math.sqrt(max(1.0 - ratio * ratio, 0.0))
+
     def innerMinor(self, last : float) -> float:
         a = last
         b = self._radius - self._thickness
@@ -41,6 +41,9 @@ class NoseHaackShapeHandler(NoseShapeHandler):
             return False
         return super().isValidShape()
 
+    def profileRadius(self, x : float) -> float:
+        return self.haack_y(x, self._length, self._radius, self._coefficient)
+
     def innerMinor(self, last : float) -> float:
         radius = self._radius - self._thickness
         length = last
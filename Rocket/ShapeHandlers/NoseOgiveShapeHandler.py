@@ -36,6 +36,10 @@ class NoseOgiveShapeHandler(NoseShapeHandler):
         y = math.sqrt(rho * rho - math.pow(length - x, 2)) + radius - rho
         return y
 
+    def profileRadius(self, x : float) -> float:
+        rho = (self._radius * self._radius + self._length * self._length) / (2.0 * self._radius)
+        return self.ogive_y(x, self._length, self._radius, rho)
+
     def innerMinor(self, last : float) -> float:
         radius = self._radius - self._thickness
         length = last
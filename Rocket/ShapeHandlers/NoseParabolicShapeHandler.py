@@ -45,6 +45,9 @@ class NoseParabolicShapeHandler(NoseShapeHandler):
         y = radius * ((2 * ratio) - (k * ratio * ratio)) / (2 - k)
         return y
 
+    def profileRadius(self, x : float) -> float:
+        return self.para_y(x, self._length, self._radius, self._coefficient)
+
     def innerMinor(self, last : float, k : float) -> float:
         radius = self._radius - self._thickness
         length = last
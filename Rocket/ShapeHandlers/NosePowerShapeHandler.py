@@ -45,6 +45,9 @@ class NosePowerShapeHandler(NoseShapeHandler):
         y = radius * math.pow((x / length), k)
         return y
 
+    def profileRadius(self, x : float) -> float:
+        return self.power_y(x, self._length, self._radius, self._coefficient)
+
     def innerMinor(self, last, k) -> float:
         radius = self._radius - self._thickness
         length = last
@@ -45,6 +45,11 @@ class NoseSecantOgiveShapeHandler(NoseShapeHandler):
         y = math.sqrt(rho * rho - math.pow(rho * math.cos(alpha) - x, 2)) - (rho * math.sin(alpha))
         return y
 
+    def profileRadius(self, x : float) -> float:
+        rho = self.getRho()
+        alpha = self.getAlpha(self._length, self._radius)
+        return self.ogive_y(x, self._length, rho, alpha)
+
     def innerMinor(self, last : float) -> float:
         radius = self._radius - self._thickness
         length = last
@@ -39,9 +39,14 @@ from Rocket.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID
 from Rocket.Constants import STYLE_CAP_BAR, STYLE_CAP_CROSS
 from Rocket.Constants import TYPE_BLUNTED_CONE, TYPE_BLUNTED_OGIVE, TYPE_SECANT_OGIVE
 
+from Rocket.ShapeHandlers.AdaptiveSpline import sampleResolution, makeAdaptiveSpline
+from Rocket.LevelOfDetail import isPreview, PREVIEW_RESOLUTION
 from Rocket.Utilities import _err, validationError
+from Rocket.ShapeHandlers.ShapeHandlerBase import ShapeHandlerBase
+
+class NoseShapeHandler(ShapeHandlerBase, ABC):
+    REMOTE_DRAW = True
 
-class NoseShapeHandler(ABC):
     def __init__(self, obj : Any) -> None:
 
         # This gets changed when redrawn so it's very important to save a copy
@@ -66,7 +71,16 @@ class NoseShapeHandler(ABC):
         self._noseRadius = obj.BluntedDiameter.Value / 2.0
         self._coefficient = float(obj.Coefficient)
         self._ogiveRadius = obj.OgiveDiameter.Value / 2.0
-        self._resolution = int(obj.Resolution)
+        self._adaptive = bool(obj.AdaptiveResolution)
+        self._resolution = sampleResolution(self._adaptive, int(obj.Resolution))
+        self._tolerance = float(obj.ResolutionTolerance)
+        self._poleCount = 0
+
+        # Previews are drawn solid at a coarse resolution
+        if isPreview(obj):
+            self._style = STYLE_SOLID
+            self._adaptive = False
+            self._resolution = min(int(obj.Resolution), PREVIEW_RESOLUTION)
 
         # Apply scaling
         self._scale = 1.0
@@ -107,15 +121,32 @@ class NoseShapeHandler(ABC):
         ...
 
     def getRadius(self, x : float) -> float:
-        return 0.0
+        # Radius of the outer profile at x, measured from the tip. This is calculated
+        # from the parameters so the shape does not need to be drawn
+        if x <= 0.0:
+            return 0.0
+        if x >= self._length:
+            return self._radius
+        return self.profileRadius(x)
+
+    def profileRadius(self, x : float) -> float:
+        # Conical profile. Subclasses override this for curved profiles
+        return self._radius * x / self._length
 
     def makeSpline(self, points : list) -> Any:
-        spline = Part.BSplineCurve()
-        spline.buildFromPoles(points)
+        if self._adaptive:
+            spline = makeAdaptiveSpline(points, self._tolerance)
+        else:
+            spline = Part.BSplineCurve()
+            spline.buildFromPoles(points)
+        self._poleCount += spline.NbPoles
         return spline
 
     def isValidShape(self) -> bool:
         # Perform some general validations
+        if self._adaptive and self._tolerance <= 0:
+            validationError(translate('Rocket', "Resolution tolerance must be > 0"))
+            return False
         if self._style in [STYLE_HOLLOW, STYLE_CAPPED]:
             if self._thickness <= 0:
                 validationError(translate('Rocket', "For %s nose cones thickness must be > 0") % self._style)
@@ -242,6 +273,7 @@ class NoseShapeHandler(ABC):
 
         self._obj.Shape = shape
         self._obj.Placement = self._placement
+        self._obj.PoleCount = self._poleCount
 
     def drawSolidShape(self) -> Part.Solid:
         if not self.isValidShape():
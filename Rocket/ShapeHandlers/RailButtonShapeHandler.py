@@ -34,11 +34,16 @@ from Rocket.Constants import RAIL_BUTTON_AIRFOIL
 from Rocket.Constants import COUNTERSINK_ANGLE_60, COUNTERSINK_ANGLE_82, COUNTERSINK_ANGLE_90, COUNTERSINK_ANGLE_100, \
                             COUNTERSINK_ANGLE_110, COUNTERSINK_ANGLE_120, COUNTERSINK_ANGLE_NONE
 
+from Rocket.ShapeHandlers.ShapeTemplates import getTemplate, placeInstances, linearPlacements
 from Rocket.Utilities import _err, validationError
+from Rocket.ShapeHandlers.ShapeHandlerBase import ShapeHandlerBase
 
 translate = FreeCAD.Qt.translate
 
-class RailButtonShapeHandler():
+class RailButtonShapeHandler(ShapeHandlerBase):
+    REMOTE_DRAW = True
+    SHAPE_TEMPLATE = True
+
     def __init__(self, obj : Any) -> None:
 
         # This gets changed when redrawn so it's very important to save a copy
@@ -204,14 +209,8 @@ class RailButtonShapeHandler():
         return shape
 
     def drawInstances(self) -> Any:
-        buttons = []
-        base = self.drawSingle()
-        for i in range(self._instanceCount):
-            button = Part.Shape(base) # Create a copy
-            button.translate(FreeCAD.Vector(i * (self._length + self._separation),0,0))
-            buttons.append(button)
-
-        return Part.makeCompound(buttons)
+        base = getTemplate(self, self.drawSingle)
+        return placeInstances(base, linearPlacements(self._instanceCount, self._length + self._separation))
 
     def draw(self) -> None:
         if not self.isValidShape():
@@ -32,13 +32,17 @@ import math
 
 from Rocket.Constants import RAIL_GUIDE_BASE_CONFORMAL, RAIL_GUIDE_BASE_V
 
+from Rocket.ShapeHandlers.ShapeTemplates import getTemplate, placeInstances, linearPlacements
 from Rocket.Utilities import _err, validationError
+from Rocket.ShapeHandlers.ShapeHandlerBase import ShapeHandlerBase
 
 translate = FreeCAD.Qt.translate
 
 TOLERANCE_OFFSET = 0.5     # Distance to offset a vertex
 
-class RailGuideShapeHandler():
+class RailGuideShapeHandler(ShapeHandlerBase):
+    SHAPE_TEMPLATE = True
+
     def __init__(self, obj : Any) -> None:
 
         # This gets changed when redrawn so it's very important to save a copy
@@ -308,14 +312,9 @@ class RailGuideShapeHandler():
         return shape
 
     def drawInstances(self) -> Any:
-        guides = []
-        base = self.drawSingle()
-        for i in range(self._instanceCount):
-            guide = Part.Shape(base) # Create a copy
-            guide.translate(FreeCAD.Vector(i * (self._length + self._separation),0,0))
-            guides.append(guide)
-
-        return Part.makeCompound(guides)
+        # The base position depends on whether the guide is part of a rocket assembly
+        base = getTemplate(self, self.drawSingle, (self._obj.Proxy.isRocketAssembly(),))
+        return placeInstances(base, linearPlacements(self._instanceCount, self._length + self._separation))
 
     def draw(self) -> None:
         if not self.isValidShape():
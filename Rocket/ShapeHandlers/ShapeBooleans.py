@@ -0,0 +1,58 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Multi-argument boolean operations used when drawing shapes"""
+
+__title__ = "FreeCAD Shape Booleans"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from typing import Any
+
+# Fuzzy tolerance in mm. Helps the boolean algorithm with nearly coincident faces, such as
+# fillets and fin tabs meeting the fin root
+BOOLEAN_FUZZY = 1e-5
+
+def multiFuse(base : Any, tools : list) -> Any:
+    """
+        Fuse all the tools to the base shape in a single boolean operation. Chaining fuses
+        gets more expensive with every step as the intermediate shape grows.
+
+        The Part booleans run in parallel mode by default.
+    """
+    tools = [tool for tool in tools if tool is not None]
+    if base is None:
+        if len(tools) == 0:
+            return None
+        base = tools.pop(0)
+    if len(tools) == 0:
+        return base
+
+    return base.fuse(tools, BOOLEAN_FUZZY)
+
+def multiCut(base : Any, tools : list) -> Any:
+    """
+        Cut all the tools from the base shape in a single boolean operation
+    """
+    tools = [tool for tool in tools if tool is not None]
+    if len(tools) == 0:
+        return base
+
+    return base.cut(tools, BOOLEAN_FUZZY)
@@ -0,0 +1,34 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Base class for the shape handlers"""
+
+__title__ = "FreeCAD Shape Handler Base"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+class ShapeHandlerBase():
+    # Handlers that draw the shape using only the values read from the object in __init__ can
+    # be drawn in a worker process during a parallel recompute
+    REMOTE_DRAW = False
+
+    # Handlers whose geometry depends only on their own parameters build identical geometry
+    # once, and share it between instances and components. See ShapeTemplates
+    SHAPE_TEMPLATE = False
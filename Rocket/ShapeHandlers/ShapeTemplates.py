@@ -0,0 +1,150 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Shared shape templates for repeated hardware"""
+
+__title__ = "FreeCAD Shape Templates"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from collections import OrderedDict
+from typing import Any, Callable
+
+import FreeCAD
+import Part
+
+from Rocket.ClusterConfiguration import ClusterConfiguration
+from Rocket.Utilities import _log
+
+# Maximum number of unique geometries kept. The least recently used are discarded first
+MAX_TEMPLATES = 256
+
+# Parameters are rounded so values that differ only by floating point noise share a template
+KEY_PRECISION = 9
+
+# Handler attributes that locate or count instances rather than define their geometry
+_INSTANCE_ATTRIBUTES = ("_obj", "_placement", "_instanceCount", "_separation", "_poleCount",
+                        "_configuration", "_rotation", "_finSet", "_fincount", "_finSpacing")
+
+# Marker for parameters that can't be compared, such as linked sketches
+_UNKNOWN = object()
+
+# Each entry is (shape, pole count)
+_templates = OrderedDict()
+_hits = 0
+_misses = 0
+
+def _keyValue(value : Any) -> Any:
+    if isinstance(value, float):
+        return round(value, KEY_PRECISION)
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, FreeCAD.Vector):
+        return _keyValue((value.x, value.y, value.z))
+    if isinstance(value, FreeCAD.Placement):
+        return _keyValue((value.Base.x, value.Base.y, value.Base.z) + tuple(value.Rotation.Q))
+    if isinstance(value, ClusterConfiguration):
+        return _keyValue((value.getXMLName(), value.getPoints()))
+    if isinstance(value, (list, tuple)):
+        values = tuple(_keyValue(item) for item in value)
+        if _UNKNOWN in values:
+            return _UNKNOWN
+        return values
+    return _UNKNOWN
+
+def handlerKey(handler : Any, extra : tuple = (), exclude : tuple = ("_obj", "_poleCount")) -> tuple | None:
+    """
+        Build a key from the parameters read by the handler. Handlers whose geometry
+        depends on values that can't be compared return None, so their shapes aren't cached.
+    """
+    values = [type(handler).__name__]
+    for name, value in sorted(vars(handler).items()):
+        if name in exclude:
+            continue
+        keyValue = _keyValue(value)
+        if keyValue is _UNKNOWN:
+            _log("{} isn't cached: '{}' of type {} can't be compared".format(type(handler).__name__, name,
+                                                                                 type(value).__name__))
+            return None
+        values.append((name, keyValue))
+    for value in extra:
+        keyValue = _keyValue(value)
+        if keyValue is _UNKNOWN:
+            _log("{} isn't cached: a value of type {} can't be compared".format(type(handler).__name__,
+                                                                                type(value).__name__))
+            return None
+        values.append(keyValue)
+    return tuple(values)
+
+def templateKey(handler : Any, extra : tuple = ()) -> tuple | None:
+    """ The key for the handler geometry, ignoring where and how often it is placed """
+    if not getattr(handler, "SHAPE_TEMPLATE", False):
+        return None
+
+    return handlerKey(handler, extra, _INSTANCE_ATTRIBUTES)
+
+def getTemplate(handler : Any, build : Callable[[], Any], extra : tuple = ()) -> Any:
+    """
+        Return the shape for the handler geometry, building it only the first time the
+        geometry is seen. The returned shape shares its topology with the template, so it
+        can be moved without affecting other instances.
+    """
+    global _hits, _misses
+
+    key = templateKey(handler, extra)
+    if key is None:
+        return build()
+
+    entry = _templates.get(key)
+    if entry is None:
+        _misses += 1
+        poles = getattr(handler, "_poleCount", 0)
+        shape = build()
+        if shape is None:
+            return None
+        entry = (shape, getattr(handler, "_poleCount", 0) - poles)
+        _templates[key] = entry
+        if len(_templates) > MAX_TEMPLATES:
+            _templates.popitem(last=False)
+    else:
+        _hits += 1
+        _templates.move_to_end(key)
+        if hasattr(handler, "_poleCount"):
+            handler._poleCount += entry[1]
+
+    return entry[0].moved(FreeCAD.Placement())
+
+def placeInstances(base : Any, placements : list) -> Part.Compound:
+    """ A compound of located copies of the base shape, all sharing the base topology """
+    return Part.makeCompound([base.moved(placement) for placement in placements])
+
+def linearPlacements(count : int, spacing : float) -> list:
+    return [FreeCAD.Placement(FreeCAD.Vector(i * spacing, 0, 0), FreeCAD.Rotation()) for i in range(count)]
+
+def clearTemplates() -> None:
+    global _hits, _misses
+
+    _templates.clear()
+    _hits = 0
+    _misses = 0
+
+def templateStatistics() -> tuple[int, int, int]:
+    """ Returns (templates, hits, misses) """
+    return (len(_templates), _hits, _misses)
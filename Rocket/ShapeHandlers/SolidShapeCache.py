@@ -0,0 +1,85 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Filled shapes cached against the inputs of the display shape"""
+
+__title__ = "FreeCAD Solid Shape Cache"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from typing import Any, Callable
+
+import FreeCAD
+
+from Rocket.ShapeHandlers.ShapeTemplates import handlerKey
+
+class SolidShapeCache:
+    """
+        Keeps the filled shape used for CFD alongside the inputs of the display shape.
+        Both are keyed on the same handler parameters, so a change that redraws the
+        display shape also discards the filled shape.
+    """
+    def __init__(self) -> None:
+        self._key = None
+        self._handler = None
+        self._solid = None
+
+    def invalidate(self) -> None:
+        self._key = None
+        self._handler = None
+        self._solid = None
+
+    def update(self, handler : Any) -> None:
+        """ Record the handler used to draw the display shape. Call before drawing """
+        key = handlerKey(handler)
+        if key is None or key != self._key:
+            self._solid = None
+        self._key = key
+        self._handler = handler
+
+    def getSolid(self, obj : Any, makeHandler : Callable[[Any], Any]) -> Any:
+        """
+            Return the filled shape, drawing it only if the inputs have changed since it
+            was last drawn. The handler from the last recompute is reused unless the
+            object has been changed since.
+        """
+        handler = self._handler
+        if handler is None or "Touched" in obj.State:
+            handler = makeHandler(obj)
+            if handler is None:
+                return None
+
+            key = handlerKey(handler)
+            if key is None or key != self._key:
+                self._solid = None
+            self._key = key
+            self._handler = handler
+
+        if self._solid is None:
+            solid = handler.drawSolidShape()
+            if solid is None:
+                return None
+            if self._key is None:
+                # Not comparable, so can't be reused
+                return solid
+            self._solid = solid
+
+        # A located copy, so callers can move it without changing the cached shape
+        return self._solid.moved(FreeCAD.Placement())
@@ -41,11 +41,16 @@ translate = FreeCAD.Qt.translate
 from Rocket.Constants import STYLE_CAPPED, STYLE_HOLLOW, STYLE_SOLID, STYLE_SOLID_CORE
 from Rocket.Constants import STYLE_CAP_BAR, STYLE_CAP_CROSS
 
+from Rocket.ShapeHandlers.AdaptiveSpline import sampleResolution, makeAdaptiveSpline
+from Rocket.LevelOfDetail import isPreview, PREVIEW_RESOLUTION
 from Rocket.Utilities import _err, validationError
+from Rocket.ShapeHandlers.ShapeHandlerBase import ShapeHandlerBase
 
 CLIP_PRECISION = 0.00001
 
-class TransitionShapeHandler():
+class TransitionShapeHandler(ShapeHandlerBase):
+    REMOTE_DRAW = True
+
     def __init__(self, obj : Any) -> None:
 
         # This gets changed when redrawn so it's very important to save a copy
@@ -67,7 +72,16 @@ class TransitionShapeHandler():
         self._aftAuto = bool(obj.AftAutoDiameter)
         self._coreRadius = float(obj.CoreDiameter) / 2.0
         self._coefficient = float(obj.Coefficient)
-        self._resolution = int(obj.Resolution)
+        self._adaptive = bool(obj.AdaptiveResolution)
+        self._resolution = sampleResolution(self._adaptive, int(obj.Resolution))
+        self._tolerance = float(obj.ResolutionTolerance)
+        self._poleCount = 0
+
+        # Previews are drawn solid at a coarse resolution
+        if isPreview(obj):
+            self._style = STYLE_SOLID
+            self._adaptive = False
+            self._resolution = min(int(obj.Resolution), PREVIEW_RESOLUTION)
 
         self._clipped = (bool(obj.Clipped) and self.isClippable()) # lgtm [py/init-calls-subclass]
         self._clipLength = -1.0
@@ -108,9 +122,12 @@ class TransitionShapeHandler():
         self._obj = obj
 
     def makeSpline(self, points : list) -> Any:
-
-        spline = Part.BSplineCurve()
-        spline.buildFromPoles(points)
+        if self._adaptive:
+            spline = makeAdaptiveSpline(points, self._tolerance)
+        else:
+            spline = Part.BSplineCurve()
+            spline.buildFromPoles(points)
+        self._poleCount += spline.NbPoles
         return spline
 
     def isClippable(self) -> bool:
@@ -119,6 +136,9 @@ class TransitionShapeHandler():
     def isValidShape(self) -> bool:
 
         #Perform some general validations
+        if self._adaptive and self._tolerance <= 0:
+            validationError(translate('Rocket', "Resolution tolerance must be > 0"))
+            return False
         if self._style in [STYLE_HOLLOW, STYLE_CAPPED]:
             if self._thickness <= 0:
                 validationError(translate('Rocket', "For %s transitions thickness must be > 0") % self._style)
@@ -384,6 +404,7 @@ class TransitionShapeHandler():
 
         self._obj.Shape = shape
         self._obj.Placement = self._placement
+        self._obj.PoleCount = self._poleCount
 
     def _generateCurve(self, r1 : float, r2 : float, length : float, min : float = 0.0, max : float = 0.0) -> Any:
         """
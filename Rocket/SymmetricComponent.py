@@ -26,6 +26,7 @@ __url__ = "https://www.davesrocketshop.com"
 
 from abc import abstractmethod
 from typing import Any
+import math
 
 from Rocket.Utilities import clamp
 from Rocket.interfaces.BoxBounded import BoxBounded
@@ -35,6 +36,7 @@ from Rocket.RocketComponent import RocketComponent
 from Rocket.ComponentAssembly import ComponentAssembly
 from Rocket.util.BoundingBox import BoundingBox
 from Rocket.util.Coordinate import Coordinate
+from Rocket.util.Quadrature import integrate, derivative
 
 # Class for an axially symmetric rocket component generated by rotating
 # a function y=f(x) >= 0 around the x-axis (eg. tube, cone, etc.)
@@ -103,6 +105,38 @@ class SymmetricComponent(RocketComponent, BoxBounded, RadialParent):
     def getMaxRadius(self) -> float:
         return max(self.getForeRadius(), self.getAftRadius())
 
+    """
+        Return the area of the component wall in a cross section at position x.
+    """
+    def getCrossSectionArea(self, pos : float) -> float:
+        outer = self.getOuterRadius(pos)
+        inner = clamp(self.getInnerRadius(pos), 0.0, outer)
+        return math.pi * (outer * outer - inner * inner)
+
+    """
+        The volume, outer surface area and centroid are integrated along the profile
+        from the radius functions. The shoulders and end caps are not included.
+    """
+    def getComponentVolume(self) -> float:
+        return integrate(self.getCrossSectionArea, 0.0, self.getLength())
+
+    def getComponentSurfaceArea(self) -> float:
+        length = self.getLength()
+
+        def band(pos : float) -> float:
+            slope = derivative(self.getOuterRadius, pos, 0.0, length)
+            return 2.0 * math.pi * self.getOuterRadius(pos) * math.sqrt(1.0 + slope * slope)
+
+        return integrate(band, 0.0, length)
+
+    def getComponentCentroid(self) -> Coordinate:
+        volume = self.getComponentVolume()
+        if volume <= 0.0:
+            return super().getComponentCentroid()
+
+        moment = integrate(lambda pos: pos * self.getCrossSectionArea(pos), 0.0, self.getLength())
+        return Coordinate(moment / volume, 0, 0)
+
 
     """
         Return the component wall thickness.
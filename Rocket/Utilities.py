@@ -28,6 +28,8 @@ from typing import Any
 
 import FreeCAD
 import math
+import os
+import sys
 
 from PySide import QtCore
 
@@ -43,8 +45,19 @@ def _wrn(message : str) -> None:
     """Write warnings to the console including the line ending."""
     FreeCAD.Console.PrintWarning(message + "\n")
 
+def _log(message : str) -> None:
+    """Write debug messages to the log including the line ending."""
+    FreeCAD.Console.PrintLog(message + "\n")
+
+# When set, error messages are collected here instead of being written to the console.
+# Used when drawing shapes in a worker process
+_errorLog = None
+
 def _err(message : str) -> None:
     """Write errors  to the console including the line ending."""
+    if _errorLog is not None:
+        _errorLog.append(message)
+        return
     FreeCAD.Console.PrintError(message + "\n")
 
 def validationError(message : str) -> None:
@@ -127,4 +140,15 @@ def oldMaterials() -> bool:
     return False
 
 def newMaterials() -> bool:
-    return not oldMaterials()
\ No newline at end of file
+    return not oldMaterials()
+
+def pythonExecutable() -> str:
+    """ The Python interpreter used to start worker processes """
+    # When running inside FreeCAD, sys.executable may be the FreeCAD binary rather than
+    # the Python interpreter it ships with
+    directory = os.path.dirname(sys.executable)
+    for name in ["python", "python3", "python.exe"]:
+        executable = os.path.join(directory, name)
+        if os.path.isfile(executable):
+            return executable
+    return sys.executable
@@ -0,0 +1,223 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Run multi CFD sweeps without the GUI
+
+The sweep can be started from Python:
+
+    from Rocket.cfd.BatchCFD import runSweep
+    runSweep("rocket.FCStd", aoaList=[0, 2, 4], coreBudget=16)
+
+or from the command line using FreeCADCmd:
+
+    FreeCADCmd -c "import sys; from Rocket.cfd.BatchCFD import main; sys.exit(main(['rocket.FCStd', '--aoa', '0,2,4']))"
+
+Progress is written to standard output as one JSON object per line, so it can be followed by
+other tools. Anything else written to standard output while the sweep runs, including the
+FreeCAD console, is sent to standard error instead. Pressing Ctrl+C stops the running cases
+and still reports the cases that finished.
+"""
+
+__title__ = "FreeCAD Batch CFD"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import sys
+import time
+
+import FreeCAD
+
+from PySide import QtCore
+
+from Rocket.cfd.FeatureMultiCFDAnalysis import FeatureMultiCFDAnalysis
+from Rocket.cfd.SweepScheduler import CASE_SUCCESS
+
+# Interval in milliseconds at which Python is woken while the event loop waits, so Ctrl+C is handled
+INTERRUPT_INTERVAL = 200
+
+class JsonLog:
+    """ Writes progress events as JSON lines to the stream, standard output by default """
+
+    def __init__(self, stream=None):
+        self._stream = stream if stream is not None else sys.stdout
+        self._start = time.time()
+
+    def event(self, event, **values):
+        record = {"time" : round(time.time(), 3), "elapsed" : round(time.time() - self._start, 3), "event" : event}
+        record.update(values)
+        self._stream.write(json.dumps(record) + "\n")
+        self._stream.flush()
+
+    def message(self, message="", colourType=None):
+        self.event("message", level=colourType or "Text", message=str(message))
+
+def findAnalysis(doc, analysis=None, rocket=None):
+    """ Find a multi CFD analysis in the document by name or label, or by the rocket it studies """
+    for obj in doc.Objects:
+        if not isinstance(getattr(obj, "Proxy", None), FeatureMultiCFDAnalysis):
+            continue
+        if analysis is not None and analysis not in (obj.Name, obj.Label):
+            continue
+        if rocket is not None:
+            studied = getattr(obj, "Rocket", None)
+            if studied is None or rocket not in (studied.Name, studied.Label):
+                continue
+        return obj
+    return None
+
+@contextlib.contextmanager
+def _jsonOutput():
+    """
+        Send everything written to standard output to standard error, and return a stream on the
+        original standard output for the JSON lines. The FreeCAD console writes to the file
+        descriptor directly, so redirecting sys.stdout alone isn't enough.
+    """
+    sys.stdout.flush()
+    saved = os.dup(1)
+    os.dup2(2, 1)
+    stream = os.fdopen(saved, "w", closefd=False)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            yield stream
+    finally:
+        stream.flush()
+        sys.stdout.flush()
+        os.dup2(saved, 1)
+        os.close(saved)
+
+@contextlib.contextmanager
+def _interruptHandler(handler):
+    """ Call the handler on Ctrl+C while in the block, when running on the main thread """
+    try:
+        previous = signal.signal(signal.SIGINT, handler)
+    except ValueError:
+        # Signal handlers can only be set from the main thread
+        yield
+        return
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+def runSweep(documentPath, analysis=None, rocket=None, aoaList=None, coreBudget=None, reuseMeshFolder=False,
+             report=True, log=None):
+    """
+        Run the angle of attack sweep for a multi CFD analysis in a saved document, and
+        optionally generate the report. Returns the cases of the sweep.
+    """
+    with _jsonOutput() as stream:
+        if log is None:
+            log = JsonLog(stream)
+        return _runSweep(documentPath, analysis, rocket, aoaList, coreBudget, reuseMeshFolder, report, log)
+
+def _runSweep(documentPath, analysis, rocket, aoaList, coreBudget, reuseMeshFolder, report, log):
+    # Import here so the solver modules are only loaded when a sweep is run
+    from Rocket.cfd.MultiCFDSweep import MultiCFDSweep
+
+    # The solver processes are driven by Qt signals, so an event loop is needed
+    app = QtCore.QCoreApplication.instance()
+    if app is None:
+        app = QtCore.QCoreApplication(sys.argv[:1])
+
+    doc = FreeCAD.openDocument(documentPath)
+    obj = findAnalysis(doc, analysis, rocket)
+    if obj is None:
+        log.event("error", message="No multi CFD analysis found")
+        FreeCAD.closeDocument(doc.Name)
+        return []
+    if aoaList is not None:
+        obj.AOAList = [float(angle) for angle in aoaList]
+
+    log.event("start", document=documentPath, analysis=obj.Name, aoa=list(obj.AOAList),
+              coreBudget=coreBudget, reuseMeshFolder=reuseMeshFolder)
+
+    loop = QtCore.QEventLoop()
+    sweep = MultiCFDSweep(obj, reuseMeshFolder=reuseMeshFolder, coreBudget=coreBudget,
+                          messageHook=log.message, finishedHook=loop.quit)
+
+    interrupted = []
+    def interrupt(signum, frame):
+        interrupted.append(signum)
+        loop.quit()
+
+    # Python signal handlers only run between bytecodes, so the timer wakes the interpreter
+    # while Qt waits on the solver processes
+    timer = QtCore.QTimer()
+    timer.timeout.connect(lambda: None)
+    with _interruptHandler(interrupt):
+        timer.start(INTERRUPT_INTERVAL)
+        sweep.start()
+        if sweep.isRunning() and len(interrupted) == 0:
+            loop.exec_()
+        timer.stop()
+    if len(interrupted) > 0:
+        sweep.stop()
+        log.event("stopped")
+
+    cases = sweep.getCases()
+    for case in cases:
+        log.event("case", aoa=case.aoa, status=case.status, message=case.message, elapsed=round(case.elapsed(), 3))
+
+    if any(case.status == CASE_SUCCESS for case in cases):
+        from Rocket.cfd.Reports.CFDReport import CFDReport
+        from Rocket.cfd.ResultsStore import recordSweep, defaultStorePath
+
+        cfdReport = CFDReport(obj)
+        if report:
+            log.event("report", message="Preparing report")
+            cfdReport.generate()
+            log.event("report", path=cfdReport.getPath())
+        else:
+            cfdReport.collectStats()
+
+        count = recordSweep(obj, cfdReport)
+        log.event("results", count=count, store=defaultStorePath())
+
+    log.event("finished", status=sweep.getStatusPath())
+    FreeCAD.closeDocument(doc.Name)
+    return cases
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a multi CFD angle of attack sweep without the GUI")
+    parser.add_argument("document", help="FreeCAD document containing the multi CFD analysis")
+    parser.add_argument("--analysis", help="name or label of the analysis, when there is more than one")
+    parser.add_argument("--rocket", help="name or label of the rocket studied by the analysis")
+    parser.add_argument("--aoa", help="comma separated angles of attack, replacing those in the analysis")
+    parser.add_argument("--cores", type=int, help="total number of cores used by concurrent cases")
+    parser.add_argument("--reuse-mesh-folder", action="store_true", help="use a single mesh folder, running one case at a time")
+    parser.add_argument("--no-report", action="store_true", help="don't generate the report")
+    args = parser.parse_args(argv)
+
+    aoaList = None
+    if args.aoa:
+        aoaList = [float(angle) for angle in args.aoa.split(",") if len(angle.strip()) > 0]
+
+    cases = runSweep(args.document, analysis=args.analysis, rocket=args.rocket, aoaList=aoaList,
+                     coreBudget=args.cores, reuseMeshFolder=args.reuse_mesh_folder, report=not args.no_report)
+    failed = [case for case in cases if case.status != CASE_SUCCESS]
+    return 1 if len(cases) == 0 or len(failed) > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,8 @@ import Part
 
 from CfdOF.Mesh.CfdMesh import CfdMesh, ViewProviderCfdMesh
 
+from Rocket.ShapeHandlers.ShapeBooleans import multiFuse
+from Rocket.cfd.parea import calculateAnalyticArea
 from Rocket.cfd.FeatureCFDRocket import FeatureCFDRocket
 from Rocket.cfd.FeatureMultiCFDAnalysis import FeatureMultiCFDAnalysis
 from Rocket.cfd.FeatureWindTunnel import FeatureWindTunnel
@@ -42,25 +44,39 @@ def getProxy(obj):
         return obj.Proxy
     return obj
 
-def createSolid(obj):
-    ''' Generates a solid compound object '''
-    shape = None
+def _collectSolids(obj, solids):
     for current in getProxy(obj).getChildren():
         if hasattr(current, "Shape"):
             solid = getProxy(current).getSolidShape(current)
             if solid and solid.isValid():
-                if shape == None:
-                    shape = solid
-                else:
-                    shape = Part.makeCompound([shape, solid])
-        child = createSolid(current)
-        if child and child.isValid():
-            if shape == None:
-                shape = child
-            else:
-                shape = Part.makeCompound([shape, child])
-
-    return shape
+                solids.append(solid)
+        _collectSolids(current, solids)
+
+def createSolid(obj, fuse=False):
+    """
+        Generates a solid compound object. The filled solids are gathered in a single
+        traversal and combined in one flat compound, rather than nesting a compound for
+        each part.
+
+        When fuse is True touching parts are fused into a single watertight solid for
+        the mesher. The compound is returned if the fuse fails.
+    """
+    solids = []
+    _collectSolids(obj, solids)
+    if len(solids) == 0:
+        return None
+
+    if fuse:
+        try:
+            shape = multiFuse(None, solids).removeSplitter()
+            if shape.isValid():
+                return shape
+        except Part.OCCError:
+            pass
+
+    if len(solids) == 1:
+        return solids[0]
+    return Part.makeCompound(solids)
 
 def caliber(obj):
     ''' Get the caliber of the component '''
@@ -75,6 +91,24 @@ def caliber(obj):
 
     return diameter
 
+def _finFrontalAreas(obj, radius, areas):
+    for current in getProxy(obj).getChildren():
+        proxy = getProxy(current)
+        if hasattr(proxy, "getFinFrontalArea"):
+            # Fins on a smaller tube are partly hidden behind the largest diameter
+            areas.append(proxy.getFinFrontalArea(radius))
+        _finFrontalAreas(current, radius, areas)
+
+def analyticFrontalArea(obj):
+    """
+        Frontal area at zero angle of attack, calculated from the maximum body radius and
+        the fin profiles without meshing. Only valid for axisymmetric bodies with fins.
+    """
+    radius = caliber(obj) / 2.0
+    areas = []
+    _finFrontalAreas(obj, radius, areas)
+    return calculateAnalyticArea(radius, areas)
+
 def finThickness(obj):
     ''' Get the caliber of the component '''
     thickness = 0.0
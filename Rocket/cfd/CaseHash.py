@@ -0,0 +1,118 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Hashes identifying CFD meshes and cases"""
+
+__title__ = "FreeCAD CFD Case Hash"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import hashlib
+
+from CfdOF import CfdTools
+
+# Properties that name or locate the output rather than change the result
+_IGNORED_PROPERTIES = ("Label", "Label2", "CaseName", "InputCaseName", "Visibility", "ExpressionEngine",
+                       "Proxy", "Shape", "Group", "NeedsMeshRewrite", "NeedsMeshRerun", "NeedsCaseRewrite")
+
+def _digest(value):
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+def shapeDigest(shape):
+    """ A digest of the shape geometry, including its placement """
+    if shape is None or shape.isNull():
+        return ""
+    return _digest(shape.exportBrepToString() + str(shape.Placement))
+
+def _valueText(value, digests):
+    # Linked objects are identified by name and geometry, so moving a refinement region changes the hash
+    if hasattr(value, "Name") and hasattr(value, "PropertiesList"):
+        text = value.Name
+        if hasattr(value, "Shape"):
+            if value.Name not in digests:
+                digests[value.Name] = shapeDigest(value.Shape)
+            text += ":" + digests[value.Name]
+        return text
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_valueText(item, digests) for item in value) + "]"
+    return str(value)
+
+def objectSettings(obj, digests=None):
+    """ The property values of a document object as text """
+    if digests is None:
+        digests = {}
+    settings = []
+    for name in sorted(obj.PropertiesList):
+        if name in _IGNORED_PROPERTIES:
+            continue
+        settings.append("{}={}".format(name, _valueText(obj.getPropertyByName(name), digests)))
+    return ";".join(settings)
+
+def meshHash(analysis):
+    """
+        Hash of everything the mesh depends on: the meshed part geometry, the mesher
+        settings and the mesh refinements. Cases with the same hash can share a mesh.
+    """
+    mesher = CfdTools.getMeshObject(analysis)
+    if mesher is None:
+        return None
+
+    digests = {}
+    parts = [objectSettings(mesher, digests)]
+    if getattr(mesher, "Part", None) is not None:
+        parts.append(shapeDigest(mesher.Part.Shape))
+    for child in getattr(mesher, "Group", []):
+        parts.append(objectSettings(child, digests))
+    return _digest("\n".join(parts))
+
+def designHash(analysis):
+    """
+        Hash of the rocket geometry under study. Results for the same design can be compared
+        across documents and sweeps.
+    """
+    return shapeDigest(analysis.Shape)
+
+def _conditionSettings(analysis, meshKey):
+    mesher = CfdTools.getMeshObject(analysis)
+    digests = {}
+    parts = [str(meshKey), "RotateFlow={}".format(getattr(analysis, "RotateFlow", False))]
+    for child in analysis.Group:
+        if mesher is not None and child.Name == mesher.Name:
+            continue
+        parts.append(objectSettings(child, digests))
+    return parts
+
+def conditionsHash(analysis, meshKey):
+    """
+        Hash of everything the cases of a sweep share: the mesh, the physics, boundary
+        conditions, solver and reporting settings. Results for the same design at
+        different conditions have different hashes.
+    """
+    return _digest("\n".join(_conditionSettings(analysis, meshKey)))
+
+def caseHash(analysis, aoa, meshKey):
+    """
+        Hash of everything a single case depends on: the conditions of the sweep and the
+        angle of attack. The list of angles in the sweep is not included, so adding angles
+        leaves existing cases valid.
+    """
+    parts = _conditionSettings(analysis, meshKey)
+    parts.insert(1, "AOA={}".format(aoa))
+    return _digest("\n".join(parts))
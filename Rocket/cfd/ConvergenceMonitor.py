@@ -0,0 +1,136 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for stopping CFD cases once the solution has converged"""
+
+__title__ = "FreeCAD CFD Convergence Monitor"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import re
+
+import numpy as np
+
+from Rocket.cfd.Reports.DatReader import readDatFiles, postProcessingFiles, COEFFICIENT_COLUMNS
+from Rocket.cfd.Reports.ResidualLog import RESIDUAL_FIELDS
+
+# Cd and Cl columns in the force coefficient file
+CD_COLUMN = 1
+CL_COLUMN = 4
+
+# Iterations between convergence checks
+CHECK_INTERVAL = 10
+
+_STOP_AT = re.compile(r"^(\s*stopAt\s+)\w+\s*;", re.MULTILINE)
+_END_TIME = re.compile(r"^\s*endTime\s+([^;]+);", re.MULTILINE)
+
+def _controlDictPath(caseDirectory : str) -> str:
+    return os.path.join(caseDirectory, "system", "controlDict")
+
+def readEndTime(caseDirectory : str) -> float | None:
+    try:
+        with open(_controlDictPath(caseDirectory), "r") as controlDict:
+            match = _END_TIME.search(controlDict.read())
+        if match is not None:
+            return float(match.group(1))
+    except (OSError, ValueError):
+        pass
+    return None
+
+def writeStopTrigger(caseDirectory : str) -> bool:
+    """
+        Ask a running solver to write the current time step and stop. OpenFOAM rereads
+        the control dictionary while running, so this stops the solver cleanly.
+    """
+    path = _controlDictPath(caseDirectory)
+    try:
+        with open(path, "r") as controlDict:
+            text = controlDict.read()
+        text, count = _STOP_AT.subn(r"\1writeNow;", text)
+        if count == 0:
+            return False
+        with open(path, "w") as controlDict:
+            controlDict.write(text)
+    except OSError:
+        return False
+    return True
+
+class ConvergenceMonitor:
+    """
+        Watches a running case and stops it once the residuals are below the tolerance
+        and Cd and Cl have been steady over the window. A resumed case gives the time it
+        started from, so only the coefficients written by this run are considered.
+    """
+
+    def __init__(self, caseDirectory : str, window : int, coefficientTolerance : float,
+                 residualTolerance : float, startTime : float = 0.0) -> None:
+        self._caseDirectory = caseDirectory
+        self._window = max(2, window)
+        self._coefficientTolerance = coefficientTolerance
+        self._residualTolerance = residualTolerance
+        self._startTime = startTime
+
+        self._lastCheck = 0
+        self.stopped = False
+        self.stopTime = None
+        self.endTime = None
+
+    def _residualsConverged(self, runner) -> bool:
+        for field in RESIDUAL_FIELDS:
+            values = getattr(runner, field + "Residuals", [])
+            if len(values) > 0 and values[-1] > self._residualTolerance:
+                return False
+        return True
+
+    def _coefficientsConverged(self) -> bool:
+        paths = postProcessingFiles(self._caseDirectory, "ForceCoefficientReportingFunction", "coefficient.dat",
+                                    self._startTime)
+        try:
+            table = readDatFiles(paths, COEFFICIENT_COLUMNS, self._window)
+        except OSError:
+            return False
+        table = table[table[:, 0] > self._startTime]
+        if table.shape[0] < self._window:
+            return False
+        spread = max(np.std(table[:, CD_COLUMN]), np.std(table[:, CL_COLUMN]))
+        return spread <= self._coefficientTolerance
+
+    def update(self, runner) -> bool:
+        """ Check for convergence using the solver output parsed by the runner. True once the case is stopped """
+        if self.stopped:
+            return True
+
+        iterations = len(runner.time)
+        if iterations < self._window or iterations - self._lastCheck < CHECK_INTERVAL:
+            return False
+        self._lastCheck = iterations
+
+        if self._residualsConverged(runner) and self._coefficientsConverged():
+            if writeStopTrigger(self._caseDirectory):
+                self.stopped = True
+                self.stopTime = float(runner.time[-1])
+                self.endTime = readEndTime(self._caseDirectory)
+        return self.stopped
+
+    def iterationsSaved(self) -> int:
+        if not self.stopped or self.endTime is None:
+            return 0
+        return max(0, int(round(self.endTime - self.stopTime)))
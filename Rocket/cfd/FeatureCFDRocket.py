@@ -30,18 +30,20 @@ import Part
 
 from Rocket.Constants import FEATURE_CFD_ROCKET
 
-from Rocket.cfd.parea import calculateProjectedArea
+from Rocket.cfd.parea import calculateProjectedArea, calculateRasterArea, DEFAULT_PIXEL_SIZE
 
 translate = FreeCAD.Qt.translate
 
 _linearDeflection = 0.5 # Linear deflection for a rough mesh with a fast calculation
 
-def calcFrontalArea(shape):
+def calcFrontalArea(shape, estimate=False, pixelSize=DEFAULT_PIXEL_SIZE):
     # Create a crude mesh and project it on to the YZ plane to caclulate the frontal area
     mesh = MeshPart.meshFromShape(shape, LinearDeflection=_linearDeflection)
 
-    area = calculateProjectedArea(mesh)
-    return area
+    # The rasterized estimate is faster, with an error of about pixelSize along the silhouette edge
+    if estimate:
+        return calculateRasterArea(mesh, pixelSize)
+    return calculateProjectedArea(mesh)
 
 def applyTranslations(solid, center=0.0, aoa=0.0, rotation=0.0):
     solid1 = Part.makeCompound([solid]) # Needed to create a copy so translations aren't applied multiple times
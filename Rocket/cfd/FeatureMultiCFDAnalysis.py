@@ -56,6 +56,16 @@ class FeatureMultiCFDAnalysis(CfdAnalysis.CfdAnalysis):
             obj.addProperty('App::PropertyLinkGlobal', 'Rocket', 'RocketComponent', translate('App::Property', 'The rocket under study'))
         if not hasattr(obj,"AverageLastN"):
             obj.addProperty('App::PropertyInteger', 'AverageLastN', 'RocketComponent', translate('App::Property', 'Use average of last N values')).AverageLastN = 5
+        if not hasattr(obj,"RotateFlow"):
+            obj.addProperty('App::PropertyBool', 'RotateFlow', 'RocketComponent', translate('App::Property', 'Rotate the free stream instead of the rocket, so one mesh is used for every AOA')).RotateFlow = False
+        if not hasattr(obj,"StopConverged"):
+            obj.addProperty('App::PropertyBool', 'StopConverged', 'Convergence', translate('App::Property', 'Stop each case once the convergence criteria are met')).StopConverged = False
+        if not hasattr(obj,"ConvergenceWindow"):
+            obj.addProperty('App::PropertyInteger', 'ConvergenceWindow', 'Convergence', translate('App::Property', 'Number of iterations over which the coefficients must be steady')).ConvergenceWindow = 100
+        if not hasattr(obj,"CoefficientTolerance"):
+            obj.addProperty('App::PropertyFloat', 'CoefficientTolerance', 'Convergence', translate('App::Property', 'Largest standard deviation of Cd and Cl over the convergence window')).CoefficientTolerance = 1e-4
+        if not hasattr(obj,"ResidualTolerance"):
+            obj.addProperty('App::PropertyFloat', 'ResidualTolerance', 'Convergence', translate('App::Property', 'Largest residual of any field at convergence')).ResidualTolerance = 1e-3
 
     # def __getstate__(self):
     #     return self.Type, self.version
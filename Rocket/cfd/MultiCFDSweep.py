@@ -0,0 +1,359 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for running a multi CFD angle of attack sweep"""
+
+__title__ = "FreeCAD Multi CFD Sweep"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import os
+import math
+import shutil
+
+translate = FreeCAD.Qt.translate
+
+from CfdOF import CfdTools
+from CfdOF.CfdConsoleProcess import CfdConsoleProcess
+from CfdOF.Mesh import CfdMeshTools
+from CfdOF.Solve import CfdCaseWriterFoam
+from CfdOF.Solve.CfdRunnableFoam import CfdRunnableFoam
+
+from Rocket.cfd.CaseHash import meshHash, caseHash
+from Rocket.cfd.ConvergenceMonitor import ConvergenceMonitor
+from Rocket.cfd.SweepScheduler import SweepCase, SweepScheduler, availableCores, processesPerCase, concurrentCases, \
+    meshIsCurrent, caseIsCurrent, writeCaseHash, latestTime, writeResumeScript, readRunStatus, canResume, \
+    CASE_SUCCESS, ABORT_MESSAGE
+
+class FoamRunner(CfdRunnableFoam):
+
+    def __init__(self, analysis=None, solver=None):
+        super().__init__(analysis, solver)
+
+    def constructReportingFunctionPlotters(self):
+        # No graphs for reporting functions
+        pass
+
+    def initMonitors(self):
+        pass
+
+class _WaitCursor:
+    """ Show the wait cursor while writing cases, when there is a GUI """
+    def __enter__(self):
+        if FreeCAD.GuiUp:
+            from PySide.QtGui import QApplication
+            from PySide.QtCore import Qt
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if FreeCAD.GuiUp:
+            from PySide.QtGui import QApplication
+            QApplication.restoreOverrideCursor()
+
+class MultiCFDSweep:
+    """
+        Runs the angle of attack sweep of a multi CFD analysis. Each case is written,
+        meshed and solved through the sweep scheduler. Progress is reported through the
+        message hook, so the sweep can be run from the task panel or without a GUI.
+    """
+
+    def __init__(self, analysis, reuseMeshFolder=True, coreBudget=None, messageHook=None, finishedHook=None):
+        self._obj = analysis
+        self._reuseMeshFolder = reuseMeshFolder
+        self._coreBudget = coreBudget if coreBudget is not None else availableCores()
+        self._messageHook = messageHook
+        self._finishedHook = finishedHook
+
+        self._meshTools = None
+        self._solver = CfdTools.getSolver(self._obj)
+        self._mesher = CfdTools.getMeshObject(self._obj)
+
+        self._processing = False
+        self._failedIteration = False
+        self._failedMessage = ''
+        self._scheduler = None
+        self._cases = []
+        self._meshKey = None
+        self._meshOwners = {}
+        self._previousStatus = {}
+
+    def isRunning(self):
+        return self._processing
+
+    def getCases(self):
+        return self._cases
+
+    def getStatusPath(self):
+        return os.path.join(CfdTools.getOutputPath(self._obj), 'RunStatus.dat')
+
+    def start(self):
+        """ Prepare the cases and start the scheduler. The finished hook is called when the sweep is complete """
+        self._processing = True
+
+        # Each case gets its own directories unless the mesh folder is shared, in which
+        # case the cases have to be written and run one at a time
+        self._cases = [SweepCase(angle) for angle in self._obj.AOAList]
+        self._meshOwners = {}
+
+        # Completed cases from earlier sweeps are reused when their hash still matches
+        path = self.getStatusPath()
+        self._previousStatus = readRunStatus(path)
+        if self._reuseMeshFolder:
+            concurrent = 1
+        else:
+            ranks = processesPerCase(self._solver, self._mesher)
+            concurrent = concurrentCases(self._coreBudget, ranks, len(self._cases))
+            for case in self._cases:
+                if not self._processing:
+                    break
+                self.prepareCase(case)
+            if not self._processing:
+                # Stopped while the cases were being written
+                return
+
+        self.consoleMessage(translate('Rocket', 'Running {} case(s) at a time').format(concurrent))
+        self._scheduler = SweepScheduler(self._cases, concurrent, path, CfdConsoleProcess,
+                                         prepare=self.prepareCase,
+                                         messageHook=self.consoleMessage,
+                                         finishedHook=self.sweepFinished)
+        self._scheduler.start()
+
+    def stop(self, message=ABORT_MESSAGE):
+        self.stopIteration(message)
+        self._processing = False
+        if self._scheduler is not None and self._scheduler.isRunning():
+            self._scheduler.stop()
+
+    def sweepFinished(self):
+        self._processing = False
+        if self._finishedHook is not None:
+            self._finishedHook()
+
+    def prepareCase(self, case):
+        """ Write the mesh and case directories for a single angle of attack """
+        self._failedIteration = False
+        self._failedMessage = ''
+        try:
+            self.setupCFD(case.aoa)
+            case.meshKey = self._meshKey
+            case.meshDirectory = os.path.join(CfdTools.getOutputPath(self._obj), self._mesher.CaseName)
+
+            if self.reuseCase(case):
+                return
+
+            # Cases with the same mesh hash share a single mesh. When the mesh folder is reused
+            # its content may have changed since the owner ran, so only the stored hash is trusted
+            owner = None
+            if case.meshKey is not None and not self._reuseMeshFolder:
+                owner = self._meshOwners.get(case.meshKey)
+            if owner is not None:
+                case.meshOwner = owner
+            elif meshIsCurrent(case.meshDirectory, case.meshKey):
+                self.consoleMessage(translate('Rocket', 'Using existing mesh for AOA={}').format(case.aoa))
+            elif self._processing and not self._failedIteration:
+                self.writeMesh()
+                if case.meshKey is not None:
+                    self._meshOwners[case.meshKey] = case
+
+                cart_mesh = self._meshTools
+                case.meshDirectory = cart_mesh.meshCaseDir
+                if CfdTools.getFoamRuntime() == "MinGW":
+                    case.meshCommand = CfdTools.makeRunCommand('Allmesh.bat', source_env=False)
+                else:
+                    case.meshCommand = CfdTools.makeRunCommand('./Allmesh', cart_mesh.meshCaseDir, source_env=False)
+                case.meshEnvironment = CfdTools.getRunEnvironment()
+
+            if self._processing and not self._failedIteration:
+                self.writeOpenFOAM()
+                writeCaseHash(self.caseDirectory(), case.caseKey)
+        except Exception as ex:
+            self.stopIteration(type(ex).__name__ + ": " + str(ex))
+
+        if self._failedIteration or not self._processing:
+            case.fail(self._failedMessage)
+            return
+
+        # Each case has its own runner so the solver output of concurrent cases isn't mixed
+        case.runner = FoamRunner(self._obj, self._solver)
+        working_dir = CfdTools.getOutputPath(self._obj)
+        case.solveDirectory = os.path.abspath(os.path.join(working_dir, self._solver.InputCaseName))
+        case.solveCommand = case.runner.getSolverCmd(case.solveDirectory)
+        case.solveEnvironment = case.runner.getRunEnvironment()
+        case.monitor = self.createMonitor(case.solveDirectory)
+        case.prepared = True
+
+    def createMonitor(self, directory, startTime=0.0):
+        if not self._obj.StopConverged:
+            return None
+        return ConvergenceMonitor(directory, self._obj.ConvergenceWindow, self._obj.CoefficientTolerance,
+                                  self._obj.ResidualTolerance, startTime)
+
+    def caseDirectory(self):
+        return os.path.abspath(os.path.join(CfdTools.getOutputPath(self._obj), self._solver.InputCaseName))
+
+    def reuseCase(self, case):
+        """
+            Reuse the results of an earlier sweep for a case with the same hash. Completed
+            cases are not run again, and partial runs continue from their latest time.
+        """
+        case.caseKey = caseHash(self._obj, case.aoa, case.meshKey)
+        directory = self.caseDirectory()
+        if not caseIsCurrent(directory, case.caseKey):
+            return False
+
+        previous = self._previousStatus.get(str(case.aoa))
+        if previous is not None and previous[2] == CASE_SUCCESS and len(previous) > 4 and previous[4] == case.caseKey:
+            self.consoleMessage(translate('Rocket', 'Reusing results for AOA={}').format(case.aoa))
+            case.reuse(previous[1])
+            return True
+
+        if not canResume(previous):
+            # Continuing a diverged solution would fail again, so run it from scratch
+            self.consoleMessage(translate('Rocket', 'Restarting failed AOA={}').format(case.aoa))
+            shutil.rmtree(directory, ignore_errors=True)
+            return False
+
+        # The resume script uses bash, so partial runs are restarted on Windows
+        startTime = latestTime(directory)
+        if startTime > 0.0 and CfdTools.getFoamRuntime() != "MinGW":
+            self.consoleMessage(translate('Rocket', 'Resuming AOA={} from time {}').format(case.aoa, startTime))
+            case.runner = FoamRunner(self._obj, self._solver)
+            case.solveDirectory = directory
+            case.solveCommand = CfdTools.makeRunCommand('./' + writeResumeScript(directory), directory)
+            case.solveEnvironment = case.runner.getRunEnvironment()
+            case.monitor = self.createMonitor(case.solveDirectory, startTime)
+
+            # The mesh was copied in to the case when it first ran
+            case.meshOwner = None
+            case.meshCommand = None
+            case.prepared = True
+            return True
+
+        return False
+
+    def stopIteration(self, message):
+        self._failedIteration = True
+        if len(self._failedMessage) == 0:
+            self._failedMessage = message
+
+    def setupCFD(self, aoa):
+        """ Ensures the objects are set for the required AOA """
+        self.consoleMessage(translate('Rocket', 'Preparing for AOA={}...').format(aoa))
+        if self._obj.RotateFlow:
+            # The geometry and mesh stay at zero AOA and the free stream is rotated instead
+            self.setupRocket(0.0)
+            self.setupFlow(aoa)
+        else:
+            self.setupRocket(aoa)
+            self.setupFlow(0.0)
+        self.setupCaseName(aoa)
+
+    def setupRocket(self, aoa):
+        rocket = self.getCFDRocket()
+        if rocket is None:
+            self.consoleMessage(translate('Rocket', 'No rocket found'), 'Error')
+            return 0
+        rocket._obj.AngleOfAttack = aoa
+
+        self._obj.Document.recompute()
+
+    def setupFlow(self, aoa):
+        """ Point the free stream and the lift and drag directions along the angle of attack """
+        angle = math.radians(aoa)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        for obj in self._obj.Group:
+            if getattr(obj, "BoundaryType", None) == "inlet":
+                speed = math.sqrt(obj.Ux.Value ** 2 + obj.Uy.Value ** 2 + obj.Uz.Value ** 2)
+                obj.Ux = FreeCAD.Units.Quantity("{} mm/s".format(speed * cos))
+                obj.Uy = FreeCAD.Units.Quantity("0 mm/s")
+                obj.Uz = FreeCAD.Units.Quantity("{} mm/s".format(speed * sin))
+            elif getattr(obj, "ReportingFunctionType", None) == "ForceCoefficients":
+                obj.Drag = FreeCAD.Vector(cos, 0, sin)
+                obj.Lift = FreeCAD.Vector(-sin, 0, cos)
+
+    def setupCaseName(self, aoa):
+        # Cases with identical geometry and mesh settings get the same mesh folder
+        self._meshKey = meshHash(self._obj)
+        if self._reuseMeshFolder:
+            meshCaseName = "meshCase"
+        elif self._meshKey is not None:
+            meshCaseName = "meshCase_{}".format(self._meshKey[:12])
+        else:
+            meshCaseName = "meshCase_aoa_{}".format(aoa)
+        self._mesher.CaseName = meshCaseName
+
+        caseName = "case_aoa_{}".format(aoa)
+        self._solver.InputCaseName = caseName
+        self._obj.Document.recompute()
+
+    def writeMesh(self):
+        self.setupMeshtools()
+
+        cart_mesh = self._meshTools
+        cart_mesh.progressCallback = self.consoleMessage
+
+        # Start writing the mesh files
+        self.consoleMessage("Preparing meshing ...")
+        try:
+            with _WaitCursor():
+                self.consoleMessage('Part to mesh:\n  Name: '
+                      + cart_mesh.part_obj.Name + ', Label: '
+                      + cart_mesh.part_obj.Label + ', ShapeType: '
+                      + cart_mesh.part_obj.Shape.ShapeType)
+                self.consoleMessage('  CharacteristicLengthMax: ' + str(cart_mesh.clmax))
+                cart_mesh.writeMesh()
+        except Exception as ex:
+            self.consoleMessage("Error " + type(ex).__name__ + ": " + str(ex), 'Error')
+            raise
+        else:
+            self._obj.NeedsMeshRerun = True
+
+    def writeOpenFOAM(self):
+        self.consoleMessage("Case writer called")
+        try:
+            with _WaitCursor():
+                self._solver.Proxy.case_writer = CfdCaseWriterFoam.CfdCaseWriterFoam(self._obj)
+                writer = self._solver.Proxy.case_writer
+                writer.progressCallback = self.consoleMessage
+                writer.writeCase()
+        except Exception as e:
+            self.consoleMessage("Error writing case:", 'Error')
+            self.consoleMessage(type(e).__name__ + ": " + str(e), 'Error')
+            self.consoleMessage("Write case setup file failed", 'Error')
+            raise
+        else:
+            self._obj.NeedsCaseRewrite = False
+
+    def getCFDRocket(self):
+        return self._obj.CFDRocket.Proxy
+
+    def consoleMessage(self, message="", colourType=None):
+        if self._messageHook is not None:
+            self._messageHook(message, colourType)
+
+    def setupMeshtools(self):
+        mesher = CfdTools.getMeshObject(self._obj)
+        if mesher is None:
+            self.stopIteration("Mesh setup failure")
+            return
+        self._meshTools = CfdMeshTools.CfdMeshTools(mesher)
@@ -27,9 +27,7 @@ import FreeCAD
 import os
 import csv
 import math
-
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvas
+import numpy as np
 
 from docx import Document
 from docx.shared import Inches
@@ -43,7 +41,9 @@ from CfdOF.Solve.CfdFluidBoundary import BOUNDARY_NAMES, BOUNDARY_TYPES, SUBNAME
 from CfdOF.Solve.TaskPanelCfdFluidProperties import ALL_FIELDS
 
 from Rocket.Utilities import _msg
-from Rocket.cfd.FeatureCFDRocket import applyTranslations, calcFrontalArea
+from Rocket.cfd.Reports.DatReader import readDatFiles, postProcessingFiles, FORCE_COLUMNS, COEFFICIENT_COLUMNS
+from Rocket.cfd.Reports.ResidualLog import updateResidualIndex
+from Rocket.cfd.Reports.ReportGraphs import graphSpec, drawGraphs
 
 class CFDReport:
 
@@ -69,10 +69,23 @@ class CFDReport:
         self._forces = {}
         self._moments = {}
         self._coefficients = {}
+        self._graphs = {}
 
     def getPath(self):
         return self._path
 
+    def getFrontalArea(self):
+        return self._frontalArea
+
+    def getCaliber(self):
+        return self._diameter
+
+    def getLength(self):
+        return self._length
+
+    def getRunStatus(self, angle):
+        return self._runStatus.get(str(angle))
+
     def collectStats(self):
         path = os.path.join(CfdTools.getOutputPath(self._analysis), "RunStatus.dat")
         self.collectStatusInformation(path)
@@ -80,19 +93,17 @@ class CFDReport:
         for angle in self._analysis.AOAList:
             try:
                 if self._runStatus[str(angle)][2] == "Success":
-                    dirname = "case_aoa_{}".format(angle)
+                    caseDirectory = os.path.join(CfdTools.getOutputPath(self._analysis), "case_aoa_{}".format(angle))
 
-                    path = os.path.join(CfdTools.getOutputPath(self._analysis), dirname,
-                                        "postProcessing", "ForceReportingFunction", "0", "force.dat")
-                    self.collectForceInformation(path, angle)
+                    # Resumed cases have output from more than one run
+                    paths = postProcessingFiles(caseDirectory, "ForceReportingFunction", "force.dat")
+                    self.collectForceInformation(paths, angle)
 
-                    path = os.path.join(CfdTools.getOutputPath(self._analysis), dirname,
-                                        "postProcessing", "ForceReportingFunction", "0", "moment.dat")
-                    self.collectMomentInformation(path, angle)
+                    paths = postProcessingFiles(caseDirectory, "ForceReportingFunction", "moment.dat")
+                    self.collectMomentInformation(paths, angle)
 
-                    path = os.path.join(CfdTools.getOutputPath(self._analysis), dirname,
-                                        "postProcessing", "ForceCoefficientReportingFunction", "0", "coefficient.dat")
-                    self.collectCoefficientInformation(path, angle)
+                    paths = postProcessingFiles(caseDirectory, "ForceCoefficientReportingFunction", "coefficient.dat")
+                    self.collectCoefficientInformation(paths, angle)
             except KeyError:
                 pass
 
@@ -106,34 +117,26 @@ class CFDReport:
                     if row[0] == "Total":
                         self._totalRunTime = row[1]
 
-    def collectForceInformation(self, path, angle):
-        self._forces[str(angle)] = []
-        with open(path, "r") as csvfile:
-            csvreader = csv.reader(csvfile, delimiter=' ', skipinitialspace=True)
-            for row in csvreader:
-                if len(row) == 10 and not row[0].startswith("#"):
-                    self._forces[str(angle)].append(row)
+    # The data files are only read when needed. Averages read the tail of the file, and the
+    # full history is read for the graphs
+    def collectForceInformation(self, paths, angle):
+        self._forces[str(angle)] = (paths, FORCE_COLUMNS)
 
-    def collectMomentInformation(self, path, angle):
-        self._moments[str(angle)] = []
-        with open(path, "r") as csvfile:
-            csvreader = csv.reader(csvfile, delimiter=' ', skipinitialspace=True)
-            for row in csvreader:
-                # Read all and save the last row
-                if len(row) == 10 and not row[0].startswith("#"):
-                    self._moments[str(angle)].append(row)
+    def collectMomentInformation(self, paths, angle):
+        self._moments[str(angle)] = (paths, FORCE_COLUMNS)
 
-    def collectCoefficientInformation(self, path, angle):
-        self._coefficients[str(angle)] = []
-        with open(path, "r") as csvfile:
-            csvreader = csv.reader(csvfile, delimiter='\t', skipinitialspace=True)
-            for row in csvreader:
-                # Read all and save the last row
-                if len(row) == 13 and not row[0].startswith("#"):
-                    self._coefficients[str(angle)].append(row)
+    def collectCoefficientInformation(self, paths, angle):
+        self._coefficients[str(angle)] = (paths, COEFFICIENT_COLUMNS)
+
+    def getTable(self, source, tail=0):
+        paths, columns = source
+        return readDatFiles(paths, columns, tail)
 
     def generate(self):
+        # Collect the data and draw the graphs before assembling the document
         self.collectStats()
+        self.collectGraphs()
+        drawGraphs(list(self._graphs.values()))
 
         self._document = Document()
         self.addStyles()
@@ -925,8 +928,6 @@ class CFDReport:
         p = self._document.add_paragraph("X0 = {} mm".format(int(self._x0)), style="Block Quotation")
         p.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
 
-        x_values = []
-        y_values = []
         count = len(self._analysis.AOAList)
         table = self._document.add_table(rows=5, cols=count+1, style='Simple Grid Columns')
         hdr_cells = table.rows[0].cells
@@ -942,16 +943,7 @@ class CFDReport:
             data_cells = table.columns[i+1].cells
             angle = str(self._analysis.AOAList[i])
             if self._runStatus[str(angle)][2] == "Success":
-                My = self.getMomentY(angle) #float(self._moments[angle][-1][2])
-                Fx = self.getForceX(angle) #float(self._forces[angle][-1][1])
-                Fz = self.getForceZ(angle) #float(self._forces[angle][-1][3])
-                aoa = math.radians(float(self._analysis.AOAList[i]))
-                # X = X0 - My / (Fz * cos(AOA) + Fx * sin(AOA))
-                x = (My / (Fz * math.cos(aoa) + Fx * math.sin(aoa)))
-                x = self._x0 - (x * 1000.0) # Meters to mm
-
-                x_values.append(float(self._analysis.AOAList[i]))
-                y_values.append(x)
+                My, Fx, Fz, x = self.getCP(angle)
                 data_cells[1].text = "{:#.3g}".format(My)
                 data_cells[2].text = "{:#.3g}".format(Fx)
                 data_cells[3].text = "{:#.3g}".format(Fz)
@@ -964,10 +956,24 @@ class CFDReport:
 
         if count > 1:
             self._document.add_paragraph()
-            self.cpGraph(x_values, y_values)
+            self.addGraph("cpGraph")
 
         self._document.add_page_break()
 
+    def getCP(self, angle):
+        """ Returns the averaged moment and forces, and the center of pressure in mm """
+        My = self.getMomentY(angle)
+        Fx = self.getForceX(angle)
+        Fz = self.getForceZ(angle)
+        aoa = math.radians(float(angle))
+        if getattr(self._analysis, "RotateFlow", False):
+            # The rocket isn't rotated, so the forces are already in the body frame
+            aoa = 0.0
+        # X = X0 - My / (Fz * cos(AOA) + Fx * sin(AOA))
+        x = (My / (Fz * math.cos(aoa) + Fx * math.sin(aoa)))
+        x = self._x0 - (x * 1000.0) # Meters to mm
+        return My, Fx, Fz, x
+
     def getMomentY(self, angle):
         return self.getAverage(self._moments[angle], 2)
 
@@ -983,38 +989,25 @@ class CFDReport:
     def getCL(self, angle):
         return self.getAverage(self._coefficients[angle], 4)
 
-    def getAverage(self, list, index):
-        if len(list) > self._analysis.AverageLastN:
-            list = list[-self._analysis.AverageLastN:]
-        average = 0.0
-        for entry in list:
-            average += float(entry[index])
-        return (average / len(list))
-
-    def cpGraph(self, x_values, y_values):
-        graphPath = os.path.join(CfdTools.getOutputPath(self._analysis), 'cpGraph.png')
-
-        # Turn interactive plotting off
-        plt.ioff()
-        plt.rcParams['figure.constrained_layout.use'] = True
-        plt.rcParams["figure.facecolor"] = 'white'
-        plt.rcParams["figure.edgecolor"] = 'white'
-        plt.rcParams["axes.facecolor"] = 'white'
-
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, y_values, label="$C_P$")
-        sub.set_xlabel("Angle of Attack (degrees)")
-        sub.set_ylabel("Center of Pressure (mm)")
-        sub.grid(visible=True)
-        sub.legend()
-
-        plt.savefig(graphPath)
-        plt.close(fig)
-
-        self._document.add_picture(graphPath, width=Inches(6.0))
+    def getAverage(self, source, index):
+        table = self.getTable(source, self._analysis.AverageLastN)
+        return float(np.mean(table[:, index]))
+
+    def getAverages(self, source):
+        """ The average of each column over the last N iterations. The first entry is the last iteration """
+        table = self.getTable(source, self._analysis.AverageLastN)
+        averages = np.mean(table, axis=0)
+        averages[0] = table[-1, 0]
+        return averages
+
+    def getForceAverages(self, angle):
+        return self.getAverages(self._forces[str(angle)])
+
+    def getMomentAverages(self, angle):
+        return self.getAverages(self._moments[str(angle)])
+
+    def getCoefficientAverages(self, angle):
+        return self.getAverages(self._coefficients[str(angle)])
 
     def generateCD(self):
         self._document.add_heading('Lift and Drag', level=1)
@@ -1033,22 +1026,13 @@ class CFDReport:
         data_cells[1].text = "Cd"
         data_cells[2].text = "Cl"
 
-        x_values = []
-        cd_values = []
-        cl_values = []
         for i in range(count):
             data_cells = table.columns[i+1].cells
             angle = str(self._analysis.AOAList[i])
             if self._runStatus[str(angle)][2] == "Success":
-                aoa = float(self._analysis.AOAList[i])
                 Cd = self.getCD(angle) #float(self._coefficients[angle][1])
                 Cl = self.getCL(angle) #float(self._coefficients[angle][4])
-                solid = applyTranslations(self._analysis.Shape, self._x0, aoa, self._rotation)
-                area = calcFrontalArea(solid)
 
-                x_values.append(float(self._analysis.AOAList[i]))
-                cd_values.append(Cd)
-                cl_values.append(Cl)
                 # data_cells[1].text = FreeCAD.Units.Quantity("{} mm^2".format(area)).UserString
                 # data_cells[2].text = ""
                 data_cells[1].text = "{:#.3g}".format(Cd)
@@ -1061,282 +1045,142 @@ class CFDReport:
 
         if count > 1:
             self._document.add_paragraph()
-            self.cdGraph(x_values, cd_values, cl_values)
+            self.addGraph("cdGraph")
 
         self._document.add_page_break()
 
-    def cdGraph(self, x_values, cd_values, cl_values):
-        graphPath = os.path.join(CfdTools.getOutputPath(self._analysis), 'cdGraph.png')
+    def hasRunData(self, angle):
+        return self._runStatus[str(angle)][2] == "Success" or self._runStatus[str(angle)][3] == "Solver error"
 
-        # Turn interactive plotting off
-        plt.ioff()
-        plt.rcParams['figure.constrained_layout.use'] = True
-        plt.rcParams["figure.facecolor"] = 'white'
-        plt.rcParams["figure.edgecolor"] = 'white'
-        plt.rcParams["axes.facecolor"] = 'white'
+    def graphPath(self, name):
+        return os.path.join(CfdTools.getOutputPath(self._analysis), "Graphs", name + ".png")
 
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, cd_values, label="$C_D$")
-        sub.plot(x_values, cl_values, label="$C_L$")
-        sub.set_xlabel("Angle of Attack (degrees)")
-        sub.set_ylabel("Coefficient")
-        sub.grid(visible=True)
-        sub.legend()
+    def collectGraphs(self):
+        """ Collect the data for every graph in the report, so they can be drawn together """
+        self._graphs = {}
+        os.makedirs(os.path.dirname(self.graphPath("")), exist_ok=True)
 
-        plt.savefig(graphPath)
-        plt.close(fig)
+        if len(self._analysis.AOAList) > 1:
+            x_values = []
+            cp_values = []
+            cd_values = []
+            cl_values = []
+            for angle in self._analysis.AOAList:
+                if self._runStatus[str(angle)][2] == "Success":
+                    x_values.append(float(angle))
+                    cp_values.append(self.getCP(str(angle))[3])
+                    cd_values.append(self.getCD(str(angle)))
+                    cl_values.append(self.getCL(str(angle)))
 
-        self._document.add_picture(graphPath, width=Inches(6.0))
+            self.collectGraph("cpGraph", "Angle of Attack (degrees)", "Center of Pressure (mm)",
+                              [(x_values, cp_values, "$C_P$")])
+            self.collectGraph("cdGraph", "Angle of Attack (degrees)", "Coefficient",
+                              [(x_values, cd_values, "$C_D$"), (x_values, cl_values, "$C_L$")])
 
-    def generateRunData(self):
-        self._document.add_heading('Run Data', level=1)
         for angle in self._analysis.AOAList:
-            if self._runStatus[str(angle)][2] == "Success" or self._runStatus[str(angle)][3] == "Solver error":
-                self._document.add_heading('Angle of Attack={}'.format(str(angle)), level=1)
-                self.generateResidualDataAt(angle)
-                self.generateForceDataAt(angle)
-                self.generateMomentDataAt(angle)
-                self.generateCoefficientDataAt(angle)
+            if self.hasRunData(angle):
+                self.collectResidualGraph(angle)
+                self.collectForceGraphs(angle)
+                self.collectMomentGraphs(angle)
+                self.collectCoefficientGraph(angle)
 
-                # Page break for all but the last entry
-                if angle != self._analysis.AOAList[-1]:
-                    self._document.add_page_break()
+    def collectGraph(self, name, xLabel, yLabel, series, logScale=False):
+        self._graphs[name] = graphSpec(self.graphPath(name), xLabel, yLabel, series, logScale)
 
-    def generateResidualDataAt(self, angle):
-        graphPath = os.path.join(CfdTools.getOutputPath(self._analysis), 'residualGraph.png')
+    def collectResidualGraph(self, angle):
+        try:
+            residuals = self.readResidual(angle)
+        except OSError:
+            # If the log doesn't exist we're unable to draw the graph
+            return
 
-        # Turn interactive plotting off
-        plt.ioff()
-        plt.rcParams['figure.constrained_layout.use'] = True
-        plt.rcParams["figure.facecolor"] = 'white'
-        plt.rcParams["figure.edgecolor"] = 'white'
-        plt.rcParams["axes.facecolor"] = 'white'
+        x_values = residuals["time"]
+        self.collectGraph("aoa_{}_residual".format(angle), "Iteration", "Residual", [
+            (x_values, residuals["UxResiduals"], "$U_x$"),
+            (x_values, residuals["UyResiduals"], "$U_y$"),
+            (x_values, residuals["UzResiduals"], "$U_z$"),
+            (x_values, residuals["pResiduals"], "$p$"),
+            (x_values, residuals["kResiduals"], "$k$"),
+            (x_values, residuals["omegaResiduals"], "$\\omega$")
+        ], logScale=True)
+
+    def collectForceGraphs(self, angle):
+        if str(angle) not in self._forces:
+            return
 
-        residuals = self.readResidual(angle)
+        # Get the force entries
+        table = self.getTable(self._forces[str(angle)])
+        x_values = self.getIntColumn(table, 0)
+        self.collectGraph("aoa_{}_force".format(angle), "Iteration", "Force [N]", [
+            (x_values, self.getColumn(table, 1), "$F_X$"),
+            (x_values, self.getColumn(table, 2), "$F_Y$"),
+            (x_values, self.getColumn(table, 3), "$F_Z$")
+        ])
+        self.collectGraph("aoa_{}_forceComponents".format(angle), "Iteration", "Force [N]", [
+            (x_values, self.getColumn(table, 4), "$F_X$ (pressure)"),
+            (x_values, self.getColumn(table, 5), "$F_Y$ (pressure)"),
+            (x_values, self.getColumn(table, 6), "$F_Z$ (pressure)"),
+            (x_values, self.getColumn(table, 7), "$F_X$ (viscous)"),
+            (x_values, self.getColumn(table, 8), "$F_Y$ (viscous)"),
+            (x_values, self.getColumn(table, 9), "$F_Z$ (viscous)")
+        ])
+
+    def collectMomentGraphs(self, angle):
+        if str(angle) not in self._moments:
+            return
 
-        try:
-            x_values = residuals["time"]
-            ux_values = residuals["UxResiduals"]
-            uy_values = residuals["UyResiduals"]
-            uz_values = residuals["UzResiduals"]
-            p_values = residuals["pResiduals"]
-            k_values = residuals["kResiduals"]
-            omega_values = residuals["omegaResiduals"]
-        except IndexError:
-            # If the entry doesn't exist we're unable to draw the graph
+        table = self.getTable(self._moments[str(angle)])
+        x_values = self.getIntColumn(table, 0)
+        self.collectGraph("aoa_{}_moment".format(angle), "Iteration", "Moment", [
+            (x_values, self.getColumn(table, 1), "$M_X$"),
+            (x_values, self.getColumn(table, 2), "$M_Y$"),
+            (x_values, self.getColumn(table, 3), "$M_Z$")
+        ])
+        self.collectGraph("aoa_{}_momentComponents".format(angle), "Iteration", "Moment", [
+            (x_values, self.getColumn(table, 4), "$M_X$ (pressure)"),
+            (x_values, self.getColumn(table, 5), "$M_Y$ (pressure)"),
+            (x_values, self.getColumn(table, 6), "$M_Z$ (pressure)"),
+            (x_values, self.getColumn(table, 7), "$M_X$ (viscous)"),
+            (x_values, self.getColumn(table, 8), "$M_Y$ (viscous)"),
+            (x_values, self.getColumn(table, 9), "$M_Z$ (viscous)")
+        ])
+
+    def collectCoefficientGraph(self, angle):
+        if str(angle) not in self._coefficients:
             return
 
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, ux_values, label="$U_x$")
-        sub.plot(x_values, uy_values, label="$U_y$")
-        sub.plot(x_values, uz_values, label="$U_z$")
-        sub.plot(x_values, p_values, label="$p$")
-        sub.plot(x_values, k_values, label="$k$")
-        sub.plot(x_values, omega_values, label="$\\omega$")
-        sub.set_xlabel("Iteration")
-        sub.set_ylabel("Residual")
-        sub.set_yscale('log')
-        sub.grid(visible=True)
-        sub.legend()
-
-        plt.savefig(graphPath)
-        plt.close(fig)
-
-        self._document.add_picture(graphPath, width=Inches(6.0))
-        self._document.add_paragraph() # Spacer
-
-    def readResidual(self, angle):
-        # Avoid circular import
-        from Rocket.cfd.Ui.TaskPanelMultiCFD import FoamRunner
-
-        dirname = "case_aoa_{}".format(angle)
-        path = os.path.join(CfdTools.getOutputPath(self._analysis), dirname,
-                            "log.simpleFoam")
-
-        runner = FoamRunner(self._analysis)
-        with open(path, "r") as file:
-            for line in file:
-                runner.processOutput(line)
-
-        residuals = {}
-        residuals["time"] = runner.time
-        residuals["UxResiduals"] = runner.UxResiduals
-        residuals["UyResiduals"] = runner.UyResiduals
-        residuals["UzResiduals"] = runner.UzResiduals
-        residuals["pResiduals"] = runner.pResiduals
-        residuals["kResiduals"] = runner.kResiduals
-        residuals["omegaResiduals"] = runner.omegaResiduals
-
-        return residuals
-
-    def generateForceDataAt(self, angle):
-        graphPath = os.path.join(CfdTools.getOutputPath(self._analysis), 'forceGraph.png')
-
-        # Turn interactive plotting off
-        plt.ioff()
-        plt.rcParams['figure.constrained_layout.use'] = True
-        plt.rcParams["figure.facecolor"] = 'white'
-        plt.rcParams["figure.edgecolor"] = 'white'
-        plt.rcParams["axes.facecolor"] = 'white'
+        table = self.getTable(self._coefficients[str(angle)])
+        x_values = self.getIntColumn(table, 0)
+        self.collectGraph("aoa_{}_coefficient".format(angle), "Iteration", "Coefficient", [
+            (x_values, self.getColumn(table, 1), "$C_D$"),
+            (x_values, self.getColumn(table, 4), "$C_L$")
+        ])
 
-        # Get the force entries
-        x_values = self.getIntColumn(self._forces[str(angle)], 0)
-        fx_values = self.getColumn(self._forces[str(angle)], 1)
-        fy_values = self.getColumn(self._forces[str(angle)], 2)
-        fz_values = self.getColumn(self._forces[str(angle)], 3)
-        px_values = self.getColumn(self._forces[str(angle)], 4)
-        py_values = self.getColumn(self._forces[str(angle)], 5)
-        pz_values = self.getColumn(self._forces[str(angle)], 6)
-        vx_values = self.getColumn(self._forces[str(angle)], 7)
-        vy_values = self.getColumn(self._forces[str(angle)], 8)
-        vz_values = self.getColumn(self._forces[str(angle)], 9)
-
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, fx_values, label="$F_X$")
-        sub.plot(x_values, fy_values, label="$F_Y$")
-        sub.plot(x_values, fz_values, label="$F_Z$")
-        sub.set_xlabel("Iteration")
-        sub.set_ylabel("Force [N]")
-        sub.grid(visible=True)
-        sub.legend()
-
-        plt.savefig(graphPath)
-        plt.close(fig)
-
-        self._document.add_picture(graphPath, width=Inches(6.0))
-        self._document.add_paragraph() # Spacer
-
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, px_values, label="$F_X$ (pressure)")
-        sub.plot(x_values, py_values, label="$F_Y$ (pressure)")
-        sub.plot(x_values, pz_values, label="$F_Z$ (pressure)")
-        sub.plot(x_values, vx_values, label="$F_X$ (viscous)")
-        sub.plot(x_values, vy_values, label="$F_Y$ (viscous)")
-        sub.plot(x_values, vz_values, label="$F_Z$ (viscous)")
-        sub.set_xlabel("Iteration")
-        sub.set_ylabel("Force [N]")
-        sub.grid(visible=True)
-        sub.legend()
-
-        plt.savefig(graphPath)
-        plt.close(fig)
-
-        self._document.add_picture(graphPath, width=Inches(6.0))
-        self._document.add_paragraph() # Spacer
-
-    def generateMomentDataAt(self, angle):
-        graphPath = os.path.join(CfdTools.getOutputPath(self._analysis), 'momentGraph.png')
-
-        # Turn interactive plotting off
-        plt.ioff()
-        plt.rcParams['figure.constrained_layout.use'] = True
-        plt.rcParams["figure.facecolor"] = 'white'
-        plt.rcParams["figure.edgecolor"] = 'white'
-        plt.rcParams["axes.facecolor"] = 'white'
+    def addGraph(self, name, spacer=False):
+        graph = self._graphs.get(name)
+        if graph is not None and os.path.isfile(graph["path"]):
+            self._document.add_picture(graph["path"], width=Inches(6.0))
+            if spacer:
+                self._document.add_paragraph() # Spacer
 
-        # Get the force entries
-        x_values = self.getIntColumn(self._moments[str(angle)], 0)
-        fx_values = self.getColumn(self._moments[str(angle)], 1)
-        fy_values = self.getColumn(self._moments[str(angle)], 2)
-        fz_values = self.getColumn(self._moments[str(angle)], 3)
-        px_values = self.getColumn(self._moments[str(angle)], 4)
-        py_values = self.getColumn(self._moments[str(angle)], 5)
-        pz_values = self.getColumn(self._moments[str(angle)], 6)
-        vx_values = self.getColumn(self._moments[str(angle)], 7)
-        vy_values = self.getColumn(self._moments[str(angle)], 8)
-        vz_values = self.getColumn(self._moments[str(angle)], 9)
-
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, fx_values, label="$M_X$")
-        sub.plot(x_values, fy_values, label="$M_Y$")
-        sub.plot(x_values, fz_values, label="$M_Z$")
-        sub.set_xlabel("Iteration")
-        sub.set_ylabel("Moment")
-        sub.grid(visible=True)
-        sub.legend()
-
-        plt.savefig(graphPath)
-        plt.close(fig)
-
-        self._document.add_picture(graphPath, width=Inches(6.0))
-        self._document.add_paragraph() # Spacer
-
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, px_values, label="$M_X$ (pressure)")
-        sub.plot(x_values, py_values, label="$M_Y$ (pressure)")
-        sub.plot(x_values, pz_values, label="$M_Z$ (pressure)")
-        sub.plot(x_values, vx_values, label="$M_X$ (viscous)")
-        sub.plot(x_values, vy_values, label="$M_Y$ (viscous)")
-        sub.plot(x_values, vz_values, label="$M_Z$ (viscous)")
-        sub.set_xlabel("Iteration")
-        sub.set_ylabel("Moment")
-        sub.grid(visible=True)
-        sub.legend()
-
-        plt.savefig(graphPath)
-        plt.close(fig)
-
-        self._document.add_picture(graphPath, width=Inches(6.0))
-        self._document.add_paragraph() # Spacer
-
-    def generateCoefficientDataAt(self, angle):
-        graphPath = os.path.join(CfdTools.getOutputPath(self._analysis), 'coefficientGraph.png')
-
-        # Turn interactive plotting off
-        plt.ioff()
-        plt.rcParams['figure.constrained_layout.use'] = True
-        plt.rcParams["figure.facecolor"] = 'white'
-        plt.rcParams["figure.edgecolor"] = 'white'
-        plt.rcParams["axes.facecolor"] = 'white'
+    def generateRunData(self):
+        self._document.add_heading('Run Data', level=1)
+        for angle in self._analysis.AOAList:
+            if self.hasRunData(angle):
+                self._document.add_heading('Angle of Attack={}'.format(str(angle)), level=1)
+                self.addGraph("aoa_{}_residual".format(angle), spacer=True)
+                self.addGraph("aoa_{}_force".format(angle), spacer=True)
+                self.addGraph("aoa_{}_forceComponents".format(angle), spacer=True)
+                self.addGraph("aoa_{}_moment".format(angle), spacer=True)
+                self.addGraph("aoa_{}_momentComponents".format(angle), spacer=True)
+                self.addGraph("aoa_{}_coefficient".format(angle))
 
-        # Get the force entries
-        x_values = self.getIntColumn(self._coefficients[str(angle)], 0)
-        cd_values = self.getColumn(self._coefficients[str(angle)], 1)
-        cl_values = self.getColumn(self._coefficients[str(angle)], 4)
-
-        # Create a new figure, plot into it, then close it so it never gets displayed
-        fig = plt.figure(figsize=(5,3))
-        canvas = FigureCanvas(fig)
-        sub = canvas.figure.subplots()
-        sub.plot(x_values, cd_values, label="$C_D$")
-        sub.plot(x_values, cl_values, label="$C_L$")
-        sub.set_xlabel("Iteration")
-        sub.set_ylabel("Coefficient")
-        sub.grid(visible=True)
-        sub.legend()
-
-        plt.savefig(graphPath)
-        plt.close(fig)
-
-        self._document.add_picture(graphPath, width=Inches(6.0))
-        # self._document.add_paragraph() # Spacer
+                # Page break for all but the last entry
+                if angle != self._analysis.AOAList[-1]:
+                    self._document.add_page_break()
 
     def getIntColumn(self, table, index):
-        column = []
-        for entry in table:
-            column.append(int(entry[index]))
-        return column
+        return table[:, index].astype(int)
 
     def getColumn(self, table, index):
-        column = []
-        for entry in table:
-            column.append(float(entry[index]))
-        return column
+        return table[:, index]
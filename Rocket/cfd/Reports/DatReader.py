@@ -0,0 +1,181 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Functions for reading OpenFOAM post processing data files"""
+
+__title__ = "FreeCAD CFD Data Reader"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from collections import OrderedDict
+import os
+import warnings
+
+import numpy as np
+
+# Columns in the force and moment files: iteration, total, pressure, and viscous vectors
+FORCE_COLUMNS = 10
+# Columns in the force coefficient file
+COEFFICIENT_COLUMNS = 13
+
+# Size of the blocks read backwards from the end of a file when reading the tail
+TAIL_BLOCK_SIZE = 65536
+
+# Maximum number of parsed files kept. The least recently used are dropped first
+MAX_DAT_FILES = 64
+
+# Parsed files, keyed by path, column count and tail length. Entries are checked against
+# the file modification time and size so files still being written are read again
+_datCache = OrderedDict()
+
+def _fileKey(path : str) -> tuple:
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _tailLines(path : str, count : int) -> list:
+    """ Read at least the last count lines of a file, without reading the rest """
+    with open(path, "rb") as datFile:
+        datFile.seek(0, os.SEEK_END)
+        position = datFile.tell()
+        data = b""
+        # One extra line as the first line read may be incomplete
+        while position > 0 and data.count(b"\n") <= count + 1:
+            step = min(TAIL_BLOCK_SIZE, position)
+            position -= step
+            datFile.seek(position)
+            data = datFile.read(step) + data
+
+    lines = data.splitlines()
+    if position > 0:
+        lines = lines[1:]
+    return lines
+
+def _parseLines(lines : list, columns : int) -> np.ndarray:
+    # The last line is incomplete while the solver is writing the file
+    if len(lines) > 0 and len(lines[-1].split()) != columns:
+        lines = lines[:-1]
+
+    try:
+        with warnings.catch_warnings():
+            # Files with only a header are expected before the first iteration
+            warnings.simplefilter("ignore", UserWarning)
+            table = np.loadtxt(lines, comments="#", ndmin=2)
+        if table.shape[0] == 0 or table.shape[1] == columns:
+            return table.reshape((-1, columns))
+    except ValueError:
+        pass
+
+    # Mixed content, such as a partially written last line. Only keep complete rows
+    rows = []
+    for line in lines:
+        fields = line.split()
+        if len(fields) == columns and not fields[0].startswith(b"#"):
+            rows.append(fields)
+    if len(rows) == 0:
+        return np.empty((0, columns))
+    return np.array(rows, dtype=float)
+
+def readDat(path : str, columns : int, tail : int = 0) -> np.ndarray:
+    """
+        Read the data rows of a post processing file such as force.dat in to an array
+        with one row per iteration. Comment lines and incomplete rows are skipped. When
+        tail is given only the last tail rows are read from the end of the file.
+
+        The returned array is shared between callers and is read only.
+    """
+    cacheKey = (os.path.abspath(path), columns, tail)
+    fileKey = _fileKey(path)
+    cached = _datCache.get(cacheKey)
+    if cached is not None and cached[0] == fileKey:
+        _datCache.move_to_end(cacheKey)
+        return cached[1]
+
+    if tail > 0:
+        table = _parseLines(_tailLines(path, tail), columns)[-tail:]
+    else:
+        with open(path, "rb") as datFile:
+            table = _parseLines(datFile.read().splitlines(), columns)
+    table.setflags(write=False)
+
+    _datCache[cacheKey] = (fileKey, table)
+    _datCache.move_to_end(cacheKey)
+    if len(_datCache) > MAX_DAT_FILES:
+        _datCache.popitem(last=False)
+    return table
+
+def clearDatCache() -> None:
+    _datCache.clear()
+
+def _startTime(path : str) -> float:
+    # Post processing files are written to a directory named for the time the run started
+    return float(os.path.basename(os.path.dirname(path)))
+
+def postProcessingFiles(caseDirectory : str, functionName : str, fileName : str, startTime : float = None) -> list:
+    """
+        The paths of a function object's output file for each run of the case, in the order
+        the runs started. A resumed case writes to a new directory named for its start time.
+        When startTime is given, only runs starting at or after that time are included.
+    """
+    directory = os.path.join(caseDirectory, "postProcessing", functionName)
+    runs = []
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name, fileName)
+            try:
+                time = float(name)
+            except ValueError:
+                continue
+            if (startTime is None or time >= startTime) and os.path.isfile(path):
+                runs.append((time, path))
+    runs.sort()
+    return [path for time, path in runs]
+
+def readDatFiles(paths : list, columns : int, tail : int = 0) -> np.ndarray:
+    """
+        Read the output of all the runs of a case as a single table. Rows an earlier run
+        wrote after the time a later run restarted from are replaced by the later run.
+        When tail is given only the last tail rows are returned.
+
+        The returned array is read only.
+    """
+    if len(paths) == 0:
+        raise FileNotFoundError("No post processing files found")
+
+    tables = []
+    rows = 0
+    restart = None
+    for path in reversed(paths):
+        table = readDat(path, columns, tail if restart is None else 0)
+        if restart is not None:
+            table = table[table[:, 0] <= restart]
+        tables.append(table)
+        rows += table.shape[0]
+        restart = _startTime(path)
+        if tail > 0 and rows >= tail:
+            break
+
+    if len(tables) == 1:
+        return tables[0]
+
+    table = np.concatenate(tables[::-1])
+    if tail > 0:
+        table = table[-tail:]
+    table.setflags(write=False)
+    return table
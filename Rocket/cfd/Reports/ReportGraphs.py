@@ -0,0 +1,95 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Functions for drawing the CFD report graphs"""
+
+__title__ = "FreeCAD CFD Report Graphs"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import concurrent.futures
+import multiprocessing
+import os
+
+# The Agg canvas is used directly rather than pyplot, so graphs can be drawn without a
+# GUI and from several processes at once
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Below this number of graphs the cost of starting worker processes outweighs the benefit
+MIN_PARALLEL_GRAPHS = 4
+
+def graphSpec(path : str, xLabel : str, yLabel : str, series : list, logScale : bool = False) -> dict:
+    """
+        Description of a single graph. series is a list of (x values, y values, label)
+        tuples. The description only holds plain data so it can be sent to a worker process.
+    """
+    return {
+        "path" : path,
+        "xLabel" : xLabel,
+        "yLabel" : yLabel,
+        "series" : series,
+        "logScale" : logScale
+    }
+
+def drawGraph(spec : dict) -> str:
+    fig = Figure(figsize=(5,3), layout="constrained", facecolor='white', edgecolor='white')
+    FigureCanvasAgg(fig)
+    sub = fig.subplots()
+    sub.set_facecolor('white')
+    for x_values, y_values, label in spec["series"]:
+        sub.plot(x_values, y_values, label=label)
+    sub.set_xlabel(spec["xLabel"])
+    sub.set_ylabel(spec["yLabel"])
+    if spec["logScale"]:
+        sub.set_yscale('log')
+    sub.grid(visible=True)
+    sub.legend()
+
+    fig.savefig(spec["path"])
+    return spec["path"]
+
+def _drawLocal(specs : list) -> None:
+    for spec in specs:
+        drawGraph(spec)
+
+def drawGraphs(specs : list) -> None:
+    """ Draw the graphs to their files, in worker processes when there are enough of them """
+    # Remove graphs from earlier reports so missing graphs can be detected
+    for spec in specs:
+        if os.path.isfile(spec["path"]):
+            os.remove(spec["path"])
+
+    workers = min(len(specs), (os.cpu_count() or 1) - 1)
+    if len(specs) < MIN_PARALLEL_GRAPHS or workers < 2:
+        _drawLocal(specs)
+        return
+
+    # Imported here so the worker processes don't load FreeCAD
+    from Rocket.Utilities import pythonExecutable
+
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(pythonExecutable())
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            list(pool.map(drawGraph, specs))
+    except (OSError, RuntimeError, concurrent.futures.process.BrokenProcessPool):
+        # Draw anything that is missing in this process
+        _drawLocal([spec for spec in specs if not os.path.isfile(spec["path"])])
@@ -0,0 +1,146 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Functions for indexing the residuals in OpenFOAM solver logs"""
+
+__title__ = "FreeCAD CFD Residual Log"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import hashlib
+import os
+
+import numpy as np
+
+SOLVER_LOG = "log.simpleFoam"
+
+# Residual series extracted from the log, stored next to it in the case directory
+RESIDUAL_INDEX_FILE = "residuals.npz"
+
+RESIDUAL_FIELDS = ("Ux", "Uy", "Uz", "p", "k", "omega")
+
+# Number of bytes at the start of the log used to detect that the log has been rewritten
+_SIGNATURE_SIZE = 1024
+
+_TIME_PREFIX = b"Time = "
+_SOLVING = b"Solving for "
+_INITIAL_RESIDUAL = b"Initial residual = "
+
+def _emptyResiduals() -> dict:
+    residuals = {"time": np.empty(0)}
+    for field in RESIDUAL_FIELDS:
+        residuals[field + "Residuals"] = np.empty(0)
+    return residuals
+
+def _signature(path : str, size : int) -> str:
+    with open(path, "rb") as log:
+        return hashlib.sha1(log.read(size)).hexdigest()
+
+def _parseLog(data : bytes) -> dict:
+    """
+        Extract the first initial residual of each field for every time step. Fields
+        not solved in a time step are NaN so all series stay aligned with the time.
+    """
+    times = []
+    series = {field : [] for field in RESIDUAL_FIELDS}
+    for line in data.splitlines():
+        if line.startswith(_TIME_PREFIX):
+            try:
+                times.append(float(line[len(_TIME_PREFIX):].strip().rstrip(b"s")))
+            except ValueError:
+                continue
+            for values in series.values():
+                values.append(np.nan)
+        elif len(times) > 0 and _SOLVING in line:
+            start = line.index(_SOLVING) + len(_SOLVING)
+            field = line[start:line.index(b",", start)].decode() if b"," in line[start:] else ""
+            values = series.get(field)
+            if values is None or not np.isnan(values[-1]):
+                continue
+            start = line.find(_INITIAL_RESIDUAL)
+            if start >= 0:
+                start += len(_INITIAL_RESIDUAL)
+                values[-1] = float(line[start:line.index(b",", start)])
+
+    residuals = {"time": np.array(times, dtype=float)}
+    for field, values in series.items():
+        residuals[field + "Residuals"] = np.array(values, dtype=float)
+    return residuals
+
+def _loadIndex(indexPath : str) -> tuple:
+    try:
+        with np.load(indexPath, allow_pickle=False) as index:
+            residuals = {name : index[name] for name in _emptyResiduals()}
+            return residuals, int(index["offset"]), str(index["signature"]), int(index["signatureSize"])
+    except (OSError, KeyError, ValueError):
+        return _emptyResiduals(), 0, "", 0
+
+def _saveIndex(indexPath : str, residuals : dict, offset : int, signature : str, signatureSize : int) -> None:
+    # Write to a temporary file first, so the index can be read while it is being updated
+    temporary = indexPath + ".tmp"
+    with open(temporary, "wb") as indexFile:
+        np.savez(indexFile, offset=offset, signature=signature, signatureSize=signatureSize, **residuals)
+    os.replace(temporary, indexPath)
+
+def updateResidualIndex(directory : str, logName : str = SOLVER_LOG) -> dict:
+    """
+        Bring the residual index of a case up to date with its solver log and return the
+        residual series. Only the part of the log written since the last update is read.
+        The index is rebuilt if the log has been replaced by a new run.
+    """
+    logPath = os.path.join(directory, logName)
+    indexPath = os.path.join(directory, RESIDUAL_INDEX_FILE)
+    residuals, offset, signature, signatureSize = _loadIndex(indexPath)
+
+    size = os.path.getsize(logPath)
+    if size < offset or (offset > 0 and _signature(logPath, signatureSize) != signature):
+        residuals, offset, signatureSize = _emptyResiduals(), 0, 0
+    if size == offset:
+        return residuals
+
+    with open(logPath, "rb") as log:
+        log.seek(offset)
+        data = log.read(size - offset)
+
+    # Leave a partly written last line for the next update
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        return residuals
+    data = data[:end]
+
+    # A time step can be split between updates, so continue the last step of the index
+    added = _parseLog(data)
+    if len(residuals["time"]) > 0 and not data.startswith(_TIME_PREFIX):
+        lastStep = data.find(b"\n" + _TIME_PREFIX)
+        continued = _parseLog(_TIME_PREFIX + b"0\n" + (data if lastStep < 0 else data[:lastStep + 1]))
+        for field in RESIDUAL_FIELDS:
+            name = field + "Residuals"
+            if np.isnan(residuals[name][-1]):
+                residuals[name] = residuals[name].copy()
+                residuals[name][-1] = continued[name][0]
+    for name in residuals:
+        residuals[name] = np.concatenate((residuals[name], added[name]))
+
+    offset += end
+    if signatureSize < _SIGNATURE_SIZE:
+        signatureSize = min(offset, _SIGNATURE_SIZE)
+        signature = _signature(logPath, signatureSize)
+    _saveIndex(indexPath, residuals, offset, signature, signatureSize)
+    return residuals
@@ -0,0 +1,304 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Store of averaged CFD results across designs and sweeps
+
+Results are recorded when a sweep completes and can be queried without reading the
+case directories again. Designs can be compared from FreeCADCmd:
+
+    FreeCADCmd -c "from Rocket.cfd.ResultsStore import main; main(['--list'])"
+    FreeCADCmd -c "from Rocket.cfd.ResultsStore import main; main(['--compare', 'Cd', '--rocket', 'Alpha', '--output', 'cd.png'])"
+"""
+
+__title__ = "FreeCAD CFD Results Store"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import argparse
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+import FreeCAD
+
+from Rocket.cfd.CaseHash import designHash, conditionsHash, meshHash
+from Rocket.cfd.SweepScheduler import CASE_SUCCESS
+
+RESULTS_STORE_FILE = "CFDResults.db"
+
+# Version of the results table layout, stored in the database
+SCHEMA_VERSION = 2
+
+# Columns of the results table. Each row is a single angle of attack of a design at one set
+# of flow conditions and solver settings
+RESULT_COLUMNS = (
+    ("design", "TEXT NOT NULL"),
+    ("conditions", "TEXT NOT NULL"),
+    ("aoa", "REAL NOT NULL"),
+    ("caseHash", "TEXT"),
+    ("document", "TEXT"),
+    ("analysis", "TEXT"),
+    ("rocket", "TEXT"),
+    ("recorded", "REAL"),
+    ("runTime", "TEXT"),
+    ("message", "TEXT"),
+    ("iterations", "INTEGER"),
+    ("averageLastN", "INTEGER"),
+    ("Fx", "REAL"),
+    ("Fy", "REAL"),
+    ("Fz", "REAL"),
+    ("Mx", "REAL"),
+    ("My", "REAL"),
+    ("Mz", "REAL"),
+    ("Cd", "REAL"),
+    ("Cl", "REAL"),
+    ("Cm", "REAL"),
+    ("cp", "REAL"),
+    ("frontalArea", "REAL"),
+    ("caliber", "REAL"),
+    ("length", "REAL")
+)
+_COLUMN_NAMES = [name for name, _ in RESULT_COLUMNS]
+NUMERIC_COLUMNS = [name for name, columnType in RESULT_COLUMNS if columnType in ("REAL", "INTEGER")]
+
+def defaultStorePath():
+    """ The store is shared by all documents, so designs from different files can be compared """
+    param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Rocket/CFD")
+    path = param.GetString("ResultsStore", "")
+    if len(path) > 0:
+        return path
+    return os.path.join(FreeCAD.getUserAppDataDir(), "Rocket", RESULTS_STORE_FILE)
+
+class ResultsStore:
+    """ SQLite store of averaged results, keyed by design hash and angle of attack """
+
+    def __init__(self, path=None):
+        self._path = path if path is not None else defaultStorePath()
+        directory = os.path.dirname(self._path)
+        if len(directory) > 0:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(self._path)
+        self._connection.row_factory = sqlite3.Row
+        self._createTable()
+
+    def _createTable(self):
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        exists = self._connection.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'results'").fetchone()
+        if exists is not None and version < SCHEMA_VERSION:
+            # Results from the first version have no conditions hash, so they are kept with an empty one
+            self._connection.execute("ALTER TABLE results RENAME TO results_v1")
+        columns = ", ".join(["{} {}".format(name, columnType) for name, columnType in RESULT_COLUMNS])
+        self._connection.execute("CREATE TABLE IF NOT EXISTS results ({}, PRIMARY KEY (design, conditions, aoa))".format(columns))
+        if exists is not None and version < SCHEMA_VERSION:
+            previous = [row[1] for row in self._connection.execute("PRAGMA table_info(results_v1)")]
+            copied = ", ".join([name for name in _COLUMN_NAMES if name in previous])
+            self._connection.execute("INSERT INTO results (conditions, {0}) SELECT '', {0} FROM results_v1".format(copied))
+            self._connection.execute("DROP TABLE results_v1")
+        self._connection.execute("PRAGMA user_version = {}".format(SCHEMA_VERSION))
+        self._connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def getPath(self):
+        return self._path
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def record(self, rows):
+        """ Add or replace results. Each row is a dictionary with entries from RESULT_COLUMNS """
+        statement = "INSERT OR REPLACE INTO results ({}) VALUES ({})".format(", ".join(_COLUMN_NAMES),
+                                                                            ", ".join(["?"] * len(_COLUMN_NAMES)))
+        self._connection.executemany(statement, [[row.get(name) for name in _COLUMN_NAMES] for row in rows])
+        self._connection.commit()
+
+    def _where(self, design=None, rocket=None, document=None, minAOA=None, maxAOA=None, flow=None):
+        conditions = []
+        values = []
+        if design is not None:
+            # Designs can be given by a prefix of the hash
+            conditions.append("design LIKE ?")
+            values.append(design + "%")
+        if flow is not None:
+            conditions.append("conditions LIKE ?")
+            values.append(flow + "%")
+        if rocket is not None:
+            conditions.append("rocket = ?")
+            values.append(rocket)
+        if document is not None:
+            conditions.append("document = ?")
+            values.append(document)
+        if minAOA is not None:
+            conditions.append("aoa >= ?")
+            values.append(minAOA)
+        if maxAOA is not None:
+            conditions.append("aoa <= ?")
+            values.append(maxAOA)
+        if len(conditions) == 0:
+            return "", values
+        return " WHERE " + " AND ".join(conditions), values
+
+    def query(self, design=None, rocket=None, document=None, minAOA=None, maxAOA=None, conditions=None):
+        """
+            Results matching all of the given filters, ordered by design, conditions and angle of attack.
+            The conditions hash tells apart results for the same design at different conditions.
+        """
+        where, values = self._where(design, rocket, document, minAOA, maxAOA, conditions)
+        cursor = self._connection.execute("SELECT * FROM results{} ORDER BY design, conditions, aoa".format(where), values)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def designs(self, rocket=None, document=None):
+        """
+            The recorded designs, oldest first, with the number of angles of attack for each. A design
+            run at more than one set of conditions is listed once for each.
+        """
+        where, values = self._where(rocket=rocket, document=document)
+        cursor = self._connection.execute("SELECT design, conditions, rocket, document, MAX(recorded) AS recorded, "
+                                          "COUNT(*) AS count FROM results{} GROUP BY design, conditions "
+                                          "ORDER BY recorded".format(where), values)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def series(self, design, column, conditions=None):
+        """ The values of a column against the angle of attack for a single design and set of conditions """
+        if column not in NUMERIC_COLUMNS:
+            raise ValueError("Unknown result column '{}'".format(column))
+        where, values = self._where(design=design, flow=conditions)
+        cursor = self._connection.execute("SELECT aoa, {} FROM results{} "
+                                          "ORDER BY aoa".format(column, where), values)
+        rows = cursor.fetchall()
+        return np.array([row[0] for row in rows], dtype=float), np.array([row[1] for row in rows], dtype=float)
+
+def designLabel(design):
+    recorded = time.strftime("%Y-%m-%d %H:%M", time.localtime(design["recorded"]))
+    return "{} {}/{} ({})".format(design["rocket"] or design["document"], design["design"][:8],
+                                  design["conditions"][:6], recorded)
+
+def plotComparison(store, designs, column, path):
+    """ Draw a column against the angle of attack for each design on a single graph """
+    # Import here so the store can be used without matplotlib
+    from Rocket.cfd.Reports.ReportGraphs import graphSpec, drawGraph
+
+    series = []
+    for design in designs:
+        aoa, values = store.series(design["design"], column, design["conditions"])
+        series.append((aoa, values, designLabel(design)))
+    return drawGraph(graphSpec(path, "Angle of Attack (degrees)", column, series))
+
+def recordSweep(analysis, report=None, path=None):
+    """
+        Record the averaged results of each successful case of a sweep. The report is used to
+        read the case results, and is created if it isn't given. Returns the number of results recorded.
+    """
+    if report is None:
+        # Avoid circular imports
+        from Rocket.cfd.Reports.CFDReport import CFDReport
+
+        report = CFDReport(analysis)
+        report.collectStats()
+
+    design = designHash(analysis)
+    conditions = conditionsHash(analysis, meshHash(analysis))
+    rocket = getattr(analysis, "Rocket", None)
+    recorded = time.time()
+    rows = []
+    for angle in analysis.AOAList:
+        status = report.getRunStatus(angle)
+        if status is None or status[2] != CASE_SUCCESS:
+            continue
+        try:
+            forces = report.getForceAverages(angle)
+            moments = report.getMomentAverages(angle)
+            coefficients = report.getCoefficientAverages(angle)
+            cp = report.getCP(str(angle))[3]
+        except (OSError, KeyError, IndexError, ZeroDivisionError):
+            # Incomplete results aren't recorded
+            continue
+
+        rows.append({
+            "design" : design,
+            "conditions" : conditions,
+            "aoa" : float(angle),
+            "caseHash" : status[4] if len(status) > 4 else None,
+            "document" : analysis.Document.Label,
+            "analysis" : analysis.Label,
+            "rocket" : rocket.Label if rocket is not None else None,
+            "recorded" : recorded,
+            "runTime" : status[1],
+            "message" : status[3] if len(status) > 3 else None,
+            "iterations" : int(forces[0]),
+            "averageLastN" : analysis.AverageLastN,
+            "Fx" : float(forces[1]),
+            "Fy" : float(forces[2]),
+            "Fz" : float(forces[3]),
+            "Mx" : float(moments[1]),
+            "My" : float(moments[2]),
+            "Mz" : float(moments[3]),
+            "Cd" : float(coefficients[1]),
+            "Cl" : float(coefficients[4]),
+            "Cm" : float(coefficients[7]),
+            "cp" : float(cp),
+            "frontalArea" : float(report.getFrontalArea()),
+            "caliber" : float(report.getCaliber()),
+            "length" : float(report.getLength())
+        })
+
+    with ResultsStore(path) as store:
+        store.record(rows)
+    return len(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query and compare stored CFD results")
+    parser.add_argument("--store", help="path of the results store")
+    parser.add_argument("--list", action="store_true", help="list the recorded designs")
+    parser.add_argument("--design", action="append", help="design hash or prefix. May be repeated")
+    parser.add_argument("--rocket", help="only include results for this rocket")
+    parser.add_argument("--document", help="only include results from this document")
+    parser.add_argument("--compare", metavar="COLUMN", help="plot this column against AOA for each design")
+    parser.add_argument("--output", default="comparison.png", help="file for the comparison plot")
+    args = parser.parse_args(argv)
+
+    with ResultsStore(args.store) as store:
+        designs = store.designs(rocket=args.rocket, document=args.document)
+        if args.design:
+            designs = [design for design in designs
+                       if any(design["design"].startswith(prefix) for prefix in args.design)]
+
+        if args.list:
+            for design in designs:
+                print("{}\t{}\t{}\t{}".format(design["design"][:12], design["conditions"][:12], design["count"],
+                                            designLabel(design)))
+
+        if args.compare:
+            print(plotComparison(store, designs, args.compare, args.output))
+        elif not args.list:
+            print("\t".join(_COLUMN_NAMES))
+            for design in designs:
+                for row in store.query(design=design["design"], conditions=design["conditions"]):
+                    print("\t".join([str(row[name]) for name in _COLUMN_NAMES]))
+    return 0
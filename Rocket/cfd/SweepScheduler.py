@@ -0,0 +1,423 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for running angle of attack sweeps concurrently"""
+
+__title__ = "FreeCAD CFD Sweep Scheduler"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import time
+
+from CfdOF import CfdTools
+
+from Rocket.cfd.Reports.ResidualLog import updateResidualIndex
+
+CASE_PENDING = "Pending"
+CASE_MESHING = "Meshing"
+CASE_SOLVING = "Solving"
+CASE_SUCCESS = "Success"
+CASE_FAILED = "Failed"
+CASE_SKIPPED = "skipped"
+
+# Failure message of cases stopped by the user. These can be resumed, unlike cases that failed
+ABORT_MESSAGE = "User abort"
+
+STAGE_MESH = 0
+STAGE_SOLVE = 1
+
+# Written to the mesh case directory once meshing succeeds, identifying the inputs of the mesh
+MESH_HASH_FILE = "MeshHash.dat"
+
+def meshIsCurrent(directory : str, key : str) -> bool:
+    """ True if the directory holds a completed mesh with the given hash """
+    if key is None or directory is None:
+        return False
+    if not os.path.isdir(os.path.join(directory, "constant", "polyMesh")):
+        return False
+    try:
+        with open(os.path.join(directory, MESH_HASH_FILE), "r") as hashFile:
+            return hashFile.read().strip() == key
+    except OSError:
+        return False
+
+def writeMeshHash(directory : str, key : str) -> None:
+    with open(os.path.join(directory, MESH_HASH_FILE), "w") as hashFile:
+        hashFile.write(key + "\n")
+
+# Written to the case directory when the case is written, identifying the inputs of the case
+CASE_HASH_FILE = "CaseHash.dat"
+
+# Runs the solver from the latest time directory without rewriting or re-initializing the case
+RESUME_SCRIPT = "Allresume"
+_RESUME_SCRIPT_TEXT = """#!/bin/bash
+cd "${0%/*}" || exit 1
+. $WM_PROJECT_DIR/bin/tools/RunFunctions
+
+foamDictionary -entry startFrom -set latestTime system/controlDict > /dev/null
+foamDictionary -entry stopAt -set endTime system/controlDict > /dev/null
+application=$(getApplication)
+
+# Append to the existing log so the residual index continues from where it stopped
+set -o pipefail
+if [ -d processor0 ]; then
+    mpirun -np $(getNumberOfProcessors) $application -parallel 2>&1 | tee -a log.$application
+else
+    $application 2>&1 | tee -a log.$application
+fi
+"""
+
+def caseIsCurrent(directory : str, key : str) -> bool:
+    """ True if the case directory was written for the given hash """
+    if key is None or directory is None:
+        return False
+    try:
+        with open(os.path.join(directory, CASE_HASH_FILE), "r") as hashFile:
+            return hashFile.read().strip() == key
+    except OSError:
+        return False
+
+def writeCaseHash(directory : str, key : str) -> None:
+    with open(os.path.join(directory, CASE_HASH_FILE), "w") as hashFile:
+        hashFile.write(key + "\n")
+
+def _timeDirectories(directory : str) -> list:
+    times = []
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            try:
+                times.append(float(name))
+            except ValueError:
+                pass
+    return times
+
+def latestTime(directory : str) -> float:
+    """ The latest solution time written to the case, including decomposed cases """
+    times = _timeDirectories(directory) + _timeDirectories(os.path.join(directory, "processor0"))
+    if len(times) == 0:
+        return 0.0
+    return max(times)
+
+def writeResumeScript(directory : str) -> str:
+    path = os.path.join(directory, RESUME_SCRIPT)
+    with open(path, "w") as script:
+        script.write(_RESUME_SCRIPT_TEXT)
+    os.chmod(path, 0o755)
+    return RESUME_SCRIPT
+
+def canResume(previous : list) -> bool:
+    """
+        True if a case with the given status row from an earlier sweep can continue from
+        its latest time. Failed cases, such as diverged solutions, are run again from scratch.
+    """
+    if previous is None or len(previous) < 3 or previous[2] != CASE_FAILED:
+        return True
+    return len(previous) > 3 and previous[3] == ABORT_MESSAGE
+
+def readRunStatus(path : str) -> dict:
+    """ The rows of an existing status file, keyed by angle of attack """
+    status = {}
+    try:
+        with open(path, "r") as runStatus:
+            for line in runStatus:
+                row = line.rstrip("\n").split("\t")
+                if len(row) > 2:
+                    status[row[0]] = row
+    except OSError:
+        pass
+    return status
+
+def availableCores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+def processesPerCase(solver, mesher) -> int:
+    """ The number of cores used by a single case """
+    ranks = 1
+    if getattr(solver, "Parallel", False):
+        ranks = max(ranks, int(getattr(solver, "ParallelCores", 1)))
+    if mesher is not None:
+        ranks = max(ranks, int(getattr(mesher, "NumberOfProcesses", 1)))
+    return ranks
+
+def concurrentCases(coreBudget : int, ranksPerCase : int, caseCount : int) -> int:
+    """ The number of cases that can run at once within the core budget """
+    return max(1, min(caseCount, coreBudget // max(ranksPerCase, 1)))
+
+class SweepCase:
+    """
+        A single angle of attack in the sweep. The commands are filled in when the case
+        directories are written.
+    """
+    def __init__(self, aoa : float) -> None:
+        self.aoa = aoa
+        self.prepared = False
+        self.status = CASE_PENDING
+        self.message = ''
+
+        self.meshCommand = None
+        self.meshDirectory = None
+        self.meshEnvironment = None
+        self.meshKey = None
+        self.meshOwner = None # Case that writes and runs the shared mesh
+        self.meshed = False
+        self.caseKey = None
+        self.timeText = None # Run time of a case reused from an earlier sweep
+        self.solveCommand = None
+        self.solveDirectory = None
+        self.solveEnvironment = None
+        self.runner = None
+        self.monitor = None # Optional ConvergenceMonitor, stopping the solver early
+
+        self._start = None
+        self._end = None
+        self.process = None
+        self.stage = None
+
+    def elapsed(self) -> float:
+        if self._start is None:
+            return 0.0
+        if self._end is None:
+            return time.time() - self._start
+        return self._end - self._start
+
+    def isDone(self) -> bool:
+        return self.status in (CASE_SUCCESS, CASE_FAILED, CASE_SKIPPED)
+
+    def reuse(self, timeText : str) -> None:
+        """ Mark the case as complete from an earlier sweep """
+        self.prepared = True
+        self.status = CASE_SUCCESS
+        self.message = "Reused"
+        self.timeText = timeText
+
+    def fail(self, message : str) -> None:
+        self.status = CASE_FAILED
+        if len(self.message) == 0:
+            self.message = message
+
+class SweepScheduler:
+    """
+        Runs the mesher and solver for each case as external processes, keeping up to
+        the concurrent limit running at once. Processes report back through their
+        finished hooks, so nothing blocks the GUI while the cases run.
+    """
+    def __init__(self, cases : list, concurrent : int, statusPath : str, processFactory,
+                 prepare=None, messageHook=None, finishedHook=None) -> None:
+        self._cases = cases
+        self._concurrent = max(1, concurrent)
+        self._statusPath = statusPath
+        self._processFactory = processFactory
+        self._prepare = prepare
+        self._messageHook = messageHook
+        self._finishedHook = finishedHook
+
+        self._start = None
+        self._running = False
+
+    def isRunning(self) -> bool:
+        return self._running
+
+    def cases(self) -> list:
+        return self._cases
+
+    def start(self) -> None:
+        self._start = time.time()
+        self._running = True
+        self.writeStatus()
+        self._launch()
+
+    def stop(self, message : str = ABORT_MESSAGE) -> None:
+        self._running = False
+        for case in self._cases:
+            if case.process is not None:
+                case.fail(message)
+                case._end = time.time()
+                process = case.process
+                case.process = None
+                process.terminate()
+                process.waitForFinished()
+            elif not case.isDone():
+                case.status = CASE_SKIPPED
+        self._finish()
+
+    def _message(self, message : str, colourType : str = None) -> None:
+        if self._messageHook is not None:
+            self._messageHook(message, colourType)
+
+    def _active(self) -> int:
+        return len([case for case in self._cases if case.process is not None])
+
+    def _launch(self) -> None:
+        for case in self._cases:
+            if not self._running or self._active() >= self._concurrent:
+                break
+            if case.status != CASE_PENDING:
+                continue
+
+            if not case.prepared and self._prepare is not None:
+                self._prepare(case)
+            if case.status == CASE_SUCCESS:
+                # Reused from an earlier sweep
+                continue
+            if case.status == CASE_FAILED or not case.prepared:
+                case.fail("Case setup failure")
+                continue
+
+            owner = case.meshOwner
+            if owner is not None and not owner.meshed:
+                if owner.isDone():
+                    case.fail("Mesher error")
+                # Otherwise wait for the shared mesh
+                continue
+
+            case._start = time.time()
+            if owner is not None or case.meshCommand is None:
+                # The mesh is shared or already exists
+                self._message("AOA={}: Reusing mesh".format(case.aoa))
+                case.meshed = True
+                self._startStage(case, STAGE_SOLVE)
+            else:
+                self._startStage(case, STAGE_MESH)
+
+        self.writeStatus()
+        if self._active() == 0 and all(case.isDone() for case in self._cases):
+            self._finish()
+
+    def _startStage(self, case : SweepCase, stage : int) -> None:
+        if stage == STAGE_MESH:
+            case.status = CASE_MESHING
+            command = case.meshCommand
+            directory = case.meshDirectory
+            environment = case.meshEnvironment
+        else:
+            case.status = CASE_SOLVING
+            command = case.solveCommand
+            directory = case.solveDirectory
+            environment = case.solveEnvironment
+
+        if command is None:
+            case.fail("Solver error" if stage == STAGE_SOLVE else "Mesher error")
+            case._end = time.time()
+            return
+
+        case.stage = stage
+        process = self._processFactory(finished_hook=lambda exitCode: self._stageFinished(case, exitCode),
+                                       stdout_hook=lambda lines: self._output(case, lines),
+                                       stderr_hook=lambda lines: self._errorOutput(case, lines))
+        case.process = process
+        process.start(command, env_vars=environment, working_dir=directory)
+        if process.waitForStarted():
+            self._message("AOA={}: {} started".format(case.aoa, "Mesher" if stage == STAGE_MESH else "Solver"))
+        else:
+            case.process = None
+            case.fail("Error starting process")
+            case._end = time.time()
+            self._message("AOA={}: Error starting process".format(case.aoa), 'Error')
+
+    def _output(self, case : SweepCase, lines : str) -> None:
+        if case.stage == STAGE_SOLVE and case.runner is not None:
+            case.runner.processOutput(lines)
+            if case.monitor is not None and not case.monitor.stopped and case.monitor.update(case.runner):
+                self._message("AOA={}: Converged at iteration {}, stopping".format(case.aoa, int(case.monitor.stopTime)))
+
+    def _errorOutput(self, case : SweepCase, lines : str) -> None:
+        if case.process is None:
+            return
+        error = case.process.processErrorOutput(lines)
+        if error:
+            self._message("AOA={}: {}".format(case.aoa, error), 'Error')
+
+    def _stageFinished(self, case : SweepCase, exitCode : int) -> None:
+        if case.process is None:
+            # Terminated by stop()
+            return
+        case.process = None
+
+        if case.stage == STAGE_SOLVE:
+            self._indexResiduals(case)
+
+        if exitCode != 0:
+            if case.stage == STAGE_MESH:
+                self._message("AOA={}: Meshing exited with error".format(case.aoa), 'Error')
+                case.fail("Mesher error")
+            else:
+                self._message("AOA={}: Simulation exited with error".format(case.aoa), 'Error')
+                case.fail("Solver error")
+            case._end = time.time()
+        elif case.stage == STAGE_MESH:
+            self._message("AOA={}: Meshing completed".format(case.aoa))
+            case.meshed = True
+            if case.meshKey is not None:
+                writeMeshHash(case.meshDirectory, case.meshKey)
+            if self._running:
+                self._startStage(case, STAGE_SOLVE)
+            else:
+                case.status = CASE_SKIPPED
+        else:
+            self._message("AOA={}: Simulation finished successfully".format(case.aoa))
+            case.status = CASE_SUCCESS
+            if case.monitor is not None and case.monitor.stopped:
+                case.message = "Converged, {} iterations saved".format(case.monitor.iterationsSaved())
+            case._end = time.time()
+
+        self._launch()
+
+    def _indexResiduals(self, case : SweepCase) -> None:
+        # Index the log while it is fresh so reports don't have to parse it
+        if case.solveDirectory is None:
+            return
+        try:
+            updateResidualIndex(case.solveDirectory)
+        except (OSError, ValueError) as ex:
+            self._message("AOA={}: Unable to index residuals: {}".format(case.aoa, ex), 'Warning')
+
+    def writeStatus(self, total : bool = False) -> None:
+        """ Rewrite the status file, one line per case in sweep order """
+        with open(self._statusPath, "w") as runStatus:
+            for case in self._cases:
+                timeText = case.timeText
+                if timeText is None:
+                    timeText = CfdTools.formatTimer(case.elapsed())
+                runStatus.write("{}\t{}\t{}\t{}\t{}\n".format(
+                    str(case.aoa),
+                    timeText,
+                    case.status,
+                    case.message,
+                    case.caseKey or '')
+                )
+            if total and self._start is not None:
+                runStatus.write("Total\t{}\n".format(CfdTools.formatTimer(time.time() - self._start)))
+
+    def _finish(self) -> None:
+        if self._start is None:
+            return
+        self._running = False
+        self.writeStatus(total=True)
+
+        saved = sum([case.monitor.iterationsSaved() for case in self._cases
+                     if case.monitor is not None and case.status == CASE_SUCCESS])
+        if saved > 0:
+            self._message("{} iterations saved by stopping converged cases".format(saved))
+        self._start = None
+        if self._finishedHook is not None:
+            self._finishedHook()
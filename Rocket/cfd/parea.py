@@ -25,7 +25,10 @@
 # *                                                                         *
 # ***************************************************************************
 
+import math
 
+import numpy as np
+import shapely
 from shapely.geometry import Polygon
 from shapely.ops import unary_union
 
@@ -33,97 +36,133 @@ from shapely.ops import unary_union
 
 x, y = [0, 1]
 
+# Triangles with a projected area (mm^2) at or below this don't change the silhouette
+MIN_TRIANGLE_AREA = 1e-9
+
+# Default pixel size in mm for rasterized estimates
+DEFAULT_PIXEL_SIZE = 0.5
+
 #--- functions ----------------------------------------------------------------+
 
 
-def _area2(a, b, c):
-    '''Calculate twice the area of a 2D triangle
-    
+def _meshTriangles(mesh):
+    '''MESH TRIANGLES
+
+    Extract the mesh facets in a single call and project them on to the YZ plane
+
     Parameters
     ----------
-    a, b, c : tuple
-        vertex tuples containing two floats (x, y)
-    
+    mesh : existing mesh
+
     Returns
     -------
-    float
-        twice the triangle area
+    array of shape (n, 3, 2)
+    '''
+    points, facets = mesh.Topology
+    if len(facets) == 0:
+        return np.zeros((0, 3, 2))
+
+    vertices = np.array(points, dtype=float)[:, 1:3]
+    return vertices[np.array(facets, dtype=np.intp)]
+
+
+def _area2(triangles):
+    '''Calculate twice the signed area of each 2D triangle
 
     References
     ----------
-    [1] Computational Geometry in C by Joseph O'Rourke    
+    [1] Computational Geometry in C by Joseph O'Rourke
     '''
+    a = triangles[:, 0]
+    b = triangles[:, 1]
+    c = triangles[:, 2]
     return (
-        (b[x] - a[x]) * (c[y] - a[y]) -
-        (c[x] - a[x]) * (b[y] - a[y]))
-
-
-def _mungeTriangle(v1, v2, v3, min_area=0):
-    '''MUNGE TRIANGLE
-    
-    For every new triangle that gets added, it  needs to pass some basic 
-    quality controls and if need be, fixed.
-    
-    1) Triangles with zero area are automatically rejected.
-    
-    2) Triangles must have three unique vertices.
-    
-    3) All triangles will be returned with a CCW winding regardless of the 
-    winding upon input.
-    
-    4) Final output is a list of three edges, consisting of vertex master list 
-    indices.
-    
-    Inputs
-    ------
-    v1, v2, v3 : tuples
-    
-    Returns
-    -------
-    t : a list consisting of three edge tuples
+        (b[:, x] - a[:, x]) * (c[:, y] - a[:, y]) -
+        (c[:, x] - a[:, x]) * (b[:, y] - a[:, y]))
+
+
+def _silhouetteTriangles(triangles, min_area=MIN_TRIANGLE_AREA):
+    '''SILHOUETTE TRIANGLES
+
+    On a closed mesh the triangles facing the viewer cover the whole projection,
+    so the back facing triangles only add work to the union. Degenerate
+    triangles are rejected.
+
+    The side with the larger projected area is kept, so meshes with reversed
+    facet orientation give the same result.
+    '''
+    a2 = _area2(triangles)
+    front = a2 > 2.0 * min_area
+    back = a2 < -2.0 * min_area
+    if -np.sum(a2[back]) > np.sum(a2[front]):
+        return triangles[back]
+    return triangles[front]
+
+
+def _unionArea(triangles):
+    if len(triangles) == 0:
+        return 0.0
+
+    if hasattr(shapely, "polygons"):
+        # Shapely 2 builds all the polygons in one call
+        return shapely.union_all(shapely.polygons(triangles)).area
+
+    return unary_union([Polygon(t) for t in triangles]).area
+
+
+def _rasterArea(triangles, pixel_size):
+    '''RASTER AREA
+
+    Count the pixels whose centers fall inside the silhouette. Each pixel row is
+    intersected with all the triangles at once, and the covered spans are merged
+    with a difference array.
     '''
-    
-    # first check if the triangle has three unique vertices
-    if v1==v2 or v2==v3 or v3==v1: return []
-
-    a2 = _area2(v1, v2, v3)
-    
-    # if the triangle has cw winding, reverse the winding order 
-    if a2 < 0:
-        t_verts = [v1, v3, v2]
-    
-    # the winding order is correct, leave vertices alone
-    if a2 > 0:
-        t_verts = [v1, v2, v3]
-        
-    # minimum triangle area check
-    if abs(a2 * 0.5)<=min_area:
-        return []
-        
-    return t_verts
-
-def _projectTriangleToXYPlane(tri_3d):
-    return [(v[1], v[2]) for v in tri_3d]
-
-def _meshTriangleGenerator(mesh):
-    # initialize
-    triangle = []
-
-    # cycle through stl line by line
-    for i, facet in enumerate(mesh.Facets):
-        if len(facet.Points) != 3:
-            print("Points = {}".format(facet.Points))
-        else:
-            for point in facet.Points:
-                # print(type(point[0]))
-                # print(dir(point[0]))
-                x, y, z = float(point[0]), float(point[1]), float(point[2])
-                triangle.append([x, y, z])
-            yield triangle
-            triangle = []
-
-def _loadMesh(mesh):
-    '''LOAD STL
+    if len(triangles) == 0:
+        return 0.0
+
+    low = triangles.reshape(-1, 2).min(axis=0)
+    high = triangles.reshape(-1, 2).max(axis=0)
+    columns = max(int(math.ceil((high[x] - low[x]) / pixel_size)), 1)
+    rows = max(int(math.ceil((high[y] - low[y]) / pixel_size)), 1)
+
+    start = triangles
+    end = np.roll(triangles, -1, axis=1)
+    y_min = triangles[:, :, y].min(axis=1)
+    y_max = triangles[:, :, y].max(axis=1)
+
+    covered = 0
+    for row in range(rows):
+        center = low[y] + (row + 0.5) * pixel_size
+        active = (y_min <= center) & (y_max >= center)
+        if not active.any():
+            continue
+
+        p0 = start[active]
+        p1 = end[active]
+        y0 = p0[:, :, y]
+        y1 = p1[:, :, y]
+        crosses = (np.minimum(y0, y1) <= center) & (np.maximum(y0, y1) >= center) & (y0 != y1)
+        t = np.where(crosses, (center - y0) / np.where(crosses, y1 - y0, 1.0), 0.0)
+        edge_x = p0[:, :, x] + t * (p1[:, :, x] - p0[:, :, x])
+        left = np.where(crosses, edge_x, np.inf).min(axis=1)
+        right = np.where(crosses, edge_x, -np.inf).max(axis=1)
+
+        first = np.ceil((left - low[x]) / pixel_size - 0.5)
+        last = np.floor((right - low[x]) / pixel_size - 0.5)
+        valid = (left <= right) & (first <= last)
+        first = np.clip(first[valid], 0, columns - 1).astype(np.intp)
+        last = np.clip(last[valid], 0, columns - 1).astype(np.intp)
+
+        spans = np.zeros(columns + 1, dtype=np.intp)
+        np.add.at(spans, first, 1)
+        np.add.at(spans, last + 1, -1)
+        covered += np.count_nonzero(np.cumsum(spans[:-1]) > 0)
+
+    return covered * pixel_size * pixel_size
+
+
+def calculateProjectedArea(mesh):
+    '''CALCULATE PROJECTED AREA
 
     Parameters
     ----------
@@ -131,34 +170,45 @@ def _loadMesh(mesh):
 
     Returns
     -------
-    list of shapely polygon objects
+    float
     '''
+    triangles = _silhouetteTriangles(_meshTriangles(mesh))
+    return _unionArea(triangles)
 
-    # assemble stl
-    triangles = []
-    for i, t in enumerate(_meshTriangleGenerator(mesh)):
-        v1, v2, v3 = _projectTriangleToXYPlane(t)
-        verts = _mungeTriangle(v1, v2, v3)
-        if len(verts) == 3: triangles.append(Polygon(verts))
 
-    return triangles
+def calculateRasterArea(mesh, pixel_size=DEFAULT_PIXEL_SIZE):
+    '''CALCULATE RASTER AREA
 
-def calculateProjectedArea(mesh):
-    '''CALCULATE PROJECTED AREA
+    A quick estimate of the projected area. The error is bounded by roughly one
+    pixel along the silhouette edge, or pixel_size times the silhouette perimeter.
 
     Parameters
     ----------
     mesh : existing mesh
+    pixel_size : pixel edge length in mm
 
     Returns
     -------
     float
     '''
+    triangles = _silhouetteTriangles(_meshTriangles(mesh))
+    return _rasterArea(triangles, pixel_size)
+
 
-    # bulk load all triangles from stl
-    triangles = _loadMesh(mesh)
+def calculateAnalyticArea(max_radius, fin_areas=()):
+    '''CALCULATE ANALYTIC AREA
 
-    # merge triangles into single polygon
-    sub_polys = unary_union(triangles)
+    The frontal area of an axisymmetric body with fins at zero angle of attack.
+    The body projects to a disc of the maximum profile radius, and each fin adds
+    its frontal projection outside the body.
+
+    Parameters
+    ----------
+    max_radius : maximum body radius
+    fin_areas : frontal area of each fin or fin set
 
-    return unary_union(sub_polys).area
+    Returns
+    -------
+    float
+    '''
+    return math.pi * max_radius * max_radius + sum(fin_areas)
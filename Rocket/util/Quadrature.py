@@ -0,0 +1,75 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Numerical integration for analytic component geometry"""
+
+__title__ = "FreeCAD Rocket Quadrature"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import math
+from typing import Callable
+
+# Five point Gauss-Legendre nodes and weights on the interval [-1, 1]
+_NODES = (
+    0.0,
+    -math.sqrt(5.0 - 2.0 * math.sqrt(10.0 / 7.0)) / 3.0,
+    math.sqrt(5.0 - 2.0 * math.sqrt(10.0 / 7.0)) / 3.0,
+    -math.sqrt(5.0 + 2.0 * math.sqrt(10.0 / 7.0)) / 3.0,
+    math.sqrt(5.0 + 2.0 * math.sqrt(10.0 / 7.0)) / 3.0,
+)
+_WEIGHTS = (
+    128.0 / 225.0,
+    (322.0 + 13.0 * math.sqrt(70.0)) / 900.0,
+    (322.0 + 13.0 * math.sqrt(70.0)) / 900.0,
+    (322.0 - 13.0 * math.sqrt(70.0)) / 900.0,
+    (322.0 - 13.0 * math.sqrt(70.0)) / 900.0,
+)
+
+# Number of sub intervals. Profiles are smooth between their ends, so this gives
+# results well within the modelling tolerance
+DEFAULT_PANELS = 20
+
+def integrate(function : Callable[[float], float], start : float, end : float, panels : int = DEFAULT_PANELS) -> float:
+    """
+        Integrate the function over [start, end] using composite Gauss-Legendre quadrature.
+        The function is never evaluated at the end points, which avoids singular derivatives
+        at the tip of curved profiles.
+    """
+    if end <= start or panels < 1:
+        return 0.0
+
+    width = (end - start) / panels
+    half = width / 2.0
+    total = 0.0
+    for panel in range(panels):
+        center = start + (panel + 0.5) * width
+        for node, weight in zip(_NODES, _WEIGHTS):
+            total += weight * function(center + half * node)
+    return total * half
+
+def derivative(function : Callable[[float], float], x : float, start : float, end : float) -> float:
+    """ Central difference derivative, one sided at the end of the interval """
+    step = max((end - start) * 1e-6, 1e-9)
+    low = max(x - step, start)
+    high = min(x + step, end)
+    if high <= low:
+        return 0.0
+    return (function(high) - function(low)) / (high - low)
@@ -43,6 +43,8 @@ from Ui.Commands.CmdFinCan import CmdFinCan
 from Ui.Commands.CmdRingtail import CmdRingtail
 from Ui.Commands.CmdParachute import CmdParachute
 from Ui.Commands.CmdEditTree import CmdMoveUp, CmdMoveDown
+from Ui.Commands.CmdLevelOfDetail import CmdPreviewDetail
+from Ui.Commands.CmdParallelRecompute import CmdParallelRecompute
 
 # Calculators
 from Ui.Commands.CmdCalcBlackPowder import CmdCalcBlackPowder
@@ -108,6 +110,8 @@ FreeCADGui.addCommand('Rocket_ScalingTubes', CmdScalingTubes())
 
 FreeCADGui.addCommand('Rocket_MoveUp', CmdMoveUp())
 FreeCADGui.addCommand('Rocket_MoveDown', CmdMoveDown())
+FreeCADGui.addCommand('Rocket_PreviewDetail', CmdPreviewDetail())
+FreeCADGui.addCommand('Rocket_ParallelRecompute', CmdParallelRecompute())
 
 FreeCADGui.addCommand('Rocket_NewSketch', CmdNewSketch())
 
@@ -30,7 +30,15 @@ from Tests.TestCenteringRing import CenteringRingTests
 from Tests.TestNoses import NoseTests
 from Tests.TestTransition import TransitionTests
 from Tests.TestFlutter import FinFlutterTestCases
+from Tests.TestAtmosphere import AtmosphereTests
 from Tests.TestFins import FinTests
+from Tests.TestGeometry import GeometryTests
+from Tests.TestParallelRecompute import ParallelRecomputeTests
+from Tests.TestSweepScheduler import SweepSchedulerTests, SweepHelperTests
+from Tests.TestDatReader import DatReaderTests
+from Tests.TestResidualLog import ResidualLogTests
+from Tests.TestConvergenceMonitor import ConvergenceMonitorTests
+from Tests.TestResultsStore import ResultsStoreTests
 # from Tests.TestFinCans import FinCanTests
 
 def runRocketUnitTests():
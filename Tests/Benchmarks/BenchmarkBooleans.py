@@ -0,0 +1,118 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Timing comparison of chained and multi-argument booleans"""
+
+__title__ = "FreeCAD Boolean Benchmarks"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import time
+import unittest
+
+import FreeCAD
+
+from Rocket.Constants import FIN_TYPE_TRAPEZOID, FIN_DEBUG_FULL
+from Rocket.ShapeHandlers.BulkheadShapeHandler import BulkheadShapeHandler
+from Rocket.ShapeHandlers.CenteringRingShapeHandler import CenteringRingShapeHandler
+from Rocket.ShapeHandlers.FinTrapezoidShapeHandler import FinTrapezoidShapeHandler
+from Ui.Commands.CmdBulkhead import makeBulkhead
+from Ui.Commands.CmdCenteringRing import makeCenteringRing
+from Ui.Commands.CmdFin import makeFin
+
+ITERATIONS = 5
+
+def _chainedFuse(base, tools):
+    for tool in tools:
+        if tool is not None:
+            base = base.fuse(tool)
+    return base
+
+def _chainedCut(base, tools):
+    for tool in tools:
+        base = base.cut(tool)
+    return base
+
+class BooleanBenchmarks(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("BooleanBenchmark")
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+
+    def _time(self, function):
+        start = time.perf_counter()
+        for i in range(ITERATIONS):
+            shape = function()
+        return (time.perf_counter() - start) / ITERATIONS, shape
+
+    def _compare(self, name, chained, multi):
+        chainedTime, chainedShape = self._time(chained)
+        multiTime, multiShape = self._time(multi)
+        print("{0}: chained {1:.4f}s, multi {2:.4f}s, speedup {3:.2f}x".format(name, chainedTime, multiTime, chainedTime / multiTime))
+
+        self.assertTrue(multiShape.isValid(), name)
+        self.assertAlmostEqual(multiShape.Volume, chainedShape.Volume, delta=chainedShape.Volume * 1e-6, msg=name)
+
+    def testBulkheadHoles(self):
+        feature = makeBulkhead('Bulkhead')
+        feature._obj.Diameter = 100.0
+        feature._obj.Holes = True
+        feature._obj.HoleDiameter = 5.0
+        feature._obj.HoleCenter = 35.0
+        feature._obj.HoleCount = 24
+        self.Doc.recompute()
+
+        handler = BulkheadShapeHandler(feature._obj)
+        self._compare("Bulkhead holes",
+                      lambda: _chainedCut(handler._drawBody(), handler._makeHoles()),
+                      handler._drawBulkhead)
+
+    def testCenteringRingHoles(self):
+        feature = makeCenteringRing('CenteringRing')
+        feature._obj.Diameter = 100.0
+        feature._obj.CenterDiameter = 30.0
+        feature._obj.Notched = True
+        feature._obj.NotchWidth = 3.0
+        feature._obj.NotchHeight = 3.0
+        feature._obj.Holes = True
+        feature._obj.HoleDiameter = 5.0
+        feature._obj.HoleCenter = 35.0
+        feature._obj.HoleCount = 12
+        self.Doc.recompute()
+
+        handler = CenteringRingShapeHandler(feature._obj)
+        self._compare("Centering ring holes",
+                      lambda: _chainedCut(handler._drawBody(), handler._makeHoles()),
+                      handler._drawCenteringRing)
+
+    def testFinFilletsTtw(self):
+        feature = makeFin('Fin')
+        feature._obj.FinType = FIN_TYPE_TRAPEZOID
+        feature._obj.FinSet = False
+        feature._obj.Fillets = True
+        feature._obj.Ttw = True
+        self.Doc.recompute()
+
+        handler = FinTrapezoidShapeHandler(feature._obj)
+        self._compare("Fin fillets and TTW",
+                      lambda: _chainedFuse(handler._finOnlyShape(FIN_DEBUG_FULL), [handler._makeFillet(), handler._makeTtw()]),
+                      lambda: handler._drawFinDebug(FIN_DEBUG_FULL))
@@ -0,0 +1,66 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from Analyzers.AtmosphereTable import AtmosphereTable, evaluateModel, ALTITUDE_MIN, ALTITUDE_MAX, \
+    MAX_RELATIVE_ERROR, COESA_BASES
+
+class AtmosphereTests(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "atmosphere_table.npz")
+        self._table = AtmosphereTable(self._path)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def testMaximumError(self):
+        # Dense sampling plus the points either side of the model breaks
+        breaks = np.array(COESA_BASES)
+        altitudes = np.concatenate([np.linspace(ALTITUDE_MIN, ALTITUDE_MAX, 200001),
+                                    np.random.default_rng(0).uniform(ALTITUDE_MIN, ALTITUDE_MAX, 100000),
+                                    breaks, np.nextafter(breaks, -np.inf), np.nextafter(breaks, np.inf)])
+
+        expected = evaluateModel(altitudes)
+        actual = np.array(self._table.conditions(altitudes))
+        error = np.abs(actual / expected - 1.0).max(axis=1)
+        for name, value in zip(["density", "temperature", "pressure", "speed of sound", "viscosity"], error):
+            self.assertLessEqual(value, MAX_RELATIVE_ERROR, name)
+
+    def testCache(self):
+        self.assertTrue(os.path.exists(self._path))
+
+        altitudes = np.linspace(ALTITUDE_MIN, ALTITUDE_MAX, 1001)
+        cached = AtmosphereTable(self._path)
+        self.assertTrue(np.array_equal(np.array(cached.conditions(altitudes)), np.array(self._table.conditions(altitudes))))
+
+    def testScalar(self):
+        self.assertIsInstance(self._table.pressure(1.0), float)
+        self.assertLessEqual(abs(self._table.temperature(0.0) / 288.15 - 1.0), MAX_RELATIVE_ERROR)
+        self.assertLessEqual(abs(self._table.pressure(0.0) / 101325.0 - 1.0), MAX_RELATIVE_ERROR)
@@ -46,3 +46,19 @@ class BodyTubeTests(unittest.TestCase):
         self.Doc.recompute()
 
         self._checkShape(feature, "Basic")
+
+    def testSolidShape(self):
+        feature = makeBodyTube('BodyTube')
+        self.Doc.recompute()
+
+        first = feature.getSolidShape(feature._obj)
+        second = feature.getSolidShape(feature._obj)
+        self.assertTrue(first.isValid())
+        self.assertTrue(first.isPartner(second), "Solid shape not reused")
+
+        # Changing the tube discards the cached solid
+        feature._obj.Length = 2.0 * float(feature._obj.Length)
+        self.Doc.recompute()
+        third = feature.getSolidShape(feature._obj)
+        self.assertFalse(first.isPartner(third), "Solid shape not invalidated")
+        self.assertGreater(third.Volume, first.Volume)
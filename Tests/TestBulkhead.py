@@ -27,6 +27,7 @@ __url__ = "https://www.davesrocketshop.com"
 import FreeCAD
 import unittest
 
+from Rocket.ShapeHandlers.ShapeTemplates import clearTemplates, templateStatistics
 from Ui.Commands.CmdBulkhead import makeBulkhead
 
 class BulkheadTests(unittest.TestCase):
@@ -61,3 +62,19 @@ class BulkheadTests(unittest.TestCase):
         self.Doc.recompute()
 
         self._checkShape(feature, "Holes")
+
+    def testTemplate(self):
+        clearTemplates()
+        first = makeBulkhead('Bulkhead')
+        first._obj.InstanceCount = 3
+        second = makeBulkhead('Bulkhead')
+        self.Doc.recompute()
+
+        self._checkShape(first, "Template")
+        self._checkShape(second, "Template")
+        self.assertAlmostEqual(first._obj.Shape.Volume, 3 * second._obj.Shape.Volume, places=6)
+
+        # Identical bulkheads share a single template
+        templates, hits, misses = templateStatistics()
+        self.assertEqual(templates, 1)
+        self.assertGreater(hits, 0)
@@ -0,0 +1,106 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Test cases for stopping CFD cases once converged"""
+
+__title__ = "FreeCAD Convergence Monitor Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import tempfile
+import unittest
+
+from Rocket.cfd.Reports.DatReader import clearDatCache
+from Rocket.cfd.Reports.ResidualLog import RESIDUAL_FIELDS
+from Rocket.cfd.ConvergenceMonitor import ConvergenceMonitor, CHECK_INTERVAL
+
+from Tests.TestDatReader import writeCoefficients
+
+class FakeRunner:
+    """ The solver output parsed by a runner """
+
+    def __init__(self, iterations, residual):
+        self.time = list(range(1, iterations + 1))
+        for field in RESIDUAL_FIELDS:
+            setattr(self, field + "Residuals", [residual] * iterations)
+
+class ConvergenceMonitorTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._case = self._directory.name
+        os.makedirs(os.path.join(self._case, "system"))
+        self._controlDict = os.path.join(self._case, "system", "controlDict")
+        with open(self._controlDict, "w") as controlDict:
+            controlDict.write("startFrom latestTime;\nstopAt endTime;\nendTime 1000;\n")
+        clearDatCache()
+
+    def tearDown(self):
+        clearDatCache()
+        self._directory.cleanup()
+
+    def _stopAt(self):
+        with open(self._controlDict, "r") as controlDict:
+            return controlDict.read().splitlines()[1]
+
+    def testConverged(self):
+        writeCoefficients(self._case, 0, range(1, 101))
+        monitor = ConvergenceMonitor(self._case, 20, 1e-4, 1e-3)
+
+        self.assertTrue(monitor.update(FakeRunner(100, 1e-4)))
+        self.assertEqual(self._stopAt(), "stopAt writeNow;")
+        self.assertEqual(monitor.stopTime, 100.0)
+        self.assertEqual(monitor.iterationsSaved(), 900)
+
+    def testNotConverged(self):
+        # Residuals above the tolerance
+        writeCoefficients(self._case, 0, range(1, 101))
+        monitor = ConvergenceMonitor(self._case, 20, 1e-4, 1e-3)
+        self.assertFalse(monitor.update(FakeRunner(100, 1e-2)))
+
+        # Coefficients still changing
+        writeCoefficients(self._case, 0, range(1, 111), cd=0.5)
+        writeCoefficients(self._case, 105, range(106, 121), cd=0.6)
+        self.assertFalse(monitor.update(FakeRunner(120, 1e-4)))
+        self.assertEqual(self._stopAt(), "stopAt endTime;")
+        self.assertEqual(monitor.iterationsSaved(), 0)
+
+    def testCheckInterval(self):
+        writeCoefficients(self._case, 0, range(1, 101))
+        monitor = ConvergenceMonitor(self._case, 20, 1e-4, 1e-3)
+
+        # Too few iterations for the window
+        self.assertFalse(monitor.update(FakeRunner(10, 1e-4)))
+
+        self.assertFalse(monitor.update(FakeRunner(30, 1e-2)))
+        # Not checked again until the interval has passed
+        self.assertFalse(monitor.update(FakeRunner(30 + CHECK_INTERVAL - 1, 1e-4)))
+        self.assertTrue(monitor.update(FakeRunner(30 + CHECK_INTERVAL, 1e-4)))
+
+    def testResumed(self):
+        # Only the coefficients written since the run resumed from time 100 count
+        writeCoefficients(self._case, 0, range(1, 101))
+        writeCoefficients(self._case, 100, range(101, 111))
+        monitor = ConvergenceMonitor(self._case, 20, 1e-4, 1e-3, startTime=100.0)
+        self.assertFalse(monitor.update(FakeRunner(20, 1e-4)))
+
+        writeCoefficients(self._case, 100, range(101, 121))
+        self.assertTrue(monitor.update(FakeRunner(20 + CHECK_INTERVAL, 1e-4)))
@@ -0,0 +1,129 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Test cases for reading OpenFOAM post processing files"""
+
+__title__ = "FreeCAD Post Processing Reader Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from Rocket.cfd.Reports.DatReader import readDat, readDatFiles, postProcessingFiles, clearDatCache, \
+    COEFFICIENT_COLUMNS, TAIL_BLOCK_SIZE, MAX_DAT_FILES
+
+COEFFICIENT_FUNCTION = "ForceCoefficientReportingFunction"
+
+def writeCoefficients(caseDirectory, startTime, times, cd=0.5, cl=0.1, header=True, partial=False):
+    """ Write a force coefficient file with one row per time, in the directory for the start time """
+    directory = os.path.join(caseDirectory, "postProcessing", COEFFICIENT_FUNCTION, "{:g}".format(startTime))
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "coefficient.dat"), "w") as datFile:
+        if header:
+            datFile.write("# Force coefficients\n# Time Cd Cd(f) Cd(r) Cl ...\n")
+        for time in times:
+            row = [time, cd, cd, cd, cl] + [time / 1000.0] * (COEFFICIENT_COLUMNS - 5)
+            datFile.write("\t".join(["{:g}".format(value) for value in row]) + "\n")
+        if partial:
+            datFile.write("{:g}\t0.5\t0.5".format(times[-1] + 1))
+
+class DatReaderTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._case = self._directory.name
+        clearDatCache()
+
+    def tearDown(self):
+        clearDatCache()
+        self._directory.cleanup()
+
+    def _path(self, startTime):
+        return os.path.join(self._case, "postProcessing", COEFFICIENT_FUNCTION, "{:g}".format(startTime),
+                            "coefficient.dat")
+
+    def testReadDat(self):
+        writeCoefficients(self._case, 0, range(1, 11), partial=True)
+
+        # The partly written last row is skipped
+        table = readDat(self._path(0), COEFFICIENT_COLUMNS)
+        self.assertEqual(table.shape, (10, COEFFICIENT_COLUMNS))
+        self.assertEqual(list(table[:, 0]), list(range(1, 11)))
+        self.assertFalse(table.flags.writeable)
+
+    def testHeaderOnly(self):
+        writeCoefficients(self._case, 0, [])
+        self.assertEqual(readDat(self._path(0), COEFFICIENT_COLUMNS).shape, (0, COEFFICIENT_COLUMNS))
+
+    def testTail(self):
+        # Long enough that the tail is read in several blocks
+        count = 3 * TAIL_BLOCK_SIZE // 40
+        writeCoefficients(self._case, 0, range(1, count + 1), partial=True)
+        path = self._path(0)
+
+        full = readDat(path, COEFFICIENT_COLUMNS)
+        self.assertEqual(full.shape[0], count)
+        for tail in [1, 10, 1000, count // 2, count, count + 10]:
+            np.testing.assert_array_equal(readDat(path, COEFFICIENT_COLUMNS, tail), full[-tail:])
+
+    def testCache(self):
+        writeCoefficients(self._case, 0, range(1, 11))
+        path = self._path(0)
+        table = readDat(path, COEFFICIENT_COLUMNS)
+        self.assertIs(readDat(path, COEFFICIENT_COLUMNS), table)
+
+        # Files that have grown are read again
+        writeCoefficients(self._case, 0, range(1, 21))
+        self.assertEqual(readDat(path, COEFFICIENT_COLUMNS).shape[0], 20)
+
+    def testCacheSize(self):
+        writeCoefficients(self._case, 0, range(1, 11))
+        path = self._path(0)
+        table = readDat(path, COEFFICIENT_COLUMNS)
+        for tail in range(1, MAX_DAT_FILES + 1):
+            readDat(path, COEFFICIENT_COLUMNS, tail)
+
+        # The least recently used table has been dropped
+        self.assertIsNot(readDat(path, COEFFICIENT_COLUMNS), table)
+
+    def testResumedRuns(self):
+        # The second run restarted from time 8, replacing the rows the first run wrote after it
+        writeCoefficients(self._case, 0, range(1, 11), cd=0.5)
+        writeCoefficients(self._case, 8, range(9, 16), cd=0.4)
+        writeCoefficients(self._case, 15, range(16, 21), cd=0.3)
+
+        paths = postProcessingFiles(self._case, COEFFICIENT_FUNCTION, "coefficient.dat")
+        self.assertEqual(paths, [self._path(0), self._path(8), self._path(15)])
+        self.assertEqual(postProcessingFiles(self._case, COEFFICIENT_FUNCTION, "coefficient.dat", 8),
+                         [self._path(8), self._path(15)])
+        self.assertEqual(postProcessingFiles(self._case, "Missing", "coefficient.dat"), [])
+
+        table = readDatFiles(paths, COEFFICIENT_COLUMNS)
+        self.assertEqual(list(table[:, 0]), list(range(1, 21)))
+        self.assertEqual(list(table[:, 1]), [0.5] * 8 + [0.4] * 7 + [0.3] * 5)
+        for tail in [3, 5, 6, 12, 20, 30]:
+            np.testing.assert_array_equal(readDatFiles(paths, COEFFICIENT_COLUMNS, tail), table[-tail:])
+
+        with self.assertRaises(FileNotFoundError):
+            readDatFiles([], COEFFICIENT_COLUMNS)
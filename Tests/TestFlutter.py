@@ -27,6 +27,8 @@ import math
 
 from Analyzers.pyatmos import coesa76
 from Analyzers.FinFlutter import FinFlutter
+from Analyzers.FlutterMonteCarlo import FlutterMonteCarlo, PARAMETERS
+from Rocket.Constants import FIN_TYPE_ELLIPSE, FIN_TYPE_TRIANGLE
 from Ui.Commands.CmdFin import makeFin
 from Ui.Commands.CmdFinCan import makeFinCan
 
@@ -45,6 +47,16 @@ class FinFlutterTestCases(unittest.TestCase):
         for i in range(1,85):
             geo = coesa76([i])
 
+    def testCoesa76Vectorized(self):
+        # Evaluating many altitudes at once must match evaluating them one at a time
+        altitudes = [-0.5 + 0.37 * i for i in range(2700)]
+        geo = coesa76(altitudes)
+        for i, altitude in enumerate(altitudes):
+            single = coesa76([altitude])
+            self.assertEqual(geo.rho[i], single.rho[0])
+            self.assertEqual(geo.T[i], single.T[0])
+            self.assertEqual(geo.P[i], single.P[0])
+
     def _setFin(self, finData):
         self._fin.Height = finData[4]
         self._fin.RootChord = finData[3]
@@ -173,6 +185,72 @@ class FinFlutterTestCases(unittest.TestCase):
             results = flutter.flutterPOF(altitude, shearModulus)
             self._checkTolerance(results[1], row[6] * math.sqrt(2), "Vf")
 
+    def testAltitudeArray(self):
+        self._setFin(self._getTestArray()[0])
+        flutter = FinFlutter(self._fin)
+
+        shearModulus = 7.170e+7 # in kPa, for Al 7075 T651
+        altitudes = [i * 500000.0 for i in range(41)] # 0 to 20km in mm
+
+        velocities = flutter.velocities(altitudes, shearModulus)
+        for i, altitude in enumerate(altitudes):
+            single = [flutter.flutter(altitude, shearModulus), flutter.flutterPOF(altitude, shearModulus),
+                      flutter.divergence(altitude, shearModulus)]
+            for series, expected in zip(velocities, single):
+                self.assertAlmostEqual(series[0][i], expected[0])
+                self.assertAlmostEqual(series[1][i], expected[1])
+
+    def testMonteCarlo(self):
+        self._setFin(self._getTestArray()[0])
+        flutter = FinFlutter(self._fin)
+
+        shearModulus = 7.170e+7 # in kPa, for Al 7075 T651
+        altitudes = [i * 1000000.0 for i in range(21)] # 0 to 20km in mm
+        nominal = flutter.flutter(altitudes, shearModulus)[1]
+
+        # Without any variation every sample is the nominal fin
+        exact = FlutterMonteCarlo(flutter, shearModulus, tolerances={name : 0.0 for name in PARAMETERS}, samples=10)
+        for low, high, expected in zip(*exact.percentiles(altitudes, (0, 100)), nominal):
+            self.assertAlmostEqual(low, expected)
+            self.assertAlmostEqual(high, expected)
+
+        monteCarlo = FlutterMonteCarlo(flutter, shearModulus)
+        low, median, high = monteCarlo.percentiles(altitudes)
+        for i in range(len(altitudes)):
+            self.assertLess(low[i], median[i])
+            self.assertLess(median[i], high[i])
+            self._checkTolerance(median[i], nominal[i], "Median")
+
+        # The margin probability falls as the flight velocity rises
+        probability = monteCarlo.marginProbability(0, [0.5 * nominal[0], nominal[0], 2.0 * nominal[0]])
+        self.assertEqual(probability[0], 1.0)
+        self.assertEqual(probability[2], 0.0)
+
+        # Flutter velocity is most sensitive to the fin thickness
+        self.assertEqual(monteCarlo.sensitivities(0)[0][0], "thickness")
+
+    def testPlanforms(self):
+        row = self._getTestArray()[0]
+        self._setFin(row)
+        geometry = FinFlutter(self._fin).nominalGeometry()
+
+        rootChord = row[3] / 1000.0
+        tipChord = row[5] / 1000.0
+        meanChord = (2.0 / 3.0) * (rootChord + tipChord - (rootChord * tipChord) / (rootChord + tipChord))
+        self._checkTolerance(geometry["area"], (rootChord + tipChord) * row[4] / 2000.0, "Area")
+        self._checkTolerance(geometry["meanChord"], meanChord, "Mean chord")
+        self._checkTolerance(geometry["thickness"], row[0] / 1000.0, "Thickness")
+
+        self._fin.FinType = FIN_TYPE_ELLIPSE
+        self.Doc.recompute()
+        geometry = FinFlutter(self._fin).nominalGeometry()
+        self._checkTolerance(geometry["area"], math.pi * rootChord * row[4] / 4000.0, "Area")
+        self.assertAlmostEqual(geometry["taper"], 0.0)
+
+        self._fin.FinType = FIN_TYPE_TRIANGLE
+        self.Doc.recompute()
+        flutter = FinFlutter(self._fin)
+        self.assertGreater(flutter.flutter(0, 7.170e+7)[1], 0.0)
 
     def tearDown(self):
         #closing doc
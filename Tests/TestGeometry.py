@@ -0,0 +1,138 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for testing analytic component geometry"""
+
+__title__ = "FreeCAD Analytic Geometry Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import unittest
+import math
+
+from Rocket.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_BLUNTED_OGIVE, TYPE_SECANT_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLIC, TYPE_POWER
+from Rocket.Constants import STYLE_SOLID
+from Rocket.Constants import FINCAN_EDGE_SQUARE
+from Rocket.Constants import FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND, \
+    FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE, FIN_CROSS_BICONVEX, FIN_CROSS_ELLIPSE
+
+from Rocket.ShapeHandlers.AdaptiveSpline import makeAdaptiveSpline
+
+from Ui.Commands.CmdNoseCone import makeNoseCone
+from Ui.Commands.CmdBodyTube import makeBodyTube
+from Ui.Commands.CmdFin import makeFin
+from Ui.Commands.CmdFinCan import makeFinCan
+
+class GeometryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("GeometryTest")
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+
+    def _checkTolerance(self, calc, reference, tolerance, message):
+        self.assertLess(math.fabs((calc - reference) / reference), tolerance,
+                        "{0:s} Calculated {1:.2f} reference {2:.2f}".format(message, calc, reference))
+
+    def testBodyTube(self):
+        feature = makeBodyTube('BodyTube')
+        self.Doc.recompute()
+
+        self._checkTolerance(feature.getComponentVolume(), feature._obj.Shape.Volume, 1e-6, "Volume")
+        self.assertAlmostEqual(feature.getComponentCentroid()._x, feature._obj.Shape.CenterOfMass.x, places=4)
+
+    def testNoseRadius(self):
+        for type in [TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_BLUNTED_OGIVE,
+                     TYPE_SECANT_OGIVE, TYPE_VON_KARMAN, TYPE_PARABOLIC, TYPE_POWER]:
+            feature = makeNoseCone('NoseCone')
+            feature._obj.NoseType = type
+            feature._obj.NoseStyle = STYLE_SOLID
+            feature._obj.Shoulder = False
+            if type == TYPE_POWER:
+                feature._obj.Coefficient = 0.5
+            self.Doc.recompute()
+
+            length = feature.getLength()
+            radius = feature.getAftRadius()
+            self.assertAlmostEqual(feature.getRadius(0.0), 0.0, places=6, msg=type)
+            self.assertAlmostEqual(feature.getRadius(length), radius, places=6, msg=type)
+
+            # The analytic volume should match the drawn solid
+            self._checkTolerance(feature.getComponentVolume(), feature._obj.Shape.Volume, 0.01, type)
+
+    def testFinVolume(self):
+        feature = makeFin('Fin')
+        for crossSection in [FIN_CROSS_SQUARE, FIN_CROSS_ROUND, FIN_CROSS_AIRFOIL, FIN_CROSS_WEDGE, FIN_CROSS_DIAMOND,
+                             FIN_CROSS_TAPER_LE, FIN_CROSS_TAPER_TE, FIN_CROSS_TAPER_LETE, FIN_CROSS_BICONVEX, FIN_CROSS_ELLIPSE]:
+            feature._obj.RootCrossSection = crossSection
+            self.Doc.recompute()
+
+            handler = feature._getAnalyticHandler()
+            shape = handler.finOnlyShape()
+            self._checkTolerance(handler.finOnlyVolume(), shape.Volume, 0.02, crossSection)
+
+    def testFinFrontalArea(self):
+        feature = makeFin('Fin')
+        feature._obj.RootCrossSection = FIN_CROSS_SQUARE
+        feature._obj.FinSet = False
+        self.Doc.recompute()
+
+        obj = feature._obj
+        reference = float(obj.Height) * (float(obj.RootThickness) + float(obj.TipThickness)) / 2.0
+        if obj.TipSameThickness:
+            reference = float(obj.Height) * float(obj.RootThickness)
+        self._checkTolerance(feature.getFinFrontalArea(), reference, 1e-6, "Frontal area")
+
+        # Only the part of the fin outside a larger body is seen from the front
+        base = float(obj.Height) / 2.0
+        hidden = base * float(obj.RootThickness)
+        if not obj.TipSameThickness:
+            hidden = base * (float(obj.RootThickness) + (float(obj.RootThickness) + float(obj.TipThickness)) / 2.0) / 2.0
+        self._checkTolerance(feature.getFinFrontalArea(float(obj.ParentRadius) + base), reference - hidden, 1e-6,
+                             "Frontal area outside the body")
+        self.assertEqual(feature.getFinFrontalArea(float(obj.ParentRadius) + float(obj.Height)), 0.0)
+
+    def testFinCan(self):
+        feature = makeFinCan('FinCan')
+        obj = feature._obj
+        obj.RootCrossSection = FIN_CROSS_SQUARE
+        obj.LeadingEdge = FINCAN_EDGE_SQUARE
+        obj.TrailingEdge = FINCAN_EDGE_SQUARE
+        obj.LaunchLug = False
+        obj.Coupler = False
+        obj.LeadingEdgeOffset = 10.0
+        self.Doc.recompute()
+
+        # The body and fins combined, weighted by volume
+        self._checkTolerance(feature.getComponentVolume(), obj.Shape.Volume, 0.02, "Volume")
+        self._checkTolerance(feature.getComponentCentroid()._x, obj.Shape.CenterOfMass.x, 0.02, "Centroid")
+
+    def testAdaptiveSpline(self):
+        # Elliptical profile, which is steepest at the tip
+        length = 100.0
+        radius = 12.0
+        points = [FreeCAD.Vector(length * i / 400.0, 0, radius * math.sqrt(1.0 - (1.0 - i / 400.0)**2))
+                  for i in range(401)]
+        for tolerance in [0.5, 0.05, 0.005]:
+            spline = makeAdaptiveSpline(points, tolerance)
+            deviation = max([(spline.value(spline.parameter(point)) - point).Length for point in points])
+            self.assertLessEqual(deviation, tolerance * (1.0 + 1e-6), tolerance)
@@ -107,3 +107,21 @@ class NoseTests(unittest.TestCase):
                     with self.subTest(capStyle=capStyle):
                         self._testPlain(type, STYLE_CAPPED, capStyle)
                         self._testShoulder(type, STYLE_CAPPED, capStyle)
+
+    def testTypesAdaptive(self):
+        for type in self._getTypes():
+            with self.subTest(type=type):
+                feature = makeNoseCone('NoseCone')
+                self._setType(feature, type)
+                feature._obj.NoseStyle = STYLE_SOLID
+                feature._obj.Shoulder = False
+                self.Doc.recompute()
+                fixedVolume = feature._obj.Shape.Volume
+
+                feature._obj.AdaptiveResolution = True
+                feature._obj.ResolutionTolerance = 0.01
+                self.Doc.recompute()
+
+                self._checkShape(feature, type + ": adaptive")
+                self.assertAlmostEqual(feature._obj.Shape.Volume, fixedVolume, delta=fixedVolume * 0.01)
+                self.assertLessEqual(feature._obj.PoleCount, feature._obj.Resolution + 1)
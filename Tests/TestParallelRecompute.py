@@ -0,0 +1,113 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Test cases for drawing component shapes in worker processes"""
+
+__title__ = "FreeCAD Parallel Recompute Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import Part
+import unittest
+from unittest import mock
+
+import Rocket.ParallelRecompute as ParallelRecompute
+from Rocket.ParallelRecompute import recompute, drawHandlers, MIN_PARALLEL_SHAPES
+from Rocket.ShapeHandlers.BodyTubeShapeHandler import BodyTubeShapeHandler
+
+from Ui.Commands.CmdBodyTube import makeBodyTube
+from Ui.Commands.CmdNoseCone import makeNoseCone
+
+from Tests.util.TestRockets import TestRockets
+
+class ParallelRecomputeTests(unittest.TestCase):
+
+    def setUp(self):
+        self.Doc = FreeCAD.newDocument("ParallelRecomputeTest")
+
+    def tearDown(self):
+        FreeCAD.closeDocument(self.Doc.Name)
+        ParallelRecompute._shutdownPool()
+
+    def _shapes(self, objects):
+        return {obj.Name : (obj.Shape.copy(), FreeCAD.Placement(obj.Placement), getattr(obj, "PoleCount", None))
+                for obj in objects}
+
+    def _checkShapes(self, shapes, reference):
+        for name, (shape, placement, poleCount) in shapes.items():
+            expected, expectedPlacement, expectedPoleCount = reference[name]
+            self.assertTrue(shape.isValid(), name)
+            self.assertAlmostEqual(shape.Volume, expected.Volume, places=6, msg=name)
+            self.assertAlmostEqual(shape.Area, expected.Area, places=6, msg=name)
+            self.assertTrue(shape.BoundBox.isInside(expected.BoundBox.Center), name)
+            self.assertTrue(placement.isSame(expectedPlacement, 1e-9), name)
+            self.assertEqual(poleCount, expectedPoleCount, name)
+
+    def testRecompute(self):
+        TestRockets.makeEstesAlphaIII()
+
+        with mock.patch.object(ParallelRecompute, "drawHandlers", wraps=ParallelRecompute.drawHandlers) as draw:
+            recompute(self.Doc)
+        handlers = draw.call_args[0][0]
+        self.assertGreaterEqual(len(handlers), MIN_PARALLEL_SHAPES)
+        deferred = [handler._obj for handler in handlers]
+        parallel = self._shapes(deferred)
+
+        # Draw everything again with a normal recompute
+        for obj in self.Doc.Objects:
+            obj.touch()
+        self.Doc.recompute()
+        self._checkShapes(parallel, self._shapes(deferred))
+
+    def testExternalDependent(self):
+        tube = makeBodyTube('BodyTube')
+        nose = makeNoseCone('NoseCone')
+        compound = self.Doc.addObject("Part::Compound", "Compound")
+        compound.Links = [tube._obj]
+        self.Doc.recompute()
+
+        # The compound uses the shape drawn in a worker process, so it is recomputed once it's assigned
+        tube.setLength(50.0)
+        nose.setLength(60.0)
+        recompute(self.Doc)
+        self.assertAlmostEqual(compound.Shape.Volume, tube._obj.Shape.Volume, places=6)
+        self.assertAlmostEqual(compound.Shape.BoundBox.XLength, tube._obj.Shape.BoundBox.XLength, places=6)
+        self.assertFalse(compound.isTouched())
+
+    def testUnpicklableHandler(self):
+        tubes = [makeBodyTube('BodyTube'), makeBodyTube('BodyTube')]
+        tubes[1].setLength(50.0)
+        self.Doc.recompute()
+        reference = self._shapes([tube._obj for tube in tubes])
+
+        handlers = [BodyTubeShapeHandler(tube._obj) for tube in tubes]
+        for tube in tubes:
+            tube._obj.Shape = Part.Shape()
+
+        # A handler that can't be sent to a worker is drawn on the main thread instead
+        handlers[0]._callback = lambda: None
+        self.assertIsNone(ParallelRecompute._payload(handlers[0]))
+        self.assertIsNotNone(ParallelRecompute._payload(handlers[1]))
+        with mock.patch.object(handlers[0], "draw", wraps=handlers[0].draw) as draw:
+            drawHandlers(handlers)
+        draw.assert_called_once()
+
+        self._checkShapes(self._shapes([tube._obj for tube in tubes]), reference)
@@ -0,0 +1,85 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Test cases for indexing the residuals in solver logs"""
+
+__title__ = "FreeCAD Residual Log Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from Rocket.cfd.Reports.ResidualLog import updateResidualIndex, SOLVER_LOG, RESIDUAL_FIELDS
+
+def solverLog(times, residual=lambda time: 1.0 / time):
+    """ Solver log text in the format written by simpleFoam """
+    text = ""
+    for time in times:
+        text += "Time = {}\n\n".format(time)
+        for field in RESIDUAL_FIELDS:
+            text += "smoothSolver:  Solving for {}, Initial residual = {:g}, Final residual = 1e-06, " \
+                    "No Iterations 2\n".format(field, residual(time))
+        text += "ExecutionTime = 1 s  ClockTime = 1 s\n\n"
+    return text
+
+class ResidualLogTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._case = self._directory.name
+        self._log = os.path.join(self._case, SOLVER_LOG)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _check(self, residuals, times):
+        self.assertEqual(list(residuals["time"]), list(times))
+        for field in RESIDUAL_FIELDS:
+            np.testing.assert_allclose(residuals[field + "Residuals"], [1.0 / time for time in times], rtol=1e-5)
+
+    def testIncremental(self):
+        text = solverLog(range(1, 41)).encode()
+
+        # Append the log in pieces that split lines and time steps at every possible point
+        with open(self._log, "wb") as log:
+            for start in range(0, len(text), 97):
+                log.write(text[start:start + 97])
+                log.flush()
+                residuals = updateResidualIndex(self._case)
+        self._check(residuals, range(1, 41))
+
+        # A fresh read of the saved index gives the same result
+        self._check(updateResidualIndex(self._case), range(1, 41))
+
+    def testRewrittenLog(self):
+        with open(self._log, "w") as log:
+            log.write(solverLog(range(1, 21)))
+        self._check(updateResidualIndex(self._case), range(1, 21))
+
+        # A new run replaces the log, so the index is rebuilt
+        with open(self._log, "w") as log:
+            log.write(solverLog(range(1, 6), lambda time: 2.0 / time))
+        residuals = updateResidualIndex(self._case)
+        self.assertEqual(list(residuals["time"]), list(range(1, 6)))
+        np.testing.assert_allclose(residuals["pResiduals"], [2.0 / time for time in range(1, 6)], rtol=1e-5)
@@ -0,0 +1,112 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Test cases for the CFD results store"""
+
+__title__ = "FreeCAD CFD Results Store Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import numpy as np
+
+from Rocket.cfd.ResultsStore import ResultsStore
+
+def resultRow(design, aoa, rocket="Rocket", document="rocket.FCStd", recorded=1.0, cd=0.5, conditions="cccc0000"):
+    return {"design" : design, "conditions" : conditions, "aoa" : aoa, "rocket" : rocket, "document" : document, "recorded" : recorded,
+            "Cd" : cd, "Cl" : aoa / 10.0}
+
+class ResultsStoreTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._store = ResultsStore(os.path.join(self._directory.name, "results", "CFDResults.db"))
+
+        rows = [resultRow("aaaa1111", aoa) for aoa in [4.0, 0.0, 2.0]]
+        rows += [resultRow("bbbb2222", aoa, rocket="Other", document="other.FCStd", recorded=2.0) for aoa in [0.0, 2.0]]
+        self._store.record(rows)
+
+    def tearDown(self):
+        self._store.close()
+        self._directory.cleanup()
+
+    def testQuery(self):
+        self.assertEqual(len(self._store.query()), 5)
+
+        results = self._store.query(design="aaaa")
+        self.assertEqual([result["aoa"] for result in results], [0.0, 2.0, 4.0])
+        self.assertEqual([result["aoa"] for result in self._store.query(minAOA=1.0, maxAOA=3.0)], [2.0, 2.0])
+        self.assertEqual({result["design"] for result in self._store.query(rocket="Other")}, {"bbbb2222"})
+        self.assertEqual({result["design"] for result in self._store.query(document="rocket.FCStd")}, {"aaaa1111"})
+        self.assertEqual(self._store.query(design="cccc"), [])
+
+    def testReplace(self):
+        # Results for the same design and angle of attack replace the earlier ones
+        self._store.record([resultRow("aaaa1111", 2.0, recorded=3.0, cd=0.6)])
+        results = self._store.query(design="aaaa1111", minAOA=2.0, maxAOA=2.0)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["Cd"], 0.6)
+
+    def testConditions(self):
+        # The same design at other conditions is kept alongside the earlier results
+        self._store.record([resultRow("aaaa1111", aoa, recorded=3.0, cd=0.7, conditions="dddd0000") for aoa in [0.0, 2.0]])
+        results = self._store.query(design="aaaa1111")
+        self.assertEqual([(result["conditions"], result["aoa"]) for result in results],
+                         [("cccc0000", 0.0), ("cccc0000", 2.0), ("cccc0000", 4.0), ("dddd0000", 0.0), ("dddd0000", 2.0)])
+        self.assertEqual(len(self._store.query(design="aaaa1111", conditions="dddd")), 2)
+
+        designs = self._store.designs()
+        self.assertEqual([(design["design"], design["conditions"], design["count"]) for design in designs],
+                         [("aaaa1111", "cccc0000", 3), ("bbbb2222", "cccc0000", 2), ("aaaa1111", "dddd0000", 2)])
+        aoa, cd = self._store.series("aaaa1111", "Cd", "dddd0000")
+        np.testing.assert_array_equal(aoa, [0.0, 2.0])
+        np.testing.assert_allclose(cd, [0.7, 0.7])
+
+    def testUpgrade(self):
+        # Databases from before the conditions hash keep their results with an empty one
+        path = os.path.join(self._directory.name, "old.db")
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE results (design TEXT NOT NULL, aoa REAL NOT NULL, Cd REAL, "
+                           "PRIMARY KEY (design, aoa))")
+        connection.execute("INSERT INTO results (design, aoa, Cd) VALUES ('aaaa1111', 0.0, 0.5)")
+        connection.commit()
+        connection.close()
+
+        with ResultsStore(path) as store:
+            store.record([resultRow("aaaa1111", 0.0, cd=0.6)])
+            results = store.query()
+        self.assertEqual([(result["conditions"], result["Cd"]) for result in results], [("", 0.5), ("cccc0000", 0.6)])
+
+    def testDesigns(self):
+        designs = self._store.designs()
+        self.assertEqual([(design["design"], design["count"]) for design in designs], [("aaaa1111", 3), ("bbbb2222", 2)])
+        self.assertEqual([design["design"] for design in self._store.designs(rocket="Other")], ["bbbb2222"])
+
+    def testSeries(self):
+        aoa, cl = self._store.series("aaaa", "Cl")
+        np.testing.assert_array_equal(aoa, [0.0, 2.0, 4.0])
+        np.testing.assert_allclose(cl, [0.0, 0.2, 0.4])
+
+        with self.assertRaises(ValueError):
+            self._store.series("aaaa", "design")
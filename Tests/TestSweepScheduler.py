@@ -0,0 +1,300 @@
+# ***************************************************************************
+# *   Copyright (c) 2022-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Test cases for the CFD sweep scheduler"""
+
+__title__ = "FreeCAD Sweep Scheduler Tests"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import os
+import tempfile
+import unittest
+
+from Rocket.cfd.SweepScheduler import SweepCase, SweepScheduler, meshIsCurrent, writeMeshHash, caseIsCurrent, \
+    writeCaseHash, latestTime, readRunStatus, canResume, concurrentCases, CASE_PENDING, CASE_MESHING, \
+    CASE_SOLVING, CASE_SUCCESS, CASE_FAILED, CASE_SKIPPED, ABORT_MESSAGE
+
+class FakeProcess:
+    """ Stands in for a console process. The test finishes it by calling finish() """
+
+    def __init__(self, started, finished_hook, stdout_hook, stderr_hook):
+        self._started = started
+        self._finishedHook = finished_hook
+        self.command = None
+        self.workingDirectory = None
+        self.terminated = False
+
+    def start(self, command, env_vars=None, working_dir=None):
+        self.command = command
+        self.workingDirectory = working_dir
+
+    def waitForStarted(self):
+        return self._started
+
+    def terminate(self):
+        self.terminated = True
+
+    def waitForFinished(self):
+        return True
+
+    def processErrorOutput(self, lines):
+        return lines
+
+    def finish(self, exitCode=0):
+        self._finishedHook(exitCode)
+
+class FakeProcessFactory:
+    """ Creates fake processes and keeps them in the order they were started """
+
+    def __init__(self, started=True):
+        self.started = started
+        self.processes = []
+
+    def __call__(self, finished_hook, stdout_hook, stderr_hook):
+        process = FakeProcess(self.started, finished_hook, stdout_hook, stderr_hook)
+        self.processes.append(process)
+        return process
+
+def makeCase(aoa, meshCommand=None, owner=None):
+    case = SweepCase(aoa)
+    case.prepared = True
+    case.meshCommand = meshCommand
+    case.meshOwner = owner
+    case.solveCommand = "solve {}".format(aoa)
+    case.caseKey = "key{}".format(aoa)
+    return case
+
+class SweepSchedulerTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._statusPath = os.path.join(self._directory.name, "RunStatus.dat")
+        self._factory = FakeProcessFactory()
+        self._finished = 0
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _finishedHook(self):
+        self._finished += 1
+
+    def _scheduler(self, cases, concurrent, prepare=None):
+        return SweepScheduler(cases, concurrent, self._statusPath, self._factory, prepare=prepare,
+                              finishedHook=self._finishedHook)
+
+    def testConcurrencyLimit(self):
+        cases = [makeCase(aoa) for aoa in [0.0, 2.0, 4.0, 6.0]]
+        scheduler = self._scheduler(cases, 2)
+        scheduler.start()
+
+        self.assertEqual([case.status for case in cases], [CASE_SOLVING, CASE_SOLVING, CASE_PENDING, CASE_PENDING])
+        self.assertEqual(len(self._factory.processes), 2)
+
+        # Each finished case starts the next pending one
+        self._factory.processes[1].finish(0)
+        self.assertEqual(cases[1].status, CASE_SUCCESS)
+        self.assertEqual(cases[2].status, CASE_SOLVING)
+        self.assertEqual(cases[3].status, CASE_PENDING)
+        self.assertEqual(self._factory.processes[2].command, "solve 4.0")
+
+        self._factory.processes[0].finish(0)
+        self.assertEqual(self._factory.processes[3].command, "solve 6.0")
+        self._factory.processes[2].finish(0)
+        self._factory.processes[3].finish(0)
+
+        self.assertTrue(all(case.status == CASE_SUCCESS for case in cases))
+        self.assertFalse(scheduler.isRunning())
+        self.assertEqual(self._finished, 1)
+
+    def testMeshOwner(self):
+        owner = makeCase(0.0, meshCommand="mesh")
+        sharing = makeCase(2.0, owner=owner)
+        scheduler = self._scheduler([owner, sharing], 2)
+        scheduler.start()
+
+        # The second case waits for the shared mesh
+        self.assertEqual(owner.status, CASE_MESHING)
+        self.assertEqual(sharing.status, CASE_PENDING)
+        self.assertEqual(len(self._factory.processes), 1)
+        self.assertEqual(self._factory.processes[0].command, "mesh")
+
+        self._factory.processes[0].finish(0)
+        self.assertTrue(owner.meshed)
+        self.assertEqual(owner.status, CASE_SOLVING)
+        self.assertEqual(sharing.status, CASE_SOLVING)
+        self.assertEqual([process.command for process in self._factory.processes[1:]], ["solve 0.0", "solve 2.0"])
+
+    def testMeshFailure(self):
+        owner = makeCase(0.0, meshCommand="mesh")
+        sharing = makeCase(2.0, owner=owner)
+        other = makeCase(4.0, meshCommand="mesh 4")
+        scheduler = self._scheduler([owner, sharing, other], 1)
+        scheduler.start()
+
+        self._factory.processes[0].finish(1)
+        self.assertEqual((owner.status, owner.message), (CASE_FAILED, "Mesher error"))
+        self.assertEqual((sharing.status, sharing.message), (CASE_FAILED, "Mesher error"))
+
+        # Cases with their own mesh carry on
+        self.assertEqual(other.status, CASE_MESHING)
+        self._factory.processes[1].finish(0)
+        self._factory.processes[2].finish(0)
+        self.assertEqual(other.status, CASE_SUCCESS)
+        self.assertEqual(self._finished, 1)
+
+    def testSolverFailure(self):
+        cases = [makeCase(0.0), makeCase(2.0)]
+        scheduler = self._scheduler(cases, 1)
+        scheduler.start()
+
+        self._factory.processes[0].finish(1)
+        self.assertEqual((cases[0].status, cases[0].message), (CASE_FAILED, "Solver error"))
+        self.assertEqual(cases[1].status, CASE_SOLVING)
+
+        self._factory.processes[1].finish(0)
+        self.assertEqual(cases[1].status, CASE_SUCCESS)
+
+    def testStartFailure(self):
+        self._factory.started = False
+        cases = [makeCase(0.0), makeCase(2.0)]
+        scheduler = self._scheduler(cases, 1)
+        scheduler.start()
+
+        self.assertEqual([case.message for case in cases], ["Error starting process", "Error starting process"])
+        self.assertEqual(self._finished, 1)
+
+    def testPrepare(self):
+        def prepare(case):
+            if case.aoa == 2.0:
+                case.fail("Invalid geometry")
+            else:
+                case.prepared = True
+
+        cases = [makeCase(0.0), makeCase(2.0)]
+        for case in cases:
+            case.prepared = False
+        scheduler = self._scheduler(cases, 2, prepare)
+        scheduler.start()
+
+        self.assertEqual(cases[0].status, CASE_SOLVING)
+        self.assertEqual((cases[1].status, cases[1].message), (CASE_FAILED, "Invalid geometry"))
+
+    def testStop(self):
+        cases = [makeCase(0.0), makeCase(2.0), makeCase(4.0)]
+        scheduler = self._scheduler(cases, 1)
+        scheduler.start()
+
+        process = self._factory.processes[0]
+        scheduler.stop()
+        self.assertTrue(process.terminated)
+        self.assertEqual((cases[0].status, cases[0].message), (CASE_FAILED, ABORT_MESSAGE))
+        self.assertEqual([case.status for case in cases[1:]], [CASE_SKIPPED, CASE_SKIPPED])
+        self.assertFalse(scheduler.isRunning())
+        self.assertEqual(self._finished, 1)
+
+        # The terminated process reporting back doesn't start anything
+        process.finish(1)
+        self.assertEqual(len(self._factory.processes), 1)
+        self.assertEqual(cases[0].message, ABORT_MESSAGE)
+
+    def testRunStatus(self):
+        cases = [makeCase(0.0), makeCase(2.0)]
+        scheduler = self._scheduler(cases, 2)
+        scheduler.start()
+
+        status = readRunStatus(self._statusPath)
+        self.assertEqual(sorted(status.keys()), ["0.0", "2.0"])
+        self.assertEqual(status["0.0"][2], CASE_SOLVING)
+
+        self._factory.processes[0].finish(0)
+        self._factory.processes[1].finish(1)
+
+        status = readRunStatus(self._statusPath)
+        self.assertEqual(status["0.0"][2:], [CASE_SUCCESS, "", "key0.0"])
+        self.assertEqual(status["2.0"][2:], [CASE_FAILED, "Solver error", "key2.0"])
+        with open(self._statusPath, "r") as runStatus:
+            self.assertTrue(runStatus.read().splitlines()[-1].startswith("Total\t"))
+
+        self.assertTrue(canResume(status["0.0"]))
+        self.assertFalse(canResume(status["2.0"]))
+
+class SweepHelperTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._case = self._directory.name
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def testMeshIsCurrent(self):
+        self.assertFalse(meshIsCurrent(self._case, "mesh"))
+
+        # The hash alone isn't enough, the mesh has to exist
+        writeMeshHash(self._case, "mesh")
+        self.assertFalse(meshIsCurrent(self._case, "mesh"))
+
+        os.makedirs(os.path.join(self._case, "constant", "polyMesh"))
+        self.assertTrue(meshIsCurrent(self._case, "mesh"))
+        self.assertFalse(meshIsCurrent(self._case, "other"))
+        self.assertFalse(meshIsCurrent(self._case, None))
+        self.assertFalse(meshIsCurrent(None, "mesh"))
+
+    def testCaseIsCurrent(self):
+        self.assertFalse(caseIsCurrent(self._case, "case"))
+
+        writeCaseHash(self._case, "case")
+        self.assertTrue(caseIsCurrent(self._case, "case"))
+        self.assertFalse(caseIsCurrent(self._case, "other"))
+        self.assertFalse(caseIsCurrent(self._case, None))
+
+    def testLatestTime(self):
+        self.assertEqual(latestTime(self._case), 0.0)
+        self.assertEqual(latestTime(os.path.join(self._case, "missing")), 0.0)
+
+        for name in ["0", "100", "250.5", "constant", "system"]:
+            os.makedirs(os.path.join(self._case, name))
+        self.assertEqual(latestTime(self._case), 250.5)
+
+        # Decomposed cases write their times to the processor directories
+        os.makedirs(os.path.join(self._case, "processor0", "400"))
+        self.assertEqual(latestTime(self._case), 400.0)
+
+    def testReadRunStatus(self):
+        path = os.path.join(self._case, "RunStatus.dat")
+        self.assertEqual(readRunStatus(path), {})
+
+        with open(path, "w") as runStatus:
+            runStatus.write("0.0\t0:10\tSuccess\tReused\tkey0\n")
+            runStatus.write("2.0\t0:05\tFailed\tUser abort\tkey2\n")
+            runStatus.write("Total\t0:15\n")
+
+        status = readRunStatus(path)
+        self.assertEqual(sorted(status.keys()), ["0.0", "2.0"])
+        self.assertEqual(status["0.0"], ["0.0", "0:10", "Success", "Reused", "key0"])
+        self.assertTrue(canResume(status["2.0"]))
+        self.assertTrue(canResume(None))
+
+    def testConcurrentCases(self):
+        self.assertEqual(concurrentCases(16, 4, 10), 4)
+        self.assertEqual(concurrentCases(16, 4, 2), 2)
+        self.assertEqual(concurrentCases(2, 4, 10), 1)
+        self.assertEqual(concurrentCases(8, 0, 10), 8)
@@ -0,0 +1,62 @@
+# ***************************************************************************
+# *   Copyright (c) 2021-2025 David Carter <dcarter@davidcarter.ca>         *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for toggling the editing level of detail"""
+
+__title__ = "FreeCAD Level of Detail"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+import FreeCAD
+import FreeCADGui
+
+from Ui.Commands.Command import Command
+
+from Rocket.Constants import LOD_FULL, LOD_PREVIEW
+from Rocket.LevelOfDetail import isPreviewEnabled, setLevelOfDetail
+
+translate = FreeCAD.Qt.translate
+
+class CmdPreviewDetail(Command):
+    def Activated(self, checked):
+        doc = FreeCAD.ActiveDocument
+        if doc is None:
+            return
+        if checked:
+            setLevelOfDetail(doc, LOD_PREVIEW)
+        else:
+            setLevelOfDetail(doc, LOD_FULL)
+
+    def IsActive(self):
+        doc = FreeCAD.ActiveDocument
+        if doc is None:
+            return False
+
+        # The level of detail is saved per document, so the checked state follows the active document
+        checked = isPreviewEnabled(doc)
+        for action in FreeCADGui.Command.get('Rocket_PreviewDetail').getAction():
+            if action.isChecked() != checked:
+                action.setChecked(checked)
+        return True
+
+    def GetResources(self):
+        return {'MenuText': translate("Rocket", 'Preview While Editing'),
+                'ToolTip': translate("Rocket", 'Draw simplified shapes while editing components. The full shape is drawn when editing pauses'),
+                'Checkable': isPreviewEnabled(FreeCAD.ActiveDocument)}
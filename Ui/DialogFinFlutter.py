@@ -41,6 +41,15 @@ from PySide import QtGui, QtCore
 from PySide.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QSizePolicy
 
 from Analyzers.FinFlutter import FinFlutter
+from Analyzers.FlutterMonteCarlo import FlutterMonteCarlo, SHEAR, THICKNESS, SPAN, ROOT_CHORD, TIP_CHORD, \
+    DEFAULT_TOLERANCES, SAMPLE_LIMIT
+
+# Spacing of the flutter and divergence curves, in thousands of height units
+SERIES_STEP = 0.1
+
+# Largest tolerance in percent. Samples are limited to SAMPLE_LIMIT standard deviations, so
+# this keeps every sampled dimension positive
+MAX_TOLERANCE = 90.0 / SAMPLE_LIMIT
 
 class DialogFinFlutter(QDialog):
     def __init__(self, fin):
@@ -54,6 +63,13 @@ class DialogFinFlutter(QDialog):
 
         self._materialManager = Materials.MaterialManager()
 
+        # The samples are kept until the shear modulus or a tolerance changes, and the
+        # flutter band until the altitude range also changes
+        self._monteCarlo = None
+        self._monteCarloKey = None
+        self._band = None
+        self._bandKey = None
+
         self.initUI()
         self._setSeries()
         self.onFlutter(None)
@@ -163,6 +179,7 @@ class DialogFinFlutter(QDialog):
         self._flutterLine, = self._static_ax.plot(t, t, label="flutter")
         self._divergenceLine, = self._static_ax.plot(t, t, label="divergence")
         self._cursorLine, = self._static_ax.plot([0,0], [0,0])
+        self._flutterBand = None
         self._static_ax.set_xlabel("Altitude (km)")
         self._static_ax.set_ylabel("Velocity (m/s)")
         self._static_ax.grid(visible=True)
@@ -203,6 +220,26 @@ class DialogFinFlutter(QDialog):
         self.divergenceMachInput.setMinimumWidth(100)
         self.divergenceMachInput.setReadOnly(True)
 
+        self.toleranceGroup = QtGui.QGroupBox(translate('Rocket', "Construction Tolerance (standard deviation)"), self)
+
+        self._toleranceInputs = {}
+        self._toleranceLabels = {}
+        for name, label in [(SHEAR, translate('Rocket', "Shear Modulus")),
+                            (THICKNESS, translate('Rocket', "Thickness")),
+                            (SPAN, translate('Rocket', "Span")),
+                            (ROOT_CHORD, translate('Rocket', "Root Chord")),
+                            (TIP_CHORD, translate('Rocket', "Tip Chord"))]:
+            self._toleranceLabels[name] = QtGui.QLabel(label, self)
+
+            toleranceInput = QtGui.QDoubleSpinBox(self)
+            toleranceInput.setDecimals(1)
+            toleranceInput.setSingleStep(0.5)
+            toleranceInput.setRange(0.0, MAX_TOLERANCE)
+            toleranceInput.setSuffix(" %")
+            toleranceInput.setValue(DEFAULT_TOLERANCES[name] * 100.0)
+            toleranceInput.setMinimumWidth(100)
+            self._toleranceInputs[name] = toleranceInput
+
         # OK button
         okButton = QtGui.QPushButton('OK', self)
         okButton.setDefault(False)
@@ -232,6 +269,16 @@ class DialogFinFlutter(QDialog):
 
         self.materialGroup.setLayout(vbox)
 
+        # Tolerance group, in two columns
+        grid = QGridLayout()
+        for index, name in enumerate(self._toleranceInputs):
+            row = index // 2
+            column = (index % 2) * 2
+            grid.addWidget(self._toleranceLabels[name], row, column)
+            grid.addWidget(self._toleranceInputs[name], row, column + 1)
+
+        self.toleranceGroup.setLayout(grid)
+
         # Fin Flutter group
         vbox = QVBoxLayout()
 
@@ -279,6 +326,7 @@ class DialogFinFlutter(QDialog):
 
         layout = QVBoxLayout()
         layout.addWidget(self.materialGroup)
+        layout.addWidget(self.toleranceGroup)
         layout.addWidget(self.flutterGroup)
         layout.addLayout(line)
         self.setLayout(layout)
@@ -292,6 +340,8 @@ class DialogFinFlutter(QDialog):
         self.altitudeInput.textEdited.connect(self.onAltitude)
         self.maxAltitudeCombo.currentTextChanged.connect(self.onMaxAltitude)
         self.altitudeSlider.valueChanged.connect(self.onSlider)
+        for toleranceInput in self._toleranceInputs.values():
+            toleranceInput.valueChanged.connect(self.onTolerance)
         okButton.clicked.connect(self.onOk)
 
         self._setSlider()
@@ -310,42 +360,48 @@ class DialogFinFlutter(QDialog):
         modulus = float(FreeCAD.Units.Quantity(str(self.shearInput.text())))
         maxHeight = int(FreeCAD.Units.Quantity(self.maxAltitudeCombo.currentText()).getValueAs(FreeCAD.Units.Quantity(self._heightUnits())) / 1000)
 
-        x_axis = []
-        flutterSeries = []
-        divergenceSeries = []
-        for i in range(0, maxHeight+1):
-            altitude = i * 1000000.0 # to mm
-            flutter = self._flutter.flutter(altitude, modulus)
-            divergence = self._flutter.divergence(altitude, modulus)
-            # Getting the data
-            x = float(i)
-            x_axis.append(x)
-
-            flutterY = float(flutter[1])
-            if x >= 0:
-                if (flutterY >=0):
-                    flutterSeries.append(flutterY)
-                else:
-                    flutterSeries.append(0)
-
-            divergenceY = float(divergence[1])
-            if x >= 0:
-                if (divergenceY >=0):
-                    divergenceSeries.append(divergenceY)
-                else:
-                    divergenceSeries.append(0)
-
-            if (i == 0):
-                self._yMin = min(flutterY, divergenceY)
-            else:
-                self._yMax = max(flutterY, divergenceY)
+        # Altitudes in thousands of height units, evaluated in a single call
+        x_axis = np.linspace(0.0, maxHeight, round(maxHeight / SERIES_STEP) + 1)
+        flutter, _, divergence = self._flutter.velocities(x_axis * 1000000.0, modulus) # to mm
+
+        flutterSeries = np.maximum(flutter[1], 0)
+        divergenceSeries = np.maximum(divergence[1], 0)
+
+        self._yMin = min(flutter[1][0], divergence[1][0])
+        if maxHeight > 0:
+            self._yMax = max(flutter[1].max(), divergence[1].max())
 
         self._flutterLine.set_data(x_axis, flutterSeries)
         self._divergenceLine.set_data(x_axis, divergenceSeries)
 
+        # Range of flutter velocities expected from variations in material and construction
+        low, high = self._flutterLimits(modulus, maxHeight, x_axis)
+        if self._flutterBand is not None:
+            self._flutterBand.remove()
+        self._flutterBand = self._static_ax.fill_between(x_axis, np.maximum(low, 0), np.maximum(high, 0),
+                                                         color=self._flutterLine.get_color(), alpha=0.2, label="flutter 5-95%")
+        self._static_ax.legend()
+
         self.showSlider() # calls _redraw()
         # self._redraw()
 
+    def _tolerances(self):
+        return {name : toleranceInput.value() / 100.0 for name, toleranceInput in self._toleranceInputs.items()}
+
+    def _flutterLimits(self, modulus, maxHeight, x_axis):
+        """ The 5th and 95th percentile flutter velocities, sampled again only when an input changes """
+        tolerances = self._tolerances()
+        key = (modulus, tuple(sorted(tolerances.items())))
+        if key != self._monteCarloKey:
+            self._monteCarlo = FlutterMonteCarlo(self._flutter, modulus, tolerances)
+            self._monteCarloKey = key
+
+        bandKey = (key, maxHeight)
+        if bandKey != self._bandKey:
+            self._band = self._monteCarlo.percentiles(x_axis * 1000000.0, (5, 95)) # to mm
+            self._bandKey = bandKey
+        return self._band
+
     def _redraw(self):
         # recompute the ax.dataLim
         self._static_ax.relim()
@@ -441,6 +497,9 @@ class DialogFinFlutter(QDialog):
         self._setSeries()
         self.onFlutter(None)
 
+    def onTolerance(self, value):
+        self._setSeries()
+
     def _setSlider(self):
         try:
             max = float(FreeCAD.Units.Quantity(self.maxAltitudeCombo.currentText()).getValueAs(FreeCAD.Units.Quantity(self._heightUnits())))
@@ -40,15 +40,19 @@ from CfdOF.Solve import CfdPhysicsSelection, CfdFluidBoundary, CfdFluidMaterial,
     CfdSolverFoam
 from CfdOF.PostProcess import CfdReportingFunction
 
-from Analyzers.pyatmos import coesa76
-from Analyzers.pyatmos.utils.Const import gamma, R_air
+from Analyzers.AtmosphereTable import getAtmosphereTable
 
 from Rocket.cfd.CFDUtil import caliber, finThickness, createSolid, makeCFDRocket, makeMultiCFDAnalysis, \
-    makeWindTunnel, makeCfdMesh
+    makeWindTunnel, makeCfdMesh, analyticFrontalArea
 from Rocket.cfd.FeatureCFDRocket import calcFrontalArea
 
 from Ui.UIPaths import getUIPath
 
+# Frontal area calculation methods
+AREA_PROJECTED = "Projected"
+AREA_ESTIMATE = "Estimate"
+AREA_ANALYTIC = "Analytic"
+
 class TaskPanelCFD(QtCore.QObject):
 
     def __init__(self, rocket):
@@ -59,6 +63,10 @@ class TaskPanelCFD(QtCore.QObject):
         self.form = FreeCADGui.PySideUic.loadUi(os.path.join(getUIPath(), 'Resources', 'ui', "DialogCFD.ui"))
         self.form.inputAltitude.textEdited.connect(self.onAltitude)
 
+        self.form.comboAreaMethod.addItem(translate('Rocket', "Projected mesh"), AREA_PROJECTED)
+        self.form.comboAreaMethod.addItem(translate('Rocket', "Quick estimate"), AREA_ESTIMATE)
+        self.form.comboAreaMethod.addItem(translate('Rocket', "Analytic"), AREA_ANALYTIC)
+
         FreeCAD.setActiveTransaction("Create Rocket CFD Study")
         self.initialize()
 
@@ -67,6 +75,8 @@ class TaskPanelCFD(QtCore.QObject):
         param = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Rocket/CFD")
         param.SetString("AOAList", self.form.editAOA.toPlainText())
         param.SetInt("NProc", self.form.spinNproc.value())
+        param.SetString("FrontalAreaMethod", self.form.comboAreaMethod.currentData())
+        param.SetBool("FuseSolid", self.form.checkFuseSolid.isChecked())
 
     def transferFrom(self):
         "Transfer from the object to the dialog"
@@ -82,6 +92,12 @@ class TaskPanelCFD(QtCore.QObject):
         nProc = param.GetInt("NProc", nProc)
         self.form.spinNproc.setValue(nProc)
 
+        method = self.form.comboAreaMethod.findData(param.GetString("FrontalAreaMethod", AREA_PROJECTED))
+        self.form.comboAreaMethod.setCurrentIndex(max(method, 0))
+
+        # Fusing the parts into one watertight solid is optional as it can be slow for large rockets
+        self.form.checkFuseSolid.setChecked(param.GetBool("FuseSolid", False))
+
     def getStandardButtons(self):
         return QtGui.QDialogButtonBox.Ok | QtGui.QDialogButtonBox.Close
 
@@ -91,8 +107,11 @@ class TaskPanelCFD(QtCore.QObject):
 
     def initialize(self):
 
-        self._solid = createSolid(self._rocket)
-        self._frontalArea = calcFrontalArea(self._solid)
+        # Restore the settings first so the frontal area is calculated once, using the saved method
+        self.update()
+
+        self._solid = createSolid(self._rocket, fuse=self.form.checkFuseSolid.isChecked())
+        self._frontalArea = self.calcFrontalArea(self._solid, 0.0)
         diameter = caliber(self._rocket)
         thickness = finThickness(self._rocket)
         box = self._solid.BoundBox
@@ -114,8 +133,8 @@ class TaskPanelCFD(QtCore.QObject):
 
         self.form.editAOA.textChanged.connect(self.onAOAChanged)
         self.form.spinRotation.valueChanged.connect(self.onSpinChanged)
-
-        self.update()
+        self.form.comboAreaMethod.currentIndexChanged.connect(self.onAreaMethod)
+        self.form.checkFuseSolid.toggled.connect(self.onFuseSolid)
 
     def onAOAChanged(self):
         """ Calculate the frontal area when the AOA or rotation changes """
@@ -131,9 +150,24 @@ class TaskPanelCFD(QtCore.QObject):
     def AOAChanged(self):
         """ Calculate the frontal area when the AOA or rotation changes """
         solid = self.applyTranslations(self._solid)
-        self._frontalArea = calcFrontalArea(solid)
+        self._frontalArea = self.calcFrontalArea(solid, self._aoa)
         self.form.inputArea.setText(FreeCAD.Units.Quantity("{} mm^2".format(self._frontalArea)).UserString)
 
+    def onAreaMethod(self, index):
+        self.AOAChanged()
+
+    def onFuseSolid(self, checked):
+        self._solid = createSolid(self._rocket, fuse=checked)
+        self.AOAChanged()
+
+    def calcFrontalArea(self, solid, aoa):
+        """ Frontal area of the translated solid using the selected method """
+        method = self.form.comboAreaMethod.currentData()
+        if method == AREA_ANALYTIC and aoa == 0.0:
+            # Roll doesn't change the frontal area at zero angle of attack
+            return analyticFrontalArea(self._rocket)
+        return calcFrontalArea(solid, estimate=(method == AREA_ESTIMATE))
+
     def onSpinChanged(self, value):
         if self._CFDrocket:
             self._CFDrocket._obj.AngleOfRotation = value
@@ -143,16 +177,12 @@ class TaskPanelCFD(QtCore.QObject):
     def atmosphericConditions(self, altitude):
 
         # Get the atmospheric conditions at the specified altitude (convert mm to km)
-        # Uses the coesa76 model which is an extension of US Standard Atmosphere 1976 model to work above 84K
-        atmo = coesa76([altitude / (1000.0 * 1000.0)])
-
-        temp = float(atmo.T[0])
-        pressure = float(atmo.P[0])
-
-        # speed of sound
-        mach = math.sqrt(gamma * R_air * temp)
+        # Uses the coesa76 model which is an extension of US Standard Atmosphere 1976 model to work above 84K,
+        # interpolated from a precomputed table
+        # The speed of sound is returned as mach
+        _, _, pressure, mach, _ = getAtmosphereTable().conditions(altitude / (1000.0 * 1000.0))
 
-        return mach,pressure
+        return float(mach),float(pressure)
 
     def onAltitude(self, value):
         altitude = FreeCAD.Units.Quantity(value).Value
@@ -258,7 +288,7 @@ class TaskPanelCFD(QtCore.QObject):
 
         # Get a blockage ratio of 0.1%
         solid = self.applyTranslations(self._solid, maxAOA=True)
-        frontalArea = calcFrontalArea(solid)
+        frontalArea = self.calcFrontalArea(solid, self._aoa)
         area = (frontalArea) / 0.001
         tunnelDiameter = 2.0 * math.sqrt(area / math.pi)
         return tunnelDiameter, length
@@ -40,6 +40,7 @@ translate = FreeCAD.Qt.translate
 
 from Ui.TaskPanelLocation import TaskPanelLocation
 from Ui.Commands.CmdSketcher import newSketchNoEdit
+from Ui.Widgets.PreviewRedraw import PreviewRedraw
 from Ui.UIPaths import getUIPath
 
 from Ui.Widgets.MaterialTab import MaterialTab
@@ -220,6 +221,7 @@ class TaskPanelFin(QObject):
         super().__init__()
 
         self._obj = obj
+        self._preview = PreviewRedraw(obj)
         self._isAssembly = self._obj.Proxy.isRocketAssembly()
 
         # Used to prevent recursion
@@ -1242,7 +1244,7 @@ class TaskPanelFin(QObject):
             obj = FreeCAD.getDocument(document).getObject(object)
             self._obj.Base = obj
             self._finForm.form.proxyBaseObjectInput.setText(obj.Label)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
 
@@ -1252,7 +1254,7 @@ class TaskPanelFin(QObject):
     def onEffectiveDiameter(self, value):
         try:
             self._obj.Diameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -1263,7 +1265,7 @@ class TaskPanelFin(QObject):
             pitch = FreeCAD.Units.Quantity(self._finForm.form.yRotationInput.text()).Value
             roll = FreeCAD.Units.Quantity(self._finForm.form.xRotationInput.text()).Value
             self._obj.ProxyPlacement.Rotation.setYawPitchRoll(yaw, pitch, roll)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -1273,7 +1275,7 @@ class TaskPanelFin(QObject):
             self._obj.ProxyPlacement.Base.x = FreeCAD.Units.Quantity(self._finForm.form.xOffsetInput.text()).Value
             self._obj.ProxyPlacement.Base.y = FreeCAD.Units.Quantity(self._finForm.form.yOffsetInput.text()).Value
             self._obj.ProxyPlacement.Base.z = FreeCAD.Units.Quantity(self._finForm.form.zOffsetInput.text()).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -1284,7 +1286,7 @@ class TaskPanelFin(QObject):
         self.setEdited()
 
     def onRedraw(self) -> None:
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self._redrawPending = False
 
     def getStandardButtons(self) -> Any:
@@ -1300,6 +1302,7 @@ class TaskPanelFin(QObject):
         self.transferFrom()
 
     def accept(self) -> None:
+        self._preview.cancel()
         self.transferTo()
         FreeCAD.ActiveDocument.commitTransaction()
         FreeCAD.ActiveDocument.recompute()
@@ -1307,6 +1310,7 @@ class TaskPanelFin(QObject):
 
 
     def reject(self) -> None:
+        self._preview.cancel()
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
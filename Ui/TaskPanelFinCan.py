@@ -55,6 +55,7 @@ from Ui.Commands.CmdSketcher import newSketchNoEdit
 from Ui.Widgets.MaterialTab import MaterialTab
 from Ui.Widgets.CommentTab import CommentTab
 from Ui.Widgets.ScalingTab import ScalingTabFins
+from Ui.Widgets.PreviewRedraw import PreviewRedraw
 
 class _FinCanDialog(_FinDialog):
 
@@ -151,6 +152,7 @@ class TaskPanelFinCan(QObject):
         super().__init__()
 
         self._obj = obj
+        self._preview = PreviewRedraw(obj)
         self._isAssembly = self._obj.Proxy.isRocketAssembly()
 
         self._finForm = _FinCanDialog(obj)
@@ -1265,7 +1267,7 @@ class TaskPanelFinCan(QObject):
         self.setEdited()
 
     def onRedraw(self):
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self._redrawPending = False
 
     def getStandardButtons(self):
@@ -1281,6 +1283,7 @@ class TaskPanelFinCan(QObject):
         self.transferFrom()
 
     def accept(self):
+        self._preview.cancel()
         self.transferTo()
         FreeCAD.ActiveDocument.commitTransaction()
         FreeCAD.ActiveDocument.recompute()
@@ -1288,6 +1291,7 @@ class TaskPanelFinCan(QObject):
 
 
     def reject(self):
+        self._preview.cancel()
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
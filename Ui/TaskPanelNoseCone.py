@@ -40,6 +40,7 @@ from Ui.TaskPanelDatabase import TaskPanelDatabase
 from Ui.Widgets.MaterialTab import MaterialTab
 from Ui.Widgets.CommentTab import CommentTab
 from Ui.Widgets.ScalingTab import ScalingTabNose
+from Ui.Widgets.PreviewRedraw import PreviewRedraw
 from Ui.UIPaths import getUIPath
 
 from Rocket.Constants import TYPE_CONE, TYPE_BLUNTED_CONE, TYPE_SPHERICAL, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, \
@@ -136,6 +137,7 @@ class TaskPanelNoseCone:
 
     def __init__(self,obj,mode):
         self._obj = obj
+        self._preview = PreviewRedraw(obj)
         self._isAssembly = self._obj.Proxy.isRocketAssembly()
 
         # Used to prevent recursion
@@ -351,7 +353,7 @@ class TaskPanelNoseCone:
             # print("Nose type set to {}".format(value))
             self._setTypeState()
 
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
             self.setEdited()
 
     def _setStyleState(self):
@@ -407,7 +409,7 @@ class TaskPanelNoseCone:
         self._obj.NoseStyle = value
         self._setStyleState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
 
     def _setCapStyleState(self):
         value = self._obj.CapStyle
@@ -420,13 +422,13 @@ class TaskPanelNoseCone:
         self._obj.CapStyle = value
         self._setCapStyleState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onBarWidthChanged(self, value):
         try:
             self._obj.CapBarWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -434,7 +436,7 @@ class TaskPanelNoseCone:
     def onLength(self, value):
         try:
             self._obj.Proxy.setLength(FreeCAD.Units.Quantity(value).Value)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -443,7 +445,7 @@ class TaskPanelNoseCone:
         try:
             self._obj.Proxy.setAftDiameter(FreeCAD.Units.Quantity(value).Value)
             self._obj.Proxy.setAftDiameterAutomatic(False)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
 
             self._setLengthState() # Update for spherical noses
         except ValueError:
@@ -468,26 +470,26 @@ class TaskPanelNoseCone:
         self._obj.Proxy.setAftDiameterAutomatic(value)
         self._setAutoDiameterState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onThickness(self, value):
         try:
             self._obj.Proxy.setThickness(FreeCAD.Units.Quantity(value).Value)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
 
     def onCoefficient(self, value):
         self._obj.Coefficient = _toFloat(value)
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onBlunted(self, value):
         try:
             self._obj.BluntedDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -495,7 +497,7 @@ class TaskPanelNoseCone:
     def onOgiveDiameter(self, value):
         try:
             self._obj.OgiveDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -521,14 +523,14 @@ class TaskPanelNoseCone:
         self._obj.Shoulder = self._noseForm.form.shoulderGroup.isChecked()
         self._setShoulderState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onShoulderDiameter(self, value):
         try:
             self._obj.ShoulderDiameter = FreeCAD.Units.Quantity(value).Value
             self._obj.Proxy.setAftShoulderDiameterAutomatic(False)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -548,13 +550,13 @@ class TaskPanelNoseCone:
         self._obj.Proxy.setAftShoulderDiameterAutomatic(value)
         self._setAutoShoulderDiameterState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onShoulderLength(self, value):
         try:
             self._obj.ShoulderLength = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -562,7 +564,7 @@ class TaskPanelNoseCone:
     def onShoulderThickness(self, value):
         try:
             self._obj.ShoulderThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -588,7 +590,7 @@ class TaskPanelNoseCone:
             _err(translate('Rocket', "Unable to find material '{}'").format(result["uuid"]))
 
         self.update()
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onSelect(self):
@@ -621,7 +623,7 @@ class TaskPanelNoseCone:
             obj = FreeCAD.getDocument(document).getObject(object)
             self._obj.Base = obj
             self._noseForm.form.proxyBaseObjectInput.setText(obj.Label)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
 
@@ -631,7 +633,7 @@ class TaskPanelNoseCone:
     def onEffectiveDiameter(self, value):
         try:
             self._obj.Diameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -642,7 +644,7 @@ class TaskPanelNoseCone:
             pitch = FreeCAD.Units.Quantity(self._noseForm.form.yRotationInput.text()).Value
             roll = FreeCAD.Units.Quantity(self._noseForm.form.xRotationInput.text()).Value
             self._obj.ProxyPlacement.Rotation.setYawPitchRoll(yaw, pitch, roll)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -650,7 +652,7 @@ class TaskPanelNoseCone:
     def onOffset(self, value):
         try:
             self._obj.ProxyPlacement.Base.x = FreeCAD.Units.Quantity(self._noseForm.form.offsetInput.text()).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -661,13 +663,14 @@ class TaskPanelNoseCone:
     def clicked(self,button):
         if button == QtGui.QDialogButtonBox.Apply:
             self.transferTo()
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
 
     def update(self):
         'fills the widgets'
         self.transferFrom()
 
     def accept(self):
+        self._preview.cancel()
         self.transferTo()
         FreeCAD.ActiveDocument.commitTransaction()
         FreeCAD.ActiveDocument.recompute()
@@ -675,6 +678,7 @@ class TaskPanelNoseCone:
 
 
     def reject(self):
+        self._preview.cancel()
         FreeCAD.ActiveDocument.abortTransaction()
         self.setEdited()
         FreeCAD.ActiveDocument.recompute()
@@ -39,6 +39,7 @@ from Ui.TaskPanelDatabase import TaskPanelDatabase
 from Ui.Widgets.MaterialTab import MaterialTab
 from Ui.Widgets.CommentTab import CommentTab
 from Ui.Widgets.ScalingTab import ScalingTabTransition
+from Ui.Widgets.PreviewRedraw import PreviewRedraw
 from Ui.UIPaths import getUIPath
 
 from Rocket.Constants import TYPE_CONE, TYPE_ELLIPTICAL, TYPE_HAACK, TYPE_OGIVE, TYPE_VON_KARMAN, \
@@ -140,6 +141,7 @@ class TaskPanelTransition:
 
     def __init__(self,obj,mode):
         self._obj = obj
+        self._preview = PreviewRedraw(obj)
         self._isAssembly = self._obj.Proxy.isRocketAssembly()
 
         # Used to prevent recursion
@@ -393,7 +395,7 @@ class TaskPanelTransition:
             self._showTransitionType()
             self._showClippable()
 
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
             self.setEdited()
 
     def _showTransitionStyle(self):
@@ -455,19 +457,19 @@ class TaskPanelTransition:
         self._obj.TransitionStyle = value
 
         self._showTransitionStyle()
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onForeCapStyle(self, value):
         self._obj.ForeCapStyle = value
         self._setForeCapStyleState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
 
     def onForeBarWidth(self, value):
         try:
             self._obj.ForeCapBarWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
 
@@ -475,19 +477,19 @@ class TaskPanelTransition:
         self._obj.AftCapStyle = value
         self._setAftCapStyleState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
 
     def onAftBarWidth(self, value):
         try:
             self._obj.AftCapBarWidth = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
 
     def onLength(self, value):
         try:
             self._obj.Length = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -495,7 +497,7 @@ class TaskPanelTransition:
     def onForeDiameter(self, value):
         try:
             self._obj.ForeDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -518,13 +520,13 @@ class TaskPanelTransition:
         self._obj.ForeAutoDiameter = self._tranForm.form.foreAutoDiameterCheckbox.isChecked()
         self._setForeAutoDiameterState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onAftDiameter(self, value):
         try:
             self._obj.AftDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -547,13 +549,13 @@ class TaskPanelTransition:
         self._obj.AftAutoDiameter = self._tranForm.form.aftAutoDiameterCheckbox.isChecked()
         self._setAftAutoDiameterState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onCoreDiameter(self, value):
         try:
             self._obj.CoreDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -561,19 +563,19 @@ class TaskPanelTransition:
     def onThickness(self, value):
         try:
             self._obj.Thickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
 
     def onCoefficient(self, value):
         self._obj.Coefficient = _toFloat(value)
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onClipped(self, value):
         self._obj.Clipped = self._tranForm.form.clippedCheckbox.isChecked()
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onForeShoulder(self, value):
@@ -592,13 +594,13 @@ class TaskPanelTransition:
             self._tranForm.form.foreShoulderLengthInput.setEnabled(False)
             self._tranForm.form.foreShoulderThicknessInput.setEnabled(False)
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onForeShoulderDiameter(self, value):
         try:
             self._obj.ForeShoulderDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -621,13 +623,13 @@ class TaskPanelTransition:
         self._obj.ForeShoulderAutoDiameter = self._tranForm.form.foreShoulderAutoDiameterCheckbox.isChecked()
         self._setForeShoulderAutoDiameterState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onForeShoulderLength(self, value):
         try:
             self._obj.ForeShoulderLength = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -635,7 +637,7 @@ class TaskPanelTransition:
     def onForeShoulderThickness(self, value):
         try:
             self._obj.ForeShoulderThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -656,13 +658,13 @@ class TaskPanelTransition:
             self._tranForm.form.aftShoulderLengthInput.setEnabled(False)
             self._tranForm.form.aftShoulderThicknessInput.setEnabled(False)
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onAftShoulderDiameter(self, value):
         try:
             self._obj.AftShoulderDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -685,13 +687,13 @@ class TaskPanelTransition:
         self._obj.AftShoulderAutoDiameter = self._tranForm.form.aftShoulderAutoDiameterCheckbox.isChecked()
         self._setAftShoulderAutoDiameterState()
 
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onAftShoulderLength(self, value):
         try:
             self._obj.AftShoulderLength = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -699,7 +701,7 @@ class TaskPanelTransition:
     def onAftShoulderThickness(self, value):
         try:
             self._obj.AftShoulderThickness = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -732,7 +734,7 @@ class TaskPanelTransition:
         self._obj.AftShoulder = (self._obj.AftShoulderDiameter > 0.0) and (self._obj.AftShoulderLength >= 0)
 
         self.update()
-        self._obj.Proxy.execute(self._obj)
+        self._preview.execute()
         self.setEdited()
 
     def onSelect(self):
@@ -765,7 +767,7 @@ class TaskPanelTransition:
             obj = FreeCAD.getDocument(document).getObject(object)
             self._obj.Base = obj
             self._tranForm.form.proxyBaseObjectInput.setText(obj.Label)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
 
@@ -775,7 +777,7 @@ class TaskPanelTransition:
     def onForeEffectiveDiameter(self, value):
         try:
             self._obj.ForeDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -783,7 +785,7 @@ class TaskPanelTransition:
     def onAftEffectiveDiameter(self, value):
         try:
             self._obj.AftDiameter = FreeCAD.Units.Quantity(value).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -794,7 +796,7 @@ class TaskPanelTransition:
             pitch = FreeCAD.Units.Quantity(self._tranForm.form.yRotationInput.text()).Value
             roll = FreeCAD.Units.Quantity(self._tranForm.form.xRotationInput.text()).Value
             self._obj.ProxyPlacement.Rotation.setYawPitchRoll(yaw, pitch, roll)
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -802,7 +804,7 @@ class TaskPanelTransition:
     def onForeOffset(self, value):
         try:
             self._obj.ProxyPlacement.Base.x = FreeCAD.Units.Quantity(self._tranForm.form.foreOffsetInput.text()).Value
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -810,7 +812,7 @@ class TaskPanelTransition:
     def onAftOffset(self, value):
         try:
             self._obj.ProxyAftOffset = FreeCAD.Units.Quantity(self._tranForm.form.aftOffsetInput.text())
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
         except ValueError:
             pass
         self.setEdited()
@@ -821,13 +823,14 @@ class TaskPanelTransition:
     def clicked(self,button):
         if button == QtGui.QDialogButtonBox.Apply:
             self.transferTo()
-            self._obj.Proxy.execute(self._obj)
+            self._preview.execute()
 
     def update(self):
         'fills the widgets'
         self.transferFrom()
 
     def accept(self):
+        self._preview.cancel()
         self.transferTo()
         FreeCAD.ActiveDocument.commitTransaction()
         FreeCAD.ActiveDocument.recompute()
@@ -835,6 +838,7 @@ class TaskPanelTransition:
 
 
     def reject(self):
+        self._preview.cancel()
         FreeCAD.ActiveDocument.abortTransaction()
         FreeCAD.ActiveDocument.recompute()
         FreeCADGui.ActiveDocument.resetEdit()
@@ -0,0 +1,73 @@
+# ***************************************************************************
+# *   Copyright (c) 2025 David Carter <dcarter@davidcarter.ca>              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+"""Class for redrawing preview shapes during edits"""
+
+__title__ = "FreeCAD Preview Redraw"
+__author__ = "David Carter"
+__url__ = "https://www.davesrocketshop.com"
+
+from typing import Any
+
+from PySide import QtCore
+from PySide.QtCore import QObject
+
+from Rocket.LevelOfDetail import PreviewBuild
+
+# Delay in ms after the last edit before the full detail shape is drawn
+FULL_BUILD_DELAY = 1000
+
+class PreviewRedraw(QObject):
+    """
+        Draws low detail previews while a task panel is being edited. The full detail
+        shape is drawn once edits have paused, or when the panel is closed.
+    """
+    def __init__(self, obj : Any) -> None:
+        super().__init__()
+
+        self._obj = obj
+        self._isPreview = False
+
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(FULL_BUILD_DELAY)
+        self._timer.timeout.connect(self.onFullBuild)
+
+    def execute(self) -> None:
+        with PreviewBuild(self._obj) as preview:
+            self._obj.Proxy.execute(self._obj)
+            self._isPreview = preview.isActive()
+
+        if self._isPreview:
+            self._timer.start()
+
+    def onFullBuild(self) -> None:
+        self._timer.stop()
+        if self._isPreview:
+            self._isPreview = False
+            try:
+                self._obj.Proxy.execute(self._obj)
+            except ReferenceError:
+                # Object may be deleted
+                pass
+
+    def cancel(self) -> None:
+        self._timer.stop()
+        self._isPreview = False